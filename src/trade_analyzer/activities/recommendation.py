@@ -85,7 +85,7 @@ Typical Use:
 Expected Output: 3-7 recommendation cards per week
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 from temporalio import activity
 
@@ -218,22 +218,49 @@ async def generate_recommendation_templates(
         List of recommendation template dicts.
     """
     from trade_analyzer.templates.trade_setup import (
+        card_timestamps,
         generate_recommendation_card,
+        generate_recommendation_cards,
         generate_text_template,
     )
 
     templates = []
 
-    for pos in positions:
+    # Build all cards in one vectorized pass. If the batch rejects a
+    # position (e.g. a non-numeric score), build them one at a time so only
+    # the offending card is skipped.
+    try:
+        cards = generate_recommendation_cards(
+            positions,
+            portfolio_value=portfolio_value,
+            market_regime=market_regime,
+            regime_confidence=regime_confidence,
+        )
+    except (TypeError, ValueError) as e:
+        activity.logger.warning(
+            f"Batch card generation failed, falling back to per-position: {e}"
+        )
+        cards = []
+        week_display, generated_at = card_timestamps()
+        for pos in positions:
+            try:
+                cards.append(
+                    generate_recommendation_card(
+                        pos,
+                        portfolio_value=portfolio_value,
+                        market_regime=market_regime,
+                        regime_confidence=regime_confidence,
+                        week_display=week_display,
+                        generated_at=generated_at,
+                    )
+                )
+            except Exception as e:
+                activity.logger.warning(
+                    f"Error generating template for {pos.get('symbol')}: {e}"
+                )
+
+    for card in cards:
         try:
-            # Generate template
-            card = generate_recommendation_card(
-                pos,
-                portfolio_value=portfolio_value,
-                market_regime=market_regime,
-                regime_confidence=regime_confidence,
-            )
-
             # Generate text version
             text = generate_text_template(card)
 
@@ -289,7 +316,7 @@ async def generate_recommendation_templates(
 
         except Exception as e:
             activity.logger.warning(
-                f"Error generating template for {pos.get('symbol')}: {e}"
+                f"Error generating template for {card.symbol}: {e}"
             )
 
     activity.logger.info(f"Generated {len(templates)} recommendation templates")
@@ -319,10 +346,8 @@ async def save_weekly_recommendation(
     collection = db["weekly_recommendations"]
 
     # Calculate week boundaries
-    today = datetime.utcnow()
-    days_since_monday = today.weekday()
-    week_start = today - timedelta(days=days_since_monday)
-    week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    today = datetime.utcnow().date()
+    week_start = datetime.combine(today - timedelta(days=today.weekday()), time.min)
     week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
 
     # Calculate totals
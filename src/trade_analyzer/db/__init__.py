@@ -66,10 +66,12 @@ from trade_analyzer.db.models import (
     SystemHealthDoc,
 )
 from trade_analyzer.db.repositories import (
+    AsyncRepository,
     StockRepository,
     TradeSetupRepository,
     TradeRepository,
     RegimeRepository,
+    TradeRow,
 )
 
 __all__ = [
@@ -83,8 +85,10 @@ __all__ = [
     "TradeDoc",
     "SystemHealthDoc",
     # Repositories
+    "AsyncRepository",
     "StockRepository",
     "TradeSetupRepository",
     "TradeRepository",
     "RegimeRepository",
+    "TradeRow",
 ]
@@ -27,6 +27,7 @@ Collections Managed:
 10. monday_premarket - Pre-market analysis for trade execution
 11. friday_summaries - End-of-week performance summaries
 12. weekly_recommendations - Actionable trade recommendations
+13. workflow_runs - Result summaries of workflow runs started from the UI
 
 Index Strategy:
 --------------
@@ -199,6 +200,21 @@ class MongoDBConnection:
         self._database.trade_setups.create_index("created_at")  # Time-based queries
         self._database.trade_setups.create_index("setup_type")  # Filter by type
         self._database.trade_setups.create_index([("week_start", 1), ("status", 1)])  # Weekly view
+        self._database.trade_setups.create_index(
+            [("status", 1), ("composite_score", -1)]
+        )  # Active setups by score (hinted by TradeSetupRepository)
+        self._database.trade_setups.create_index(
+            [("week_start", 1), ("composite_score", -1)]
+        )  # Weekly setups by score (hinted by TradeSetupRepository)
+        self._database.trade_setups.create_index([("qualifies", 1), ("status", 1)])  # Qualified count
+        self._database.trade_setups.create_index([("detected_at", -1)])  # Latest detection run
+        # Dashboard keyset pagination by rank, optionally filtered by setup
+        # type; partial so only the listed (qualified, active) setups are indexed
+        for keys in ([("rank", 1), ("_id", 1)], [("type", 1), ("rank", 1), ("_id", 1)]):
+            self._database.trade_setups.create_index(
+                keys,
+                partialFilterExpression={"qualifies": True, "status": "active"},
+            )
 
         # =====================================================================
         # TRADES COLLECTION
@@ -208,6 +224,17 @@ class MongoDBConnection:
         self._database.trades.create_index("entry_date")  # Date filtering
         self._database.trades.create_index("status")  # Active/closed
         self._database.trades.create_index([("entry_date", -1)])  # Recent trades first
+        self._database.trades.create_index(
+            [("status", 1), ("exit_date", -1)]
+        )  # Closed trades in a lookback window (performance stats)
+        self._database.trades.create_index(
+            [("exit_date", -1)],
+            name="closed_trades_exit_date",
+            # Only closed trades carry an exit date. $type rather than a
+            # status $in, which partial indexes accept only on MongoDB 6.0+
+            partialFilterExpression={"exit_date": {"$type": "date"}},
+        )  # Closed trades only: small index for archival/lookback scans
+        self._database.trades_archive.create_index([("exit_date", -1)])
 
         # =====================================================================
         # REGIME ASSESSMENTS COLLECTION
@@ -215,6 +242,9 @@ class MongoDBConnection:
         # =====================================================================
         self._database.regime_assessments.create_index("timestamp", unique=True)
         self._database.regime_assessments.create_index([("timestamp", -1)])  # Latest first
+        self._database.regime_assessments.create_index(
+            [("state", 1), ("timestamp", -1)]
+        )  # Latest assessments for a given regime state
 
         # =====================================================================
         # SYSTEM HEALTH COLLECTION
@@ -223,6 +253,38 @@ class MongoDBConnection:
         self._database.system_health.create_index("timestamp")
         self._database.system_health.create_index([("timestamp", -1)])  # Latest first
 
+        # =====================================================================
+        # PHASE 2-4A SCORE COLLECTIONS
+        # Momentum, consistency and liquidity results (dashboard qualified
+        # counts and latest-run lookups)
+        # =====================================================================
+        self._database.momentum_scores.create_index("qualifies")  # Pass/fail filter
+        self._database.momentum_scores.create_index([("calculated_at", -1)])  # Latest run
+        self._database.consistency_scores.create_index("qualifies")  # Pass/fail filter
+        self._database.consistency_scores.create_index([("calculated_at", -1)])  # Latest run
+        self._database.liquidity_scores.create_index("liq_qualifies")  # Pass/fail filter
+        self._database.liquidity_scores.create_index([("calculated_at", -1)])  # Latest run
+        # Dashboard score tables: the paged find filters on the qualifies flag
+        # and sorts by (score desc, _id), so the partial compound serves it as
+        # an IXSCAN with no in-memory sort; the partial symbol index serves the
+        # prefix search. The qualified counts above use the plain flag index.
+        # The symbol index is named explicitly: the momentum and consistency
+        # activities already own a unique "symbol_1" on the same key.
+        for collection, flag, score in (
+            ("momentum_scores", "qualifies", "momentum_score"),
+            ("consistency_scores", "qualifies", "final_score"),
+            ("liquidity_scores", "liq_qualifies", "liquidity_score"),
+        ):
+            self._database[collection].create_index(
+                [(score, -1), ("_id", 1)],
+                partialFilterExpression={flag: True},
+            )
+            self._database[collection].create_index(
+                [("symbol", 1)],
+                name="symbol_qualified",
+                partialFilterExpression={flag: True},
+            )
+
         # =====================================================================
         # FUNDAMENTAL SCORES COLLECTION (Monthly refresh)
         # EPS growth, ROCE, debt ratios, etc.
@@ -230,6 +292,7 @@ class MongoDBConnection:
         self._database.fundamental_scores.create_index([("symbol", 1), ("calculated_at", -1)])
         self._database.fundamental_scores.create_index([("fundamental_score", -1)])  # Top scores
         self._database.fundamental_scores.create_index("qualifies")  # Pass/fail filter
+        self._database.fundamental_scores.create_index([("calculated_at", -1)])  # Latest refresh
 
         # =====================================================================
         # INSTITUTIONAL HOLDINGS COLLECTION (Monthly refresh)
@@ -274,6 +337,12 @@ class MongoDBConnection:
         self._database.weekly_recommendations.create_index("status")  # Draft/approved/expired
         self._database.weekly_recommendations.create_index([("market_regime", 1), ("week_start", -1)])
 
+        # =====================================================================
+        # WORKFLOW RUNS COLLECTION (Dashboard)
+        # Result summaries of workflow runs started from the UI
+        # =====================================================================
+        self._database.workflow_runs.create_index([("kind", 1), ("ts", -1)])  # Latest run per workflow
+
     def disconnect(self) -> None:
         """
         Close MongoDB connection and release resources.
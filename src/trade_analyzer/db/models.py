@@ -69,7 +69,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # =============================================================================
@@ -204,6 +204,12 @@ class StockDoc(BaseModel):
         default=None, description="When fundamental data was last refreshed"
     )
 
+    @field_validator("symbol")
+    @classmethod
+    def _normalize_symbol(cls, value: str) -> str:
+        """Store symbols uppercase so lookups are plain equality matches."""
+        return value.strip().upper()
+
     class Config:
         use_enum_values = True
 
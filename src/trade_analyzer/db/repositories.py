@@ -83,7 +83,8 @@ instances per thread/activity, but share the same Database connection:
     # Thread 2
     stock_repo_2 = StockRepository(db)
 
-    # Both use the same connection pool safely
+    # Both use the same connection pool safely, and share a single
+    # cached Collection handle per (database, collection name)
 
 Notes
 -----
@@ -93,11 +94,26 @@ Notes
 - Soft deletes via `is_active` flag (stocks never physically deleted)
 """
 
-from datetime import datetime
-from typing import Optional
-
+import asyncio
+import copy
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Union
+
+import numpy as np
 from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
 
 from trade_analyzer.db.models import (
     RegimeAssessmentDoc,
@@ -109,6 +125,305 @@ from trade_analyzer.db.models import (
     TradeStatus,
 )
 
+# Collection handles keyed by (id(db), collection_name). PyMongo collections are
+# thread-safe, so every repository instance on the same Database shares one handle
+# instead of re-resolving it through Database.__getitem__.
+_COLLECTION_CACHE: dict[tuple[int, str], Collection] = {}
+
+
+def _get_collection(db: Database, collection_name: str) -> Collection:
+    """Return the cached collection handle for a database, creating it once.
+
+    Args
+    ----
+    db : pymongo.database.Database
+        MongoDB database instance.
+    collection_name : str
+        Name of the MongoDB collection to access.
+
+    Returns
+    -------
+    pymongo.collection.Collection
+        Shared collection handle.
+    """
+    key = (id(db), collection_name)
+    collection = _COLLECTION_CACHE.get(key)
+    if collection is None or collection.database is not db:
+        collection = db[collection_name]
+        _COLLECTION_CACHE[key] = collection
+    return collection
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_oid(value: str) -> ObjectId:
+    """Parse a hex string into an ObjectId, memoized (ObjectIds are immutable)."""
+    return ObjectId(value)
+
+
+def _oid(value: Union[str, ObjectId]) -> ObjectId:
+    """Return an ObjectId, parsing only when given a hex string.
+
+    Hex strings go through a bounded LRU cache, so IDs that monitoring loops
+    touch repeatedly are parsed once.
+
+    Args
+    ----
+    value : str or ObjectId
+        Document ID as a 24-char hex string or an already-parsed ObjectId.
+
+    Returns
+    -------
+    ObjectId
+        Parsed ObjectId (the same object if one was passed in).
+    """
+    return value if isinstance(value, ObjectId) else _parse_oid(value)
+
+
+def _id_str(value) -> str:
+    """Convert a document `_id` to its string form.
+
+    ObjectIds are hexed straight from their 12-byte binary (one C call)
+    rather than through ObjectId.__str__; other `_id` types fall back to str().
+    """
+    return value.binary.hex() if type(value) is ObjectId else str(value)
+
+
+_RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+
+# Status values used in hot query filters, resolved from the enums once.
+_ACTIVE_SETUP = sys.intern(SetupStatus.ACTIVE.value)
+_ACTIVE_TRADE = sys.intern(TradeStatus.ACTIVE.value)
+_CLOSED_WIN = sys.intern(TradeStatus.CLOSED_WIN.value)
+_CLOSED_LOSS = sys.intern(TradeStatus.CLOSED_loss.value)
+_CLOSED_STATES = [_CLOSED_WIN, _CLOSED_LOSS]
+
+_MS_PER_DAY = 24 * 60 * 60 * 1000
+_SECONDS_PER_DAY = 24 * 60 * 60
+_UNIX_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+def _utc_today_ordinal() -> int:
+    """Return today's UTC date as a proleptic Gregorian ordinal."""
+    return _UNIX_EPOCH_ORDINAL + int(time.time()) // _SECONDS_PER_DAY
+
+
+@functools.lru_cache(maxsize=8)
+def _lookback_cutoff(today_ordinal: int, days: int) -> datetime:
+    """Return UTC midnight `days` before the given day.
+
+    Cached per (day, lookback) so repeated stats calls on the same UTC day
+    reuse one datetime; the cache rolls over naturally at UTC midnight.
+    """
+    return datetime.fromordinal(today_ordinal) - timedelta(days=days)
+
+
+_PNL_PER_SHARE = {"$subtract": ["$exit_price", "$entry_price"]}
+_RISK_PER_SHARE = {"$subtract": ["$entry_price", "$stop_loss"]}
+
+# Constant stages of the close-trade pipeline. They read the exit fields set
+# by the per-call first stage, so they are built once and shared by every
+# close_trade/close_trades_bulk call (the driver only reads them to encode).
+_CLOSE_DERIVED_STAGE = {
+    "$set": {
+        "pnl": {"$multiply": [_PNL_PER_SHARE, "$shares"]},
+        "pnl_percent": {
+            "$multiply": [{"$divide": [_PNL_PER_SHARE, "$entry_price"]}, 100]
+        },
+        "r_multiple": {
+            "$cond": [
+                {"$ne": [_RISK_PER_SHARE, 0]},
+                {"$divide": [_PNL_PER_SHARE, _RISK_PER_SHARE]},
+                0,
+            ]
+        },
+        "holding_days": {
+            "$toInt": {
+                "$floor": {
+                    "$divide": [
+                        {
+                            "$subtract": [
+                                "$exit_date",
+                                {"$ifNull": ["$entry_date", "$$NOW"]},
+                            ]
+                        },
+                        _MS_PER_DAY,
+                    ]
+                }
+            }
+        },
+    }
+}
+_CLOSE_STATUS_STAGE = {
+    "$set": {
+        "status": {"$cond": [{"$gt": ["$pnl", 0]}, _CLOSED_WIN, _CLOSED_LOSS]}
+    }
+}
+
+
+def _close_trade_pipeline(
+    exit_price: float, exit_date: datetime, exit_reason: str
+) -> list[dict]:
+    """Build the update pipeline that closes a trade server-side.
+
+    Derived fields are computed from the stored entry_price, stop_loss,
+    shares and entry_date, so closing a trade needs no prior read. Only the
+    first stage depends on the arguments; the derived-field and status
+    stages are shared module constants.
+
+    Args
+    ----
+    exit_price : float
+        Price at which position was exited.
+    exit_date : datetime
+        Date/time of exit.
+    exit_reason : str
+        Reason for exit.
+
+    Returns
+    -------
+    list[dict]
+        Aggregation-pipeline update (MongoDB 4.2+).
+    """
+    return [
+        {
+            "$set": {
+                "exit_price": exit_price,
+                "exit_date": exit_date,
+                "exit_reason": {"$literal": exit_reason},
+                "updated_at": "$$NOW",
+            }
+        },
+        _CLOSE_DERIVED_STAGE,
+        _CLOSE_STATUS_STAGE,
+    ]
+
+
+class _IdCache:
+    """Bounded LRU cache of documents keyed by string document ID.
+
+    Used by repositories whose documents are re-fetched by ID in monitoring
+    loops. Mutating repository methods must call `pop`/`clear` so cached
+    documents never outlive a write made through the same repository.
+    Documents are deep-copied on `get` and `put`, so callers may mutate
+    the nested fields of a result without changing the cached entry.
+    Operations are serialized with a lock because AsyncRepository runs
+    repository methods concurrently in worker threads.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            doc = self._data.get(key)
+            if doc is None:
+                return None
+            self._data.move_to_end(key)
+        return copy.deepcopy(doc)
+
+    def put(self, key: str, doc: dict) -> None:
+        doc = copy.deepcopy(doc)
+        with self._lock:
+            self._data[key] = doc
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Union[str, ObjectId]) -> None:
+        with self._lock:
+            self._data.pop(str(key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+@dataclass(slots=True)
+class TradeRow:
+    """Compact, slotted view of a trade for monitoring loops.
+
+    Carries only the fields needed for risk and P&L checks. Built directly
+    from a projected MongoDB document, so callers iterating many trades hold
+    one small object per trade instead of a full document dict.
+
+    Attributes:
+        id: Trade document ID as a string
+        symbol: NSE symbol
+        status: Trade status value
+        entry_price: Entry price per share
+        stop_loss: Current stop loss
+        shares: Position size in shares
+        pnl: Realized P&L (None while active)
+        r_multiple: Realized R-multiple (None while active)
+    """
+
+    id: str
+    symbol: str
+    status: str
+    entry_price: float
+    stop_loss: float
+    shares: int
+    pnl: Optional[float] = None
+    r_multiple: Optional[float] = None
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "TradeRow":
+        """Build a row from a document projected with TRADE_ROW_PROJECTION."""
+        return cls(
+            _id_str(doc["_id"]),
+            doc["symbol"],
+            doc["status"],
+            doc["entry_price"],
+            doc["stop_loss"],
+            doc["shares"],
+            doc.get("pnl"),
+            doc.get("r_multiple"),
+        )
+
+
+TRADE_ROW_PROJECTION = {f.name: 1 for f in fields(TradeRow) if f.name != "id"}
+
+
+def _performance_summary(
+    wins: int,
+    losses: int,
+    sum_win_r: float,
+    sum_loss_r: float,
+    total_pnl: float,
+) -> dict:
+    """Build the get_performance_stats() result from per-bucket totals."""
+    total_trades = wins + losses
+    if not total_trades:
+        return {
+            "total_trades": 0,
+            "wins": 0,
+            "losses": 0,
+            "win_rate": 0.0,
+            "avg_win_r": 0.0,
+            "avg_loss_r": 0.0,
+            "expectancy": 0.0,
+            "total_pnl": 0.0,
+        }
+
+    win_rate = wins / total_trades
+    avg_win_r = sum_win_r / wins if wins else 0
+    avg_loss_r = sum_loss_r / losses if losses else 0
+    expectancy = (win_rate * avg_win_r) + ((1 - win_rate) * avg_loss_r)
+
+    return {
+        "total_trades": total_trades,
+        "wins": wins,
+        "losses": losses,
+        "win_rate": win_rate,
+        "avg_win_r": avg_win_r,
+        "avg_loss_r": avg_loss_r,
+        "expectancy": expectancy,
+        "total_pnl": total_pnl,
+    }
+
 
 class BaseRepository:
     """Base repository with common operations.
@@ -127,6 +442,9 @@ class BaseRepository:
     - All ID conversions happen transparently in _to_doc and _from_doc
     """
 
+    # Cursor batch size for unbounded scans (PyMongo's first batch is 101 docs).
+    BATCH_SIZE = 1000
+
     def __init__(self, db: Database, collection_name: str):
         """Initialize repository with database connection.
 
@@ -136,8 +454,57 @@ class BaseRepository:
             MongoDB database instance.
         collection_name : str
             Name of the MongoDB collection to access.
+
+        Notes
+        -----
+        The collection handle is shared across repository instances created
+        on the same Database (see `_get_collection`).
+        """
+        self.collection = _get_collection(db, collection_name)
+
+    @property
+    def raw_collection(self) -> Collection:
+        """Collection view that returns undecoded RawBSONDocument results.
+
+        Use for read-only paths that serialize documents straight back out
+        (e.g. `bson.json_util.dumps`) and never touch individual fields, so
+        the BSON -> dict decode is skipped.
+
+        Returns
+        -------
+        pymongo.collection.Collection
+            Same collection configured with RawBSONDocument as document_class.
+        """
+        return self.collection.with_options(codec_options=_RAW_CODEC_OPTIONS)
+
+    def explain(self, query: dict, sort: Optional[list] = None, hint=None) -> dict:
+        """Run a find through the planner and return executionStats.
+
+        Debug helper for verifying that a query shape uses the intended
+        index (look at `queryPlanner.winningPlan` / `executionStats`).
+
+        Args
+        ----
+        query : dict
+            Filter document.
+        sort : list, optional
+            Sort specification as a list of (field, direction) pairs.
+        hint : list or str, optional
+            Index to force, as passed to `Cursor.hint`.
+
+        Returns
+        -------
+        dict
+            Output of the `explain` command at executionStats verbosity.
         """
-        self.collection = db[collection_name]
+        find_cmd = {"find": self.collection.name, "filter": query}
+        if sort:
+            find_cmd["sort"] = dict(sort)
+        if hint is not None:
+            find_cmd["hint"] = dict(hint) if isinstance(hint, list) else hint
+        return self.collection.database.command(
+            {"explain": find_cmd, "verbosity": "executionStats"}
+        )
 
     def _to_doc(self, data: dict) -> dict:
         """Convert model dict to MongoDB document.
@@ -175,7 +542,7 @@ class BaseRepository:
             Document with string id field instead of ObjectId _id.
         """
         if doc and "_id" in doc:
-            doc["id"] = str(doc.pop("_id"))
+            doc["id"] = _id_str(doc.pop("_id"))
         return doc
 
 
@@ -299,13 +666,20 @@ class StockRepository(BaseRepository):
         Args
         ----
         symbol : str
-            Stock symbol (e.g., "RELIANCE", "TCS"). Case-insensitive.
+            Stock symbol in canonical uppercase form (e.g., "RELIANCE", "TCS").
 
         Returns
         -------
         dict or None
             Stock document dict with id field, or None if not found.
 
+        Notes
+        -----
+        StockDoc normalizes `symbol` to uppercase on construction, so stored
+        symbols are always uppercase and this is a plain equality lookup on
+        the unique `symbol` index. Callers holding user input should
+        uppercase it once at the boundary.
+
         Example
         -------
             stock = repo.get_by_symbol("RELIANCE")
@@ -314,7 +688,7 @@ class StockRepository(BaseRepository):
             else:
                 print("Stock not found")
         """
-        doc = self.collection.find_one({"symbol": symbol.upper()})
+        doc = self.collection.find_one({"symbol": symbol})
         return self._from_doc(doc) if doc else None
 
     def get_all_active(self) -> list[dict]:
@@ -333,8 +707,19 @@ class StockRepository(BaseRepository):
             active_stocks = repo.get_all_active()
             print(f"Active universe size: {len(active_stocks)}")
         """
-        docs = self.collection.find({"is_active": True})
-        return [self._from_doc(doc) for doc in docs]
+        return list(self.iter_all_active())
+
+    def iter_all_active(self) -> Iterator[dict]:
+        """Stream active stocks without materializing the full list.
+
+        Yields
+        ------
+        dict
+            Active stock documents, fetched in BATCH_SIZE batches.
+        """
+        docs = self.collection.find({"is_active": True}).batch_size(self.BATCH_SIZE)
+        for doc in docs:
+            yield self._from_doc(doc)
 
     def get_by_sector(self, sector: str) -> list[dict]:
         """Get active stocks by sector.
@@ -359,8 +744,26 @@ class StockRepository(BaseRepository):
             if len(it_stocks) >= 3:
                 print("Already have 3 IT stocks, skip new IT setups")
         """
-        docs = self.collection.find({"sector": sector, "is_active": True})
-        return [self._from_doc(doc) for doc in docs]
+        return list(self.iter_by_sector(sector))
+
+    def iter_by_sector(self, sector: str) -> Iterator[dict]:
+        """Stream active stocks in a sector.
+
+        Args
+        ----
+        sector : str
+            Sector name.
+
+        Yields
+        ------
+        dict
+            Active stock documents in the sector.
+        """
+        docs = self.collection.find({"sector": sector, "is_active": True}).batch_size(
+            self.BATCH_SIZE
+        )
+        for doc in docs:
+            yield self._from_doc(doc)
 
     def get_universe(
         self, min_market_cap: float = 1000, min_turnover: float = 5
@@ -410,14 +813,42 @@ class StockRepository(BaseRepository):
             )
             print(f"Conservative universe: {len(universe_conservative)} stocks")
         """
+        return list(self.iter_universe(min_market_cap, min_turnover))
+
+    def iter_universe(
+        self, min_market_cap: float = 1000, min_turnover: float = 5
+    ) -> Iterator[dict]:
+        """Stream the filtered stock universe.
+
+        Same filter as get_universe(), for callers that process stocks one at
+        a time and do not need the whole universe in memory.
+
+        Args
+        ----
+        min_market_cap : float, optional
+            Minimum market cap in crores (default: 1000).
+        min_turnover : float, optional
+            Minimum average daily turnover in crores (default: 5).
+
+        Yields
+        ------
+        dict
+            Stock documents meeting filter criteria.
+
+        Example
+        -------
+            for stock in repo.iter_universe():
+                score_momentum(stock)
+        """
         docs = self.collection.find(
             {
                 "is_active": True,
                 "market_cap": {"$gte": min_market_cap},
                 "avg_daily_turnover": {"$gte": min_turnover},
             }
-        )
-        return [self._from_doc(doc) for doc in docs]
+        ).batch_size(self.BATCH_SIZE)
+        for doc in docs:
+            yield self._from_doc(doc)
 
 
 class TradeSetupRepository(BaseRepository):
@@ -433,9 +864,9 @@ class TradeSetupRepository(BaseRepository):
     Collection: trade_setups
     -------------------------
     Indexes:
-        - week_start: Query setups by week
-        - status: Filter active vs triggered/invalidated setups
-        - composite_score: Sort by quality ranking
+        - (status, composite_score desc): Active setups ranked by quality
+        - (week_start, composite_score desc): Weekly setups ranked by quality
+        - (week_start, status): Weekly status breakdowns
 
     Setup Lifecycle
     ---------------
@@ -491,12 +922,18 @@ class TradeSetupRepository(BaseRepository):
                 repo.update_status(s["id"], SetupStatus.TRIGGERED)
                 # Create corresponding Trade
 
-        # Review this week's performance
-        this_week = repo.get_by_week(datetime(2025, 12, 15))
-        triggered = [s for s in this_week if s["status"] == "triggered"]
-        print(f"Triggered {len(triggered)} out of {len(this_week)} setups")
+        # Review this week's performance (counted server-side)
+        counts = repo.count_by_status_for_week(datetime(2025, 12, 15))
+        total = sum(counts.values())
+        print(f"Triggered {counts.get('triggered', 0)} out of {total} setups")
     """
 
+    # Compound indexes backing the composite_score sort paths (created in
+    # MongoDBConnection._ensure_indexes). Hinted so the planner cannot fall
+    # back to an in-memory sort under load.
+    STATUS_SCORE_INDEX = [("status", 1), ("composite_score", -1)]
+    WEEK_SCORE_INDEX = [("week_start", 1), ("composite_score", -1)]
+
     def __init__(self, db: Database):
         """Initialize trade setup repository.
 
@@ -506,6 +943,7 @@ class TradeSetupRepository(BaseRepository):
             MongoDB database instance.
         """
         super().__init__(db, "trade_setups")
+        self._id_cache = _IdCache()
 
     def create(self, setup: TradeSetupDoc) -> str:
         """Create a new trade setup.
@@ -539,27 +977,41 @@ class TradeSetupRepository(BaseRepository):
         result = self.collection.insert_one(data)
         return str(result.inserted_id)
 
-    def get_by_id(self, setup_id: str) -> Optional[dict]:
+    def get_by_id(self, setup_id: Union[str, ObjectId]) -> Optional[dict]:
         """Get setup by ID.
 
         Args
         ----
-        setup_id : str
-            MongoDB document ID (string format).
+        setup_id : str or ObjectId
+            MongoDB document ID (string or already-parsed ObjectId).
 
         Returns
         -------
         dict or None
             Setup document dict, or None if not found.
 
+        Notes
+        -----
+        Results are kept in a per-repository LRU cache (1024 entries) that
+        this repository's update methods invalidate. Writes made through a
+        different repository instance are not seen until the entry is evicted.
+
         Example
         -------
             setup = repo.get_by_id("507f1f77bcf86cd799439011")
             if setup:
                 print(f"{setup['symbol']} - {setup['setup_type']}")
         """
-        doc = self.collection.find_one({"_id": ObjectId(setup_id)})
-        return self._from_doc(doc) if doc else None
+        key = str(setup_id)
+        cached = self._id_cache.get(key)
+        if cached is not None:
+            return cached
+        doc = self.collection.find_one({"_id": _oid(setup_id)})
+        if not doc:
+            return None
+        doc = self._from_doc(doc)
+        self._id_cache.put(key, doc)
+        return doc
 
     def get_active_setups(self, week_start: Optional[datetime] = None) -> list[dict]:
         """Get all active setups, optionally for a specific week.
@@ -586,10 +1038,15 @@ class TradeSetupRepository(BaseRepository):
             # Check specific week's active setups
             this_week = repo.get_active_setups(week_start=datetime(2025, 12, 15))
         """
-        query = {"status": SetupStatus.ACTIVE.value}
+        query = {"status": _ACTIVE_SETUP}
         if week_start:
             query["week_start"] = week_start
-        docs = self.collection.find(query).sort("composite_score", -1)
+        docs = (
+            self.collection.find(query)
+            .sort("composite_score", -1)
+            .hint(self.STATUS_SCORE_INDEX)
+            .allow_disk_use(False)
+        )
         return [self._from_doc(doc) for doc in docs]
 
     def get_by_week(self, week_start: datetime) -> list[dict]:
@@ -623,12 +1080,58 @@ class TradeSetupRepository(BaseRepository):
             print(f"  Invalidated: {len(invalidated)}")
             print(f"  Trigger rate: {len(triggered)/len(setups)*100:.1f}%")
         """
-        docs = self.collection.find({"week_start": week_start}).sort(
-            "composite_score", -1
+        docs = (
+            self.collection.find({"week_start": week_start})
+            .sort("composite_score", -1)
+            .hint(self.WEEK_SCORE_INDEX)
+            .allow_disk_use(False)
         )
         return [self._from_doc(doc) for doc in docs]
 
-    def update_status(self, setup_id: str, status: SetupStatus) -> bool:
+    def count_by_week(self, week_start: datetime) -> int:
+        """Count setups for a specific week without fetching them.
+
+        Args
+        ----
+        week_start : datetime
+            Week start date (typically a Monday).
+
+        Returns
+        -------
+        int
+            Number of setups for the week, regardless of status.
+        """
+        return self.collection.count_documents({"week_start": week_start})
+
+    def count_by_status_for_week(self, week_start: datetime) -> dict[str, int]:
+        """Count a week's setups per status in a single aggregation.
+
+        Args
+        ----
+        week_start : datetime
+            Week start date (typically a Monday).
+
+        Returns
+        -------
+        dict[str, int]
+            Mapping of status value to setup count. Statuses with no setups
+            are absent.
+
+        Example
+        -------
+            counts = repo.count_by_status_for_week(datetime(2025, 12, 15))
+            total = sum(counts.values())
+            if total:
+                rate = counts.get("triggered", 0) / total
+                print(f"Trigger rate: {rate*100:.1f}%")
+        """
+        pipeline = [
+            {"$match": {"week_start": week_start}},
+            {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+        ]
+        return {row["_id"]: row["n"] for row in self.collection.aggregate(pipeline)}
+
+    def update_status(self, setup_id: Union[str, ObjectId], status: SetupStatus) -> bool:
         """Update setup status.
 
         Used to transition setup through its lifecycle:
@@ -638,8 +1141,8 @@ class TradeSetupRepository(BaseRepository):
 
         Args
         ----
-        setup_id : str
-            MongoDB document ID (string format).
+        setup_id : str or ObjectId
+            MongoDB document ID (string or already-parsed ObjectId).
         status : SetupStatus
             New status (ACTIVE, TRIGGERED, INVALIDATED, EXPIRED).
 
@@ -664,10 +1167,74 @@ class TradeSetupRepository(BaseRepository):
                 # Create Trade
         """
         result = self.collection.update_one(
-            {"_id": ObjectId(setup_id)}, {"$set": {"status": status.value}}
+            {"_id": _oid(setup_id)}, {"$set": {"status": status.value}}
         )
+        self._id_cache.pop(setup_id)
         return result.modified_count > 0
 
+    def update_status_many(
+        self, setup_ids: list[Union[str, ObjectId]], status: SetupStatus
+    ) -> int:
+        """Update the status of many setups in a single round trip.
+
+        Args
+        ----
+        setup_ids : list[str or ObjectId]
+            MongoDB document IDs of the setups to transition.
+        status : SetupStatus
+            New status applied to every setup.
+
+        Returns
+        -------
+        int
+            Number of setups modified.
+
+        Example
+        -------
+            # Monday morning: invalidate every setup that gapped through its stop
+            gapped = [s["id"] for s in active if opens[s["symbol"]] < s["stop_loss"]]
+            repo.update_status_many(gapped, SetupStatus.INVALIDATED)
+        """
+        if not setup_ids:
+            return 0
+        result = self.collection.update_many(
+            {"_id": {"$in": [_oid(i) for i in setup_ids]}},
+            {"$set": {"status": status.value}},
+        )
+        for setup_id in setup_ids:
+            self._id_cache.pop(setup_id)
+        return result.modified_count
+
+    def bulk_transition(
+        self, transitions: dict[SetupStatus, list[Union[str, ObjectId]]]
+    ) -> int:
+        """Apply several status transitions with one update per target status.
+
+        Issues at most one `update_many` per SetupStatus, regardless of how
+        many setups are transitioned.
+
+        Args
+        ----
+        transitions : dict[SetupStatus, list[str or ObjectId]]
+            Mapping of target status to the setup IDs moving into it.
+
+        Returns
+        -------
+        int
+            Total number of setups modified.
+
+        Example
+        -------
+            repo.bulk_transition({
+                SetupStatus.TRIGGERED: triggered_ids,
+                SetupStatus.INVALIDATED: gapped_ids,
+            })
+        """
+        return sum(
+            self.update_status_many(ids, status)
+            for status, ids in transitions.items()
+        )
+
     def get_recent(self, limit: int = 20) -> list[dict]:
         """Get most recent setups.
 
@@ -692,6 +1259,31 @@ class TradeSetupRepository(BaseRepository):
         docs = self.collection.find().sort("created_at", -1).limit(limit)
         return [self._from_doc(doc) for doc in docs]
 
+    def get_recent_raw(self, limit: int = 20) -> list[RawBSONDocument]:
+        """Get most recent setups as raw BSON, without dict decoding.
+
+        Same query as get_recent(), but documents are returned as
+        RawBSONDocument with `_id` left as-is. Intended for display or
+        export paths that only re-serialize the documents.
+
+        Args
+        ----
+        limit : int, optional
+            Maximum number of setups to return (default: 20).
+
+        Returns
+        -------
+        list[RawBSONDocument]
+            Raw setup documents, sorted by created_at (descending).
+
+        Example
+        -------
+            from bson import json_util
+
+            payload = json_util.dumps(repo.get_recent_raw(limit=10))
+        """
+        return list(self.raw_collection.find().sort("created_at", -1).limit(limit))
+
 
 class TradeRepository(BaseRepository):
     """Repository for executed trades.
@@ -710,7 +1302,11 @@ class TradeRepository(BaseRepository):
         - symbol: Group trades by stock
         - status: Filter active vs closed trades
         - entry_date: Time-series analysis
-        - exit_date: Performance analysis by close date
+        - (status, exit_date desc): Closed trades within a lookback window
+        - exit_date desc, partial on a set exit_date (closed trades): Archival scans
+
+    Closed trades older than the longest lookback can be moved to the
+    `trades_archive` collection with archive_closed_before().
 
     Trade Lifecycle
     ---------------
@@ -790,6 +1386,7 @@ class TradeRepository(BaseRepository):
             MongoDB database instance.
         """
         super().__init__(db, "trades")
+        self._id_cache = _IdCache()
 
     def create(self, trade: TradeDoc) -> str:
         """Create a new trade.
@@ -823,27 +1420,41 @@ class TradeRepository(BaseRepository):
         result = self.collection.insert_one(data)
         return str(result.inserted_id)
 
-    def get_by_id(self, trade_id: str) -> Optional[dict]:
+    def get_by_id(self, trade_id: Union[str, ObjectId]) -> Optional[dict]:
         """Get trade by ID.
 
         Args
         ----
-        trade_id : str
-            MongoDB document ID (string format).
+        trade_id : str or ObjectId
+            MongoDB document ID (string or already-parsed ObjectId).
 
         Returns
         -------
         dict or None
             Trade document dict, or None if not found.
 
+        Notes
+        -----
+        Results are kept in a per-repository LRU cache (1024 entries) that
+        this repository's update methods invalidate. Writes made through a
+        different repository instance are not seen until the entry is evicted.
+
         Example
         -------
             trade = repo.get_by_id("507f1f77bcf86cd799439011")
             if trade and trade["status"] == "active":
                 print(f"Monitoring {trade['symbol']} at ₹{trade['entry_price']}")
         """
-        doc = self.collection.find_one({"_id": ObjectId(trade_id)})
-        return self._from_doc(doc) if doc else None
+        key = str(trade_id)
+        cached = self._id_cache.get(key)
+        if cached is not None:
+            return cached
+        doc = self.collection.find_one({"_id": _oid(trade_id)})
+        if not doc:
+            return None
+        doc = self._from_doc(doc)
+        self._id_cache.put(key, doc)
+        return doc
 
     def get_active_trades(self) -> list[dict]:
         """Get all active (open) trades.
@@ -872,9 +1483,38 @@ class TradeRepository(BaseRepository):
 
             print(f"Total portfolio risk: ₹{total_risk:,.0f}")
         """
-        docs = self.collection.find({"status": TradeStatus.ACTIVE.value})
+        docs = self.collection.find({"status": _ACTIVE_TRADE})
         return [self._from_doc(doc) for doc in docs]
 
+    def iter_trade_rows(self, status: TradeStatus = TradeStatus.ACTIVE) -> Iterator[TradeRow]:
+        """Stream trades with a given status as compact TradeRow objects.
+
+        Projects only the TradeRow fields, so the full trade documents are
+        never decoded into dicts.
+
+        Args
+        ----
+        status : TradeStatus, optional
+            Trade status to filter by (default: ACTIVE).
+
+        Yields
+        ------
+        TradeRow
+            One slotted row per matching trade.
+
+        Example
+        -------
+            total_risk = sum(
+                (t.entry_price - t.stop_loss) * t.shares
+                for t in repo.iter_trade_rows()
+            )
+        """
+        docs = self.collection.find(
+            {"status": status.value}, TRADE_ROW_PROJECTION
+        ).batch_size(self.BATCH_SIZE)
+        for doc in docs:
+            yield TradeRow.from_doc(doc)
+
     def get_by_status(self, status: TradeStatus) -> list[dict]:
         """Get trades by status.
 
@@ -900,7 +1540,7 @@ class TradeRepository(BaseRepository):
 
     def close_trade(
         self,
-        trade_id: str,
+        trade_id: Union[str, ObjectId],
         exit_price: float,
         exit_date: datetime,
         exit_reason: str,
@@ -908,11 +1548,13 @@ class TradeRepository(BaseRepository):
         """Close a trade with exit details.
 
         Automatically calculates P&L, R-multiple, holding days, and sets status
-        to CLOSED_WIN or CLOSED_LOSS based on profitability.
+        to CLOSED_WIN or CLOSED_LOSS based on profitability. The derived fields
+        are computed server-side in a single atomic `find_one_and_update`, so
+        the trade is never read first.
 
         Args
         ----
-        trade_id : str
+        trade_id : str or ObjectId
             MongoDB document ID of the trade to close.
         exit_price : float
             Price at which position was exited.
@@ -978,42 +1620,116 @@ class TradeRepository(BaseRepository):
                 exit_reason="regime_exit"
             )
         """
-        trade = self.get_by_id(trade_id)
-        if not trade:
-            return False
+        trade = self.collection.find_one_and_update(
+            {"_id": _oid(trade_id)},
+            _close_trade_pipeline(exit_price, exit_date, exit_reason),
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        self._id_cache.pop(trade_id)
+        return trade is not None
+
+    def close_trades_bulk(
+        self,
+        closes: list[tuple[Union[str, ObjectId], float, datetime, str]],
+    ) -> int:
+        """Close many trades in a single round trip.
+
+        Each trade is closed with the same server-side pipeline as
+        close_trade(), batched into one unordered `bulk_write`, so N exits
+        cost one network round trip and one write acknowledgement.
+
+        Args
+        ----
+        closes : list[tuple[str or ObjectId, float, datetime, str]]
+            (trade_id, exit_price, exit_date, exit_reason) per trade.
+
+        Returns
+        -------
+        int
+            Number of trades modified.
+
+        Example
+        -------
+            # End of day: close everything that hit its stop
+            now = datetime.utcnow()
+            repo.close_trades_bulk([
+                (t["id"], closes[t["symbol"]], now, "stop_loss")
+                for t in repo.get_active_trades()
+                if closes[t["symbol"]] <= t["stop_loss"]
+            ])
+        """
+        if not closes:
+            return 0
+        result = self.collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": _oid(trade_id)},
+                    _close_trade_pipeline(exit_price, exit_date, exit_reason),
+                )
+                for trade_id, exit_price, exit_date, exit_reason in closes
+            ],
+            ordered=False,
+        )
+        for close in closes:
+            self._id_cache.pop(close[0])
+        return result.modified_count
 
-        entry_price = trade["entry_price"]
-        stop_loss = trade["stop_loss"]
-        risk_per_share = entry_price - stop_loss
-        pnl_per_share = exit_price - entry_price
-        shares = trade["shares"]
+    def archive_closed_before(self, cutoff: datetime) -> int:
+        """Move closed trades that exited before `cutoff` to `trades_archive`.
 
-        pnl = pnl_per_share * shares
-        pnl_percent = (pnl_per_share / entry_price) * 100
-        r_multiple = pnl_per_share / risk_per_share if risk_per_share != 0 else 0
+        Keeps the hot `trades` collection (and its indexes) limited to open
+        positions and the recent closed history that lookback stats read.
+        Archived trades are upserted by `_id`, so re-running is safe.
 
-        status = TradeStatus.CLOSED_WIN if pnl > 0 else TradeStatus.CLOSED_loss
+        Args
+        ----
+        cutoff : datetime
+            Closed trades with exit_date earlier than this are archived.
 
-        entry_date = trade.get("entry_date") or datetime.utcnow()
-        holding_days = (exit_date - entry_date).days
+        Returns
+        -------
+        int
+            Number of trades removed from the trades collection.
 
-        result = self.collection.update_one(
-            {"_id": ObjectId(trade_id)},
-            {
-                "$set": {
-                    "exit_price": exit_price,
-                    "exit_date": exit_date,
-                    "exit_reason": exit_reason,
-                    "status": status.value,
-                    "pnl": pnl,
-                    "pnl_percent": pnl_percent,
-                    "r_multiple": r_multiple,
-                    "holding_days": holding_days,
-                    "updated_at": datetime.utcnow(),
-                }
-            },
+        Example
+        -------
+            # Monthly maintenance: keep two years of closed trades hot
+            repo.archive_closed_before(datetime.utcnow() - timedelta(days=730))
+        """
+        # $type repeats the partial index filter so the planner can use it.
+        # The ids are fixed up front: a trade closed (or reopened) between
+        # the copy and the delete must not be deleted without being archived.
+        ids = [
+            doc["_id"]
+            for doc in self.collection.find(
+                {
+                    "status": {"$in": _CLOSED_STATES},
+                    "exit_date": {"$lt": cutoff, "$type": "date"},
+                },
+                {"_id": 1},
+            )
+        ]
+        if not ids:
+            return 0
+        match = {"_id": {"$in": ids}}
+        self.collection.aggregate(
+            [
+                {"$match": match},
+                {
+                    "$merge": {
+                        "into": "trades_archive",
+                        "on": "_id",
+                        "whenMatched": "replace",
+                        "whenNotMatched": "insert",
+                    }
+                },
+            ]
         )
-        return result.modified_count > 0
+        result = self.collection.delete_many(match)
+        for trade_id in ids:
+            self._id_cache.pop(trade_id)
+        return result.deleted_count
 
     def get_performance_stats(self, days: int = 365) -> dict:
         """Calculate performance statistics for closed trades.
@@ -1024,7 +1740,8 @@ class TradeRepository(BaseRepository):
         Args
         ----
         days : int, optional
-            Lookback period in days (default: 365 = 1 year).
+            Lookback period in days (default: 365 = 1 year), counted back
+            from today's UTC midnight.
             Common values:
                 - 84 days (12 weeks): Short-term health check
                 - 365 days (52 weeks): Long-term health check
@@ -1088,49 +1805,101 @@ class TradeRepository(BaseRepository):
             if stats_12w['expectancy'] < stats_52w['expectancy'] * 0.5:
                 print("Recent performance degrading. Possible edge decay.")
         """
-        cutoff = datetime.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        cutoff = cutoff.replace(day=cutoff.day - days if cutoff.day > days else 1)
+        cutoff = _lookback_cutoff(_utc_today_ordinal(), days)
+        match = {
+            "status": {"$in": _CLOSED_STATES},
+            "exit_date": {"$gte": cutoff},
+        }
 
-        closed_trades = list(
-            self.collection.find(
-                {
-                    "status": {"$in": [TradeStatus.CLOSED_WIN.value, TradeStatus.CLOSED_loss.value]},
-                    "exit_date": {"$gte": cutoff},
+        try:
+            totals = self._closed_totals_aggregate(match)
+        except OperationFailure:
+            # Deployments without aggregation support for this pipeline
+            # (e.g. restricted roles) fall back to a projected fetch.
+            totals = self._closed_totals_numpy(match)
+        return _performance_summary(*totals)
+
+    def _closed_totals_aggregate(self, match: dict) -> tuple:
+        """Sum closed-trade results server-side with a `$group` pipeline.
+
+        Args
+        ----
+        match : dict
+            Filter selecting the closed trades in the lookback window.
+
+        Returns
+        -------
+        tuple
+            (wins, losses, sum_win_r, sum_loss_r, total_pnl).
+        """
+        # One bucket for winners (pnl > 0) and one for losers, so closed
+        # trades are never shipped to Python.
+        pipeline = [
+            {"$match": match},
+            {"$project": {"_id": 0, "pnl": 1, "r_multiple": 1}},
+            {
+                "$group": {
+                    "_id": {"$gt": ["$pnl", 0]},
+                    "count": {"$sum": 1},
+                    "sum_pnl": {"$sum": "$pnl"},
+                    "sum_r": {"$sum": "$r_multiple"},
                 }
-            )
+            },
+        ]
+        buckets = {
+            row["_id"]: row
+            for row in self.collection.aggregate(pipeline, allowDiskUse=False)
+        }
+        win_bucket = buckets.get(True, {})
+        loss_bucket = buckets.get(False, {})
+        return (
+            win_bucket.get("count", 0),
+            loss_bucket.get("count", 0),
+            win_bucket.get("sum_r", 0.0),
+            loss_bucket.get("sum_r", 0.0),
+            win_bucket.get("sum_pnl", 0.0) + loss_bucket.get("sum_pnl", 0.0),
         )
 
-        if not closed_trades:
-            return {
-                "total_trades": 0,
-                "win_rate": 0.0,
-                "avg_win_r": 0.0,
-                "avg_loss_r": 0.0,
-                "expectancy": 0.0,
-                "total_pnl": 0.0,
-            }
+    def _closed_totals_numpy(self, match: dict) -> tuple:
+        """Sum closed-trade results client-side with vectorized NumPy math.
 
-        wins = [t for t in closed_trades if t["pnl"] > 0]
-        losses = [t for t in closed_trades if t["pnl"] <= 0]
+        Fetches only `pnl` and `r_multiple`, reads the cursor once, and
+        reduces the results in C instead of per-trade Python loops.
 
-        win_rate = len(wins) / len(closed_trades) if closed_trades else 0
-        avg_win_r = sum(t["r_multiple"] for t in wins) / len(wins) if wins else 0
-        avg_loss_r = sum(t["r_multiple"] for t in losses) / len(losses) if losses else 0
-        expectancy = (win_rate * avg_win_r) + ((1 - win_rate) * avg_loss_r)
-        total_pnl = sum(t["pnl"] for t in closed_trades)
+        Args
+        ----
+        match : dict
+            Filter selecting the closed trades in the lookback window.
 
-        return {
-            "total_trades": len(closed_trades),
-            "wins": len(wins),
-            "losses": len(losses),
-            "win_rate": win_rate,
-            "avg_win_r": avg_win_r,
-            "avg_loss_r": avg_loss_r,
-            "expectancy": expectancy,
-            "total_pnl": total_pnl,
-        }
+        Returns
+        -------
+        tuple
+            (wins, losses, sum_win_r, sum_loss_r, total_pnl).
+        """
+        cursor = self.collection.find(
+            match, {"_id": 0, "pnl": 1, "r_multiple": 1}
+        ).batch_size(self.BATCH_SIZE)
+        # Single pass over the cursor straight into an (n, 2) array: no
+        # intermediate list of documents and no per-bucket lists.
+        rows = np.fromiter(
+            ((t["pnl"], t["r_multiple"]) for t in cursor),
+            dtype=np.dtype((np.float64, 2)),
+        )
+        n = len(rows)
+        if not n:
+            return (0, 0, 0.0, 0.0, 0.0)
+
+        pnl = rows[:, 0]
+        r = rows[:, 1]
+        mask = pnl > 0
+        wins = int(mask.sum())
+        return (
+            wins,
+            n - wins,
+            float(r[mask].sum()),
+            float(r[~mask].sum()),
+            float(pnl.sum()),
+        )
 
 
 class RegimeRepository(BaseRepository):
@@ -1147,8 +1916,8 @@ class RegimeRepository(BaseRepository):
     Collection: regime_assessments
     -------------------------------
     Indexes:
-        - timestamp: Time-series queries
-        - state: Filter by regime type
+        - timestamp desc: Latest assessment and history
+        - (state, timestamp desc): Recent assessments for a regime type
 
     Regime States
     -------------
@@ -1266,6 +2035,14 @@ class RegimeRepository(BaseRepository):
         print(f"Average Risk-Off duration: {avg_duration} weeks")
     """
 
+    # Descending timestamp index (created in MongoDBConnection._ensure_indexes),
+    # hinted by get_latest() so the lookup is always a single index seek.
+    TIMESTAMP_INDEX = [("timestamp", -1)]
+
+    # Seconds get_latest() serves a cached assessment before re-querying.
+    # Assessments change at most daily, so a short TTL is safe.
+    LATEST_TTL_SECONDS = 60.0
+
     def __init__(self, db: Database):
         """Initialize regime repository.
 
@@ -1275,6 +2052,11 @@ class RegimeRepository(BaseRepository):
             MongoDB database instance.
         """
         super().__init__(db, "regime_assessments")
+        # (assessment, monotonic fetch time); replaced as one tuple under the
+        # lock since AsyncRepository calls get_latest() from worker threads
+        self._latest_cache: Optional[tuple[dict, float]] = None
+        self._latest_generation = 0
+        self._latest_lock = threading.Lock()
 
     def create(self, assessment: RegimeAssessmentDoc) -> str:
         """Create a new regime assessment.
@@ -1304,8 +2086,16 @@ class RegimeRepository(BaseRepository):
         """
         data = assessment.model_dump()
         result = self.collection.insert_one(data)
+        self.invalidate_latest()
         return str(result.inserted_id)
 
+    def invalidate_latest(self) -> None:
+        """Drop the cached get_latest() result so the next call re-queries."""
+        with self._latest_lock:
+            self._latest_cache = None
+            # In-flight get_latest() calls must not store what they read
+            self._latest_generation += 1
+
     def get_latest(self) -> Optional[dict]:
         """Get the most recent regime assessment.
 
@@ -1322,6 +2112,10 @@ class RegimeRepository(BaseRepository):
         If this returns None, the system MUST NOT proceed with trading.
         Always have a fallback regime or manual override.
 
+        The result is cached on the repository for LATEST_TTL_SECONDS.
+        create() invalidates the cache; call invalidate_latest() after
+        writing assessments through another repository instance.
+
         Example
         -------
             regime = repo.get_latest()
@@ -1337,8 +2131,23 @@ class RegimeRepository(BaseRepository):
             else:
                 print("Risk-On: Full system active")
         """
-        doc = self.collection.find_one(sort=[("timestamp", -1)])
-        return self._from_doc(doc) if doc else None
+        now = time.monotonic()
+        with self._latest_lock:
+            cached = self._latest_cache
+            generation = self._latest_generation
+        if cached is not None and now - cached[1] < self.LATEST_TTL_SECONDS:
+            # Callers annotate the regime dict; never hand out the cached one
+            return copy.deepcopy(cached[0])
+
+        doc = self.collection.find_one(
+            {}, sort=[("timestamp", -1)], hint=self.TIMESTAMP_INDEX
+        )
+        latest = self._from_doc(doc) if doc else None
+        if latest is not None:
+            with self._latest_lock:
+                if generation == self._latest_generation:
+                    self._latest_cache = (copy.deepcopy(latest), now)
+        return latest
 
     def get_history(self, limit: int = 52) -> list[dict]:
         """Get regime history.
@@ -1375,7 +2184,20 @@ class RegimeRepository(BaseRepository):
         docs = self.collection.find().sort("timestamp", -1).limit(limit)
         return [self._from_doc(doc) for doc in docs]
 
-    def get_by_state(self, state: RegimeState, limit: int = 10) -> list[dict]:
+    # Fields read by typical regime-study callers of get_by_state().
+    STATE_SUMMARY_FIELDS = {
+        "state": 1,
+        "timestamp": 1,
+        "confidence": 1,
+        "indicators.volatility.vix": 1,
+    }
+
+    def get_by_state(
+        self,
+        state: RegimeState,
+        limit: int = 10,
+        projection: Optional[dict] = None,
+    ) -> list[dict]:
         """Get assessments by regime state.
 
         Used for studying system performance in specific regimes.
@@ -1386,6 +2208,9 @@ class RegimeRepository(BaseRepository):
             Regime state to filter by (RISK_ON, CHOPPY, RISK_OFF).
         limit : int, optional
             Maximum number of assessments to return (default: 10).
+        projection : dict, optional
+            Fields to return (e.g. `RegimeRepository.STATE_SUMMARY_FIELDS`).
+            Defaults to the full document, including the indicators blob.
 
         Returns
         -------
@@ -1395,8 +2220,12 @@ class RegimeRepository(BaseRepository):
 
         Example
         -------
-            # Study last 10 Risk-Off periods
-            risk_off_periods = repo.get_by_state(RegimeState.RISK_OFF, limit=10)
+            # Study last 10 Risk-Off periods (summary fields only)
+            risk_off_periods = repo.get_by_state(
+                RegimeState.RISK_OFF,
+                limit=10,
+                projection=RegimeRepository.STATE_SUMMARY_FIELDS,
+            )
             for period in risk_off_periods:
                 print(f"{period['timestamp']} - Confidence: {period['confidence']}")
                 vix = period['indicators']['volatility']['vix']
@@ -1408,8 +2237,60 @@ class RegimeRepository(BaseRepository):
             print(f"Average VIX during Risk-Off: {avg_vix:.1f}")
         """
         docs = (
-            self.collection.find({"state": state.value})
+            self.collection.find({"state": state.value}, projection)
             .sort("timestamp", -1)
             .limit(limit)
         )
         return [self._from_doc(doc) for doc in docs]
+
+
+class AsyncRepository:
+    """Awaitable facade over a synchronous repository.
+
+    Each public repository method is exposed as a coroutine that runs the
+    blocking PyMongo call in a worker thread (PyMongo releases the GIL while
+    waiting on the network). Independent queries can then overlap with
+    `asyncio.gather`, so latency is bounded by the slowest query rather than
+    the sum of round trips. The wrapped repository, its connection pool and
+    its caches are shared (the caches lock around their updates); no second
+    client is created.
+
+    Generator methods (the iter_* streams) are not exposed: their cursor would
+    only be consumed after the worker thread returned, back on the event
+    loop. Call them on `repo` directly, or use the list-returning get_*
+    counterpart.
+
+    Attributes:
+        repo: The wrapped synchronous repository
+
+    Example:
+        >>> db = get_database()
+        >>> regime_repo = AsyncRepository(RegimeRepository(db))
+        >>> trade_repo = AsyncRepository(TradeRepository(db))
+        >>> setup_repo = AsyncRepository(TradeSetupRepository(db))
+        >>> regime, active, setups, stats = await asyncio.gather(
+        ...     regime_repo.get_latest(),
+        ...     trade_repo.get_active_trades(),
+        ...     setup_repo.get_active_setups(),
+        ...     trade_repo.get_performance_stats(84),
+        ... )
+    """
+
+    def __init__(self, repo: BaseRepository):
+        self.repo = repo
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.repo, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        if inspect.isgeneratorfunction(attr):
+            raise AttributeError(
+                f"{type(self.repo).__name__}.{name} is a generator; "
+                f"iterate it on the synchronous repository instead"
+            )
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
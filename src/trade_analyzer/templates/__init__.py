@@ -16,10 +16,18 @@ Components:
    - Calculates final conviction score
    - Generates action steps and gap contingency
 
-3. generate_text_template()
+3. generate_recommendation_cards()
+   - Batch variant of generate_recommendation_card()
+   - Resolves fields and scores column-wise with pandas
+
+4. generate_text_template()
    - Formats recommendation as text card
    - Suitable for display or export
 
+5. write_text_template()
+   - Streams the text card to a file-like object
+   - Use when writing reports of many cards
+
 Usage:
 ------
     from trade_analyzer.templates import (
@@ -48,10 +56,14 @@ from trade_analyzer.templates.trade_setup import (
     TradeSetupTemplate,
     generate_text_template,
     generate_recommendation_card,
+    generate_recommendation_cards,
+    write_text_template,
 )
 
 __all__ = [
     "TradeSetupTemplate",
     "generate_text_template",
     "generate_recommendation_card",
+    "generate_recommendation_cards",
+    "write_text_template",
 ]
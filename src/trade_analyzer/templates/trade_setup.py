@@ -67,19 +67,77 @@ See Also:
 - trade_analyzer.workflows.weekly_recommendation: Orchestrates generation
 """
 
+import bisect
+import functools
+import io
+import string
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal
-
-
-@dataclass
+from typing import Callable, Literal, Optional, TextIO
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernel then runs as plain Python
+    njit = None
+
+# Phase scores per position, in _conviction_kernel argument order:
+# momentum, consistency, liquidity, fundamental, setup_confidence
+_SCORE_COUNT = 5
+
+# Lower bounds of each conviction label above "Very Low" (inclusive)
+_THRESHOLD_VALUES = (3.5, 5.0, 6.5, 8.0)
+_THRESHOLDS = np.array(_THRESHOLD_VALUES)
+_LABEL_NAMES = ("Very Low", "Low", "Medium", "High", "Very High")
+_LABELS = np.array(_LABEL_NAMES)
+
+# Card fields read from pipeline position dicts: (field, keys, default).
+# The first key present in the position wins, so the table preserves the
+# precedence of the different phase outputs. Used by both the single-card
+# and the batch path.
+_ALIASES = (
+    ("symbol", ("symbol",), ""),
+    ("company_name", ("company_name", "symbol"), ""),
+    ("sector", ("sector",), "Unknown"),
+    ("momentum_score", ("momentum_score",), 0),
+    ("consistency_score", ("consistency_score",), 0),
+    ("liquidity_score", ("liquidity_score",), 0),
+    ("fundamental_score", ("fundamental_score",), 0),
+    ("setup_confidence", ("confidence", "overall_quality"), 0),
+    ("current_price", ("current_price", "entry_price"), 0),
+    ("high_52w", ("high_52w", "current_price"), 0),
+    ("low_52w", ("low_52w",), 0),
+    ("dma_20", ("dma_20", "sma_20"), 0),
+    ("dma_50", ("dma_50", "sma_50"), 0),
+    ("dma_200", ("dma_200", "sma_200"), 0),
+    ("setup_type", ("type", "setup_type"), "pullback"),
+    ("entry_low", ("entry_low", "entry_zone_low"), 0),
+    ("entry_high", ("entry_high", "entry_zone_high"), 0),
+    ("stop_loss", ("stop", "final_stop"), 0),
+    ("stop_method", ("stop_method",), "structure"),
+    ("stop_distance_pct", ("stop_distance_pct",), 0),
+    ("target_1", ("target_1",), 0),
+    ("target_2", ("target_2",), 0),
+    ("rr_ratio_1", ("rr_ratio", "rr_ratio_1"), 2.0),
+    ("rr_ratio_2", ("rr_ratio_2",), 3.0),
+    ("shares", ("shares", "final_shares"), 0),
+    ("investment_amount", ("position_value", "final_position_value"), 0),
+    ("risk_amount", ("risk_amount", "final_risk_amount"), 0),
+    ("position_pct", ("position_pct", "position_pct_of_portfolio"), 0),
+)
+
+
+@dataclass(slots=True)
 class TradeSetupTemplate:
     """
     Production trade setup template with all scores and parameters.
 
     This dataclass holds all the information needed for a complete
     trade recommendation card, including scores from all pipeline phases,
-    technical levels, position sizing, and action steps.
+    technical levels, position sizing, and action steps. It is slotted:
+    cards are built in weekly batches and have no per-instance __dict__.
 
     Attributes:
         symbol: NSE stock symbol
@@ -165,6 +223,35 @@ class TradeSetupTemplate:
     regime_confidence: float = 0
 
 
+def _conviction_kernel(
+    momentum: float,
+    consistency: float,
+    liquidity: float,
+    fundamental: float,
+    setup_confidence: float,
+) -> float:
+    """
+    Numeric core of calculate_conviction(): the unrounded weighted score.
+
+    Kept free of Python objects so Numba can compile it when installed.
+    """
+    return (
+        momentum * 0.25
+        + consistency * 0.20
+        + liquidity * 0.15
+        + fundamental * 0.20
+        + setup_confidence * 0.20
+    ) / 10
+
+
+# The plain-Python kernel also evaluates column-wise on NumPy arrays, with
+# the same operations in the same order (used by the batch variant)
+_conviction_columns = _conviction_kernel
+
+if njit is not None:
+    _conviction_kernel = njit(cache=True)(_conviction_kernel)
+
+
 def calculate_conviction(
     momentum: float,
     consistency: float,
@@ -182,33 +269,70 @@ def calculate_conviction(
     - Fundamental: 20%
     - Setup Confidence: 20%
 
+    The arithmetic runs in _conviction_kernel, which is compiled with
+    Numba when it is installed.
+
     Returns:
         Tuple of (conviction_score, label)
     """
-    weighted = (
-        momentum * 0.25
-        + consistency * 0.20
-        + liquidity * 0.15
-        + fundamental * 0.20
-        + setup_confidence * 0.20
+    conviction = _conviction_kernel(
+        float(momentum),
+        float(consistency),
+        float(liquidity),
+        float(fundamental),
+        float(setup_confidence),
     )
+    # bisect_right matches the inclusive lower bounds, like the batch
+    # variant's searchsorted(side="right")
+    label = _LABEL_NAMES[bisect.bisect_right(_THRESHOLD_VALUES, conviction)]
+    return round(conviction, 1), label
 
-    # Convert to 0-10 scale
-    conviction = weighted / 10
-
-    # Generate label
-    if conviction >= 8:
-        label = "Very High"
-    elif conviction >= 6.5:
-        label = "High"
-    elif conviction >= 5:
-        label = "Medium"
-    elif conviction >= 3.5:
-        label = "Low"
-    else:
-        label = "Very Low"
 
-    return round(conviction, 1), label
+def calculate_conviction_batch(scores: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate conviction scores and labels for many positions at once.
+
+    Vectorized equivalent of calculate_conviction(): the weighted sum runs
+    column-wise in the kernel's operation order and the labels come from one
+    searchsorted, so scores and labels match the scalar path exactly.
+
+    Args:
+        scores: (N, 5) array of phase scores in the order momentum,
+            consistency, liquidity, fundamental, setup_confidence
+
+    Returns:
+        Tuple of (conviction_scores, labels), each of length N.
+    """
+    scores = np.asarray(scores, dtype=np.float64).reshape(-1, _SCORE_COUNT)
+    # Same expression as _conviction_kernel (a dot product may sum in a
+    # different order and land on the other side of a threshold)
+    conviction = _conviction_columns(*scores.T)
+    idx = np.searchsorted(_THRESHOLDS, conviction, side="right")
+    # Python's round(), not np.round: they disagree on binary halves
+    rounded = np.array([round(value, 1) for value in conviction.tolist()])
+    return rounded, _LABELS[idx]
+
+
+@functools.lru_cache(maxsize=4)
+def _week_display_for(week_start_ordinal: int) -> str:
+    """Format the week display string for a Monday, memoized per week."""
+    return datetime.fromordinal(week_start_ordinal).strftime("%B %d, %Y")
+
+
+def card_timestamps() -> tuple[str, str]:
+    """
+    Get the week display and generation timestamp for a run of cards.
+
+    Reads the clock once, so every card generated in a run shares the same
+    values. Pass them to generate_recommendation_card() when building cards
+    in a loop.
+
+    Returns:
+        Tuple of (week_display, generated_at).
+    """
+    now = datetime.utcnow()
+    week_start_ordinal = now.toordinal() - now.weekday()
+    return _week_display_for(week_start_ordinal), now.isoformat()
 
 
 def generate_action_steps(setup: TradeSetupTemplate) -> list[str]:
@@ -221,42 +345,24 @@ def generate_action_steps(setup: TradeSetupTemplate) -> list[str]:
     Returns:
         List of action step strings.
     """
-    steps = []
-
-    # Entry steps
-    steps.append(
-        f"1. Place limit buy order at Rs.{setup.entry_low:.2f} - Rs.{setup.entry_high:.2f}"
-    )
-
-    # Stop loss
-    steps.append(
+    steps = [
+        # Entry steps
+        f"1. Place limit buy order at Rs.{setup.entry_low:.2f} - Rs.{setup.entry_high:.2f}",
+        # Stop loss
         f"2. Set stop-loss at Rs.{setup.stop_loss:.2f} "
-        f"({setup.stop_distance_pct:.1f}% below entry, {setup.stop_method} method)"
-    )
-
-    # Position size
-    steps.append(
+        f"({setup.stop_distance_pct:.1f}% below entry, {setup.stop_method} method)",
+        # Position size
         f"3. Buy {setup.shares} shares (Rs.{setup.investment_amount:,.0f}, "
-        f"{setup.position_pct:.1f}% of portfolio)"
-    )
-
-    # Targets
-    steps.append(
+        f"{setup.position_pct:.1f}% of portfolio)",
+        # Targets
         f"4. Target 1: Rs.{setup.target_1:.2f} ({setup.rr_ratio_1:.1f}R) - "
-        f"Take 50% profit"
-    )
-    steps.append(
+        f"Take 50% profit",
         f"5. Target 2: Rs.{setup.target_2:.2f} ({setup.rr_ratio_2:.1f}R) - "
-        f"Exit remaining"
-    )
-
-    # Trailing stop
-    steps.append(
-        "6. At 1R profit (+3%), move stop to breakeven"
-    )
-    steps.append(
-        "7. At 2R profit (+6%), trail stop to +2%"
-    )
+        f"Exit remaining",
+        # Trailing stop
+        "6. At 1R profit (+3%), move stop to breakeven",
+        "7. At 2R profit (+6%), trail stop to +2%",
+    ]
 
     # Gap contingency
     if setup.gap_contingency:
@@ -300,87 +406,211 @@ def generate_gap_contingency(
     return " | ".join(contingencies)
 
 
-def generate_text_template(setup: TradeSetupTemplate) -> str:
+def generate_gap_contingencies(
+    entry_low: pd.Series,
+    entry_high: pd.Series,
+    stop_loss: pd.Series,
+) -> pd.Series:
     """
-    Generate formatted text recommendation template.
+    Generate gap contingency instructions for many setups at once.
+
+    Column-wise equivalent of generate_gap_contingency(): each price column
+    is formatted once and the four rules are concatenated as Series.
 
     Args:
-        setup: TradeSetupTemplate instance
+        entry_low: Lower entry zones
+        entry_high: Upper entry zones
+        stop_loss: Stop loss prices
 
     Returns:
-        Formatted text string.
+        Series of gap contingency strings, aligned with the inputs.
     """
-    template = f"""
+    fmt = "{:.2f}".format
+    low = entry_low.astype(np.float64).map(fmt)
+    high = entry_high.astype(np.float64)
+    chase = (high * 1.02).map(fmt)
+    high = high.map(fmt)
+    stop = stop_loss.astype(np.float64).map(fmt)
+
+    return (
+        "If Monday open < Rs." + stop + " (stop): SKIP trade"
+        + " | If Monday open in Rs." + low + "-" + high + ": ENTER at open"
+        + " | If Monday open > Rs." + chase + " (+2%): SKIP - don't chase"
+        + " | If Monday open < Rs." + low + " but > Rs." + stop
+        + ": ENTER at open (small gap against)"
+    )
+
+
+# Text card layout; filled by write_text_template()
+_TEXT_TEMPLATE = """
 ================================================================================
                     TRADE RECOMMENDATION CARD
-                    Week of {setup.week_display}
+                    Week of {week_display}
 ================================================================================
 
-SYMBOL: {setup.symbol}
-Company: {setup.company_name}
-Sector: {setup.sector}
-Setup Type: {setup.setup_type.upper()}
+SYMBOL: {symbol}
+Company: {company_name}
+Sector: {sector}
+Setup Type: {setup_type_upper}
 
 --------------------------------------------------------------------------------
                          CONVICTION SCORES
 --------------------------------------------------------------------------------
-Final Conviction: {setup.final_conviction}/10 ({setup.conviction_label})
+Final Conviction: {final_conviction}/10 ({conviction_label})
 
 Phase Scores:
-  - Momentum Score:    {setup.momentum_score:.0f}/100
-  - Consistency Score: {setup.consistency_score:.0f}/100
-  - Liquidity Score:   {setup.liquidity_score:.0f}/100
-  - Fundamental Score: {setup.fundamental_score:.0f}/100
-  - Setup Confidence:  {setup.setup_confidence:.0f}/100
+  - Momentum Score:    {momentum_score:.0f}/100
+  - Consistency Score: {consistency_score:.0f}/100
+  - Liquidity Score:   {liquidity_score:.0f}/100
+  - Fundamental Score: {fundamental_score:.0f}/100
+  - Setup Confidence:  {setup_confidence:.0f}/100
 
-Market Regime: {setup.market_regime.upper()} ({setup.regime_confidence:.0f}% confidence)
+Market Regime: {market_regime_upper} ({regime_confidence:.0f}% confidence)
 
 --------------------------------------------------------------------------------
                          TECHNICAL DATA
 --------------------------------------------------------------------------------
-Current Price:     Rs.{setup.current_price:,.2f}
-52-Week High:      Rs.{setup.high_52w:,.2f} ({setup.from_52w_high_pct:.1f}% from high)
-52-Week Low:       Rs.{setup.low_52w:,.2f}
-20 DMA:            Rs.{setup.dma_20:,.2f}
-50 DMA:            Rs.{setup.dma_50:,.2f}
-200 DMA:           Rs.{setup.dma_200:,.2f}
+Current Price:     Rs.{current_price:,.2f}
+52-Week High:      Rs.{high_52w:,.2f} ({from_52w_high_pct:.1f}% from high)
+52-Week Low:       Rs.{low_52w:,.2f}
+20 DMA:            Rs.{dma_20:,.2f}
+50 DMA:            Rs.{dma_50:,.2f}
+200 DMA:           Rs.{dma_200:,.2f}
 
 --------------------------------------------------------------------------------
                          TRADE PARAMETERS
 --------------------------------------------------------------------------------
-Entry Zone:        Rs.{setup.entry_low:,.2f} - Rs.{setup.entry_high:,.2f}
-Stop Loss:         Rs.{setup.stop_loss:,.2f} ({setup.stop_distance_pct:.1f}% risk)
-Stop Method:       {setup.stop_method.upper()}
+Entry Zone:        Rs.{entry_low:,.2f} - Rs.{entry_high:,.2f}
+Stop Loss:         Rs.{stop_loss:,.2f} ({stop_distance_pct:.1f}% risk)
+Stop Method:       {stop_method_upper}
 
-Target 1 (2R):     Rs.{setup.target_1:,.2f} (R:R {setup.rr_ratio_1:.1f})
-Target 2 (3R):     Rs.{setup.target_2:,.2f} (R:R {setup.rr_ratio_2:.1f})
+Target 1 (2R):     Rs.{target_1:,.2f} (R:R {rr_ratio_1:.1f})
+Target 2 (3R):     Rs.{target_2:,.2f} (R:R {rr_ratio_2:.1f})
 
 --------------------------------------------------------------------------------
                          POSITION SIZING
 --------------------------------------------------------------------------------
-Shares:            {setup.shares}
-Investment:        Rs.{setup.investment_amount:,.2f}
-Risk Amount:       Rs.{setup.risk_amount:,.2f}
-Portfolio %:       {setup.position_pct:.1f}%
+Shares:            {shares}
+Investment:        Rs.{investment_amount:,.2f}
+Risk Amount:       Rs.{risk_amount:,.2f}
+Portfolio %:       {position_pct:.1f}%
 
 --------------------------------------------------------------------------------
                          ACTION STEPS
 --------------------------------------------------------------------------------
-"""
-    for step in setup.action_steps:
-        template += f"  {step}\n"
-
-    template += f"""
+{action_block}
 --------------------------------------------------------------------------------
                          GAP CONTINGENCY (MONDAY)
 --------------------------------------------------------------------------------
-{setup.gap_contingency}
+{gap_contingency}
 
 ================================================================================
-Generated: {setup.generated_at}
+Generated: {generated_at}
 ================================================================================
 """
-    return template
+
+
+# _TEXT_TEMPLATE pre-split into (literal, field_name, format_spec) segments
+_TEXT_SEGMENTS = tuple(
+    (literal, name, spec)
+    for literal, name, spec, _ in string.Formatter().parse(_TEXT_TEMPLATE)
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _writer_for(
+    setup_type_upper: str,
+    market_regime_upper: str,
+    stop_method_upper: str,
+) -> Callable[[TradeSetupTemplate, str, Callable[[str], object]], None]:
+    """
+    Compile a text-card writer specialized for one set of card labels.
+
+    The uppercased labels are folded into the literal text at compile time
+    and adjacent literals are merged, so the generated function is a
+    straight run of write() calls. A weekly run only needs a few distinct
+    label combinations, so the cache keeps codegen off the per-card path.
+    """
+    constants = {
+        "setup_type_upper": setup_type_upper,
+        "market_regime_upper": market_regime_upper,
+        "stop_method_upper": stop_method_upper,
+    }
+    lines = ["def _write(setup, action_block, write):"]
+    pending = []
+
+    def flush():
+        text = "".join(pending)
+        if text:
+            lines.append(f"    write({text!r})")
+        pending.clear()
+
+    for literal, name, spec in _TEXT_SEGMENTS:
+        pending.append(literal)
+        if name is None:
+            continue
+        if name in constants:
+            pending.append(format(constants[name], spec))
+            continue
+        flush()
+        if name == "action_block":
+            lines.append("    write(action_block)")
+        else:
+            lines.append(f"    write(format(setup.{name}, {spec!r}))")
+    flush()
+
+    namespace = {}
+    # Only repr()'d literals and fixed template field names reach the source
+    exec(compile("\n".join(lines), "<text-template>", "exec"), namespace)  # noqa: S102
+    return namespace["_write"]
+
+
+def write_text_template(setup: TradeSetupTemplate, out: TextIO) -> None:
+    """
+    Write the formatted text recommendation template to a file-like object.
+
+    Writes segment by segment, so a report of many cards can be streamed to
+    a file without building each card as an intermediate string.
+
+    Args:
+        setup: TradeSetupTemplate instance
+        out: Writable text stream (file, io.StringIO, ...)
+    """
+    writer = _writer_for(
+        setup.setup_type.upper(),
+        setup.market_regime.upper(),
+        setup.stop_method.upper(),
+    )
+    action_block = "".join(f"  {step}\n" for step in setup.action_steps)
+    writer(setup, action_block, out.write)
+
+
+def generate_text_template(setup: TradeSetupTemplate) -> str:
+    """
+    Generate formatted text recommendation template.
+
+    Args:
+        setup: TradeSetupTemplate instance
+
+    Returns:
+        Formatted text string.
+    """
+    buf = io.StringIO()
+    write_text_template(setup, buf)
+    return buf.getvalue()
+
+
+def _resolve_fields(position: dict) -> dict:
+    """Resolve every _ALIASES card field from a position dict in one pass."""
+    fields = {}
+    for name, keys, default in _ALIASES:
+        for key in keys:
+            if key in position:
+                fields[name] = position[key]
+                break
+        else:
+            fields[name] = default
+    return fields
 
 
 def generate_recommendation_card(
@@ -388,6 +618,9 @@ def generate_recommendation_card(
     portfolio_value: float = 1000000.0,
     market_regime: str = "risk_on",
     regime_confidence: float = 70.0,
+    conviction: Optional[tuple[float, str]] = None,
+    week_display: Optional[str] = None,
+    generated_at: Optional[str] = None,
 ) -> TradeSetupTemplate:
     """
     Generate a complete recommendation card from position data.
@@ -397,78 +630,54 @@ def generate_recommendation_card(
         portfolio_value: Total portfolio value
         market_regime: Current market regime
         regime_confidence: Regime confidence percentage
+        conviction: Precomputed (score, label), e.g. one row of
+            calculate_conviction_batch(). Computed here if not provided.
+        week_display: Precomputed week display (see card_timestamps())
+        generated_at: Precomputed generation timestamp (see card_timestamps())
 
     Returns:
         TradeSetupTemplate instance.
     """
-    # Extract scores
-    momentum = position.get("momentum_score", 0)
-    consistency = position.get("consistency_score", 0)
-    liquidity = position.get("liquidity_score", 0)
-    fundamental = position.get("fundamental_score", 0)
-    setup_conf = position.get("confidence", position.get("overall_quality", 0))
-
-    # Calculate conviction
-    conviction, label = calculate_conviction(
-        momentum, consistency, liquidity, fundamental, setup_conf
-    )
-
-    # Extract prices
-    entry_low = position.get("entry_low", position.get("entry_zone_low", 0))
-    entry_high = position.get("entry_high", position.get("entry_zone_high", 0))
-    stop_loss = position.get("stop", position.get("final_stop", 0))
+    fields = _resolve_fields(position)
+
+    # Calculate conviction (unless the caller scored the batch already)
+    if conviction is None:
+        conviction = calculate_conviction(
+            fields["momentum_score"],
+            fields["consistency_score"],
+            fields["liquidity_score"],
+            fields["fundamental_score"],
+            fields["setup_confidence"],
+        )
+    conviction, label = conviction
 
     # Calculate from 52w high
-    high_52w = position.get("high_52w", position.get("current_price", 0))
-    current = position.get("current_price", position.get("entry_price", 0))
+    high_52w = fields["high_52w"]
+    current = fields["current_price"]
     from_high = ((high_52w - current) / high_52w * 100) if high_52w > 0 else 0
 
-    # Generate week display
-    today = datetime.utcnow()
-    week_start = today - timedelta(days=today.weekday())
-    week_display = week_start.strftime("%B %d, %Y")
+    # Week display and timestamp (shared across a run when passed in)
+    if week_display is None or generated_at is None:
+        run_week_display, run_generated_at = card_timestamps()
+        week_display = week_display or run_week_display
+        generated_at = generated_at or run_generated_at
 
     # Create template
     setup = TradeSetupTemplate(
-        symbol=position.get("symbol", ""),
-        company_name=position.get("company_name", position.get("symbol", "")),
-        sector=position.get("sector", "Unknown"),
+        **fields,
         week_display=week_display,
-        momentum_score=momentum,
-        consistency_score=consistency,
-        liquidity_score=liquidity,
-        fundamental_score=fundamental,
-        setup_confidence=setup_conf,
         final_conviction=conviction,
         conviction_label=label,
-        current_price=current,
-        high_52w=high_52w,
-        low_52w=position.get("low_52w", 0),
-        dma_20=position.get("dma_20", position.get("sma_20", 0)),
-        dma_50=position.get("dma_50", position.get("sma_50", 0)),
-        dma_200=position.get("dma_200", position.get("sma_200", 0)),
         from_52w_high_pct=round(from_high, 1),
-        setup_type=position.get("type", position.get("setup_type", "pullback")),
-        entry_low=entry_low,
-        entry_high=entry_high,
-        stop_loss=stop_loss,
-        stop_method=position.get("stop_method", "structure"),
-        stop_distance_pct=position.get("stop_distance_pct", 0),
-        target_1=position.get("target_1", 0),
-        target_2=position.get("target_2", 0),
-        rr_ratio_1=position.get("rr_ratio", position.get("rr_ratio_1", 2.0)),
-        rr_ratio_2=position.get("rr_ratio_2", 3.0),
-        shares=position.get("shares", position.get("final_shares", 0)),
-        investment_amount=position.get("position_value", position.get("final_position_value", 0)),
-        risk_amount=position.get("risk_amount", position.get("final_risk_amount", 0)),
-        position_pct=position.get("position_pct", position.get("position_pct_of_portfolio", 0)),
         market_regime=market_regime,
         regime_confidence=regime_confidence,
-        generated_at=datetime.utcnow().isoformat(),
+        generated_at=generated_at,
     )
 
     # Generate gap contingency
-    setup.gap_contingency = generate_gap_contingency(entry_low, entry_high, stop_loss)
+    setup.gap_contingency = generate_gap_contingency(
+        setup.entry_low, setup.entry_high, setup.stop_loss
+    )
 
     # Generate action steps
     setup.action_steps = generate_action_steps(setup)
@@ -476,5 +685,102 @@ def generate_recommendation_card(
     return setup
 
 
-# Import timedelta for week display calculation
-from datetime import timedelta
+def _float_column(fields: list[dict], name: str) -> np.ndarray:
+    """
+    Collect one resolved card field as a float array.
+
+    float() raises on None or non-numeric values, as the scalar path does
+    when it does arithmetic on them.
+    """
+    return np.array([float(row[name]) for row in fields], dtype=np.float64)
+
+
+def generate_recommendation_cards(
+    positions: list[dict],
+    portfolio_value: float = 1000000.0,
+    market_regime: str = "risk_on",
+    regime_confidence: float = 70.0,
+) -> list[TradeSetupTemplate]:
+    """
+    Generate recommendation cards for a batch of positions.
+
+    Produces the same cards as calling generate_recommendation_card() per
+    position: fields are resolved with the same _resolve_fields() and kept
+    as given, while conviction scores, the 52-week-high distance and the
+    gap contingencies are computed as column operations. The timestamp and
+    week display are computed once for the whole batch.
+
+    Args:
+        positions: Position dicts with all scores and parameters
+        portfolio_value: Total portfolio value
+        market_regime: Current market regime
+        regime_confidence: Regime confidence percentage
+
+    Returns:
+        List of TradeSetupTemplate instances, in input order.
+
+    Raises:
+        TypeError, ValueError: If a score or price is not numeric (the
+            scalar path raises for the same positions).
+    """
+    if not positions:
+        return []
+
+    fields = [_resolve_fields(position) for position in positions]
+
+    convictions, labels = calculate_conviction_batch(
+        np.column_stack(
+            [
+                _float_column(fields, name)
+                for name in (
+                    "momentum_score",
+                    "consistency_score",
+                    "liquidity_score",
+                    "fundamental_score",
+                    "setup_confidence",
+                )
+            ]
+        )
+    )
+
+    high = _float_column(fields, "high_52w")
+    current = _float_column(fields, "current_price")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        from_high = (high - current) / high * 100
+    # Python's round() per element, and the scalar path's int 0 for high <= 0
+    from_high_pct = [
+        round(pct, 1) if positive else 0
+        for pct, positive in zip(from_high.tolist(), (high > 0).tolist())
+    ]
+
+    gap_contingencies = generate_gap_contingencies(
+        pd.Series(_float_column(fields, "entry_low")),
+        pd.Series(_float_column(fields, "entry_high")),
+        pd.Series(_float_column(fields, "stop_loss")),
+    )
+
+    # Shared across every card in the batch
+    week_display, generated_at = card_timestamps()
+
+    cards = []
+    for row, conviction, label, pct, gap in zip(
+        fields,
+        convictions.tolist(),
+        labels.tolist(),
+        from_high_pct,
+        gap_contingencies.tolist(),
+    ):
+        setup = TradeSetupTemplate(
+            **row,
+            week_display=week_display,
+            final_conviction=conviction,
+            conviction_label=label,
+            from_52w_high_pct=pct,
+            market_regime=market_regime,
+            regime_confidence=regime_confidence,
+            generated_at=generated_at,
+            gap_contingency=gap,
+        )
+        setup.action_steps = generate_action_steps(setup)
+        cards.append(setup)
+    return cards
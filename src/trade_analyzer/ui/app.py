@@ -62,20 +62,26 @@ Main Dashboard Features:
         - All Stocks: Complete universe with pagination
 
 Workflow Execution:
-    - All buttons trigger Temporal workflows via asyncio.run()
-    - Workflows execute synchronously with progress spinners
+    - All buttons trigger Temporal workflows on a persistent event loop
+      with one shared Temporal client
+    - Workflows execute synchronously with progress spinners, except the
+      complete weekly pipeline, which runs in the background with a polled
+      progress bar
     - Success/error messages displayed after completion
     - Dashboard auto-refreshes on workflow completion
 
 Database Integration:
     - Auto-connects to MongoDB on startup using config
-    - Displays real-time stats from database collections
+    - Displays stats from database collections (cached for 60s, cleared
+      when a workflow completes)
     - Supports pagination for large datasets (50 items/page)
-    - Search functionality for symbol filtering
+    - Search functionality for symbol filtering (st.text_input commits on
+      Enter or blur, not per keystroke, so typing does not re-query)
 
 Architecture:
     - Single-file Streamlit app (no multi-page structure)
     - Session state for pagination and search
+    - Stock lists are st.fragment blocks: paging reruns only the list
     - Direct MongoDB queries for real-time data
     - Async workflow execution via helper functions
 
@@ -90,10 +96,46 @@ Dependencies:
     - Temporal: Workflow execution
 """
 
-from datetime import datetime
+import asyncio
+import atexit
+import logging
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
-import pandas as pd
 import streamlit as st
+from bson import json_util
+from pymongo.errors import ExecutionTimeout, PyMongoError
+from temporalio.client import WorkflowFailureError
+from temporalio.service import RPCError
+
+from trade_analyzer.db import MongoDBConnection, TradeSetupRepository
+from trade_analyzer.workers.client import get_temporal_client
+from trade_analyzer.workers.start_workflow import (
+    poll_complete_weekly_pipeline,
+    start_concurrently,
+    start_consistency_filter,
+    start_friday_close,
+    start_full_analysis_pipeline,
+    start_full_pipeline,
+    start_fundamental_data_refresh,
+    start_momentum_filter,
+    start_phase4_pipeline,
+    start_portfolio_construction,
+    start_position_status,
+    start_premarket_analysis,
+    start_risk_geometry,
+    start_setup_detection,
+    start_universe_and_momentum,
+    start_universe_setup,
+    start_volume_filter,
+    start_weekly_recommendation,
+    submit_complete_weekly_pipeline,
+)
+
+logger = logging.getLogger(__name__)
 
 # Page config must be first Streamlit command
 st.set_page_config(
@@ -105,19 +147,20 @@ st.set_page_config(
 
 def init_db_connection():
     """Initialize database connection using configured credentials."""
-    if "db" not in st.session_state:
-        st.session_state.db = None
-        st.session_state.db_connected = False
+    if st.session_state.get("db_connected"):
+        return
 
     # Auto-connect using configured credentials
-    if not st.session_state.db_connected:
-        try:
-            from trade_analyzer.db import get_database
-
-            st.session_state.db = get_database()
-            st.session_state.db_connected = True
-        except Exception as e:
-            st.session_state.db_error = str(e)
+    st.session_state.db = None
+    st.session_state.db_connected = False
+    try:
+        conn = MongoDBConnection()
+        st.session_state.db = conn.connect()
+        # Kept so Settings disconnects the handle the app is using
+        st.session_state.db_conn = conn
+        st.session_state.db_connected = True
+    except Exception as e:
+        st.session_state.db_error = str(e)
 
 
 def render_sidebar():
@@ -157,6 +200,261 @@ def render_sidebar():
         return page
 
 
+def _facet_count(facet: dict, key: str) -> int:
+    """Read a {"$count": "n"} sub-pipeline result from a $facet document."""
+    return facet[key][0]["n"] if facet.get(key) else 0
+
+
+def _stock_universe_stats(db) -> dict:
+    """
+    Collect the Phase 1 universe counts in one $facet aggregation.
+
+    Returns:
+        dict: mtf, tier_a/b/c, high_quality, fund_qualified counts and
+        last_updated of the active universe.
+    """
+    facet = next(db.stocks.aggregate([
+        {"$match": {"is_active": True}},
+        {"$facet": {
+            "mtf": [{"$match": {"is_mtf": True}}, {"$count": "n"}],
+            "tier_a": [{"$match": {"liquidity_tier": "A"}}, {"$count": "n"}],
+            "tier_b": [{"$match": {"liquidity_tier": "B"}}, {"$count": "n"}],
+            "tier_c": [{"$match": {"liquidity_tier": "C"}}, {"$count": "n"}],
+            "high_quality": [{"$match": {"quality_score": {"$gte": 60}}}, {"$count": "n"}],
+            "fund_qualified": [{"$match": {"fundamentally_qualified": True}}, {"$count": "n"}],
+            "latest": [
+                {"$sort": {"last_updated": -1}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "last_updated": 1}},
+            ],
+        }},
+    ]), {})
+
+    stats = {
+        key: _facet_count(facet, key)
+        for key in ("mtf", "tier_a", "tier_b", "tier_c", "high_quality", "fund_qualified")
+    }
+    latest = facet.get("latest")
+    stats["last_updated"] = latest[0].get("last_updated") if latest else None
+    return stats
+
+
+# Latest summary document per phase 5-8 collection:
+# (result key, collection, filter, sort field, fields shown on the dashboard)
+_SUMMARY_SOURCES = (
+    (
+        "portfolio_doc",
+        "portfolio_allocations",
+        {},
+        "allocation_date",
+        ("position_count", "total_risk_pct", "cash_reserve_pct", "allocation_date"),
+    ),
+    ("premarket_doc", "monday_premarket", {}, "analysis_date", ("enter_count", "skip_count")),
+    ("friday_doc", "friday_summaries", {}, "week_start", ("system_health.health_score",)),
+    (
+        "rec_doc",
+        "weekly_recommendations",
+        {"status": {"$ne": "expired"}},
+        "week_start",
+        ("total_setups", "allocated_pct", "status", "market_regime", "week_start"),
+    ),
+)
+
+
+def _latest_summaries(db) -> dict:
+    """
+    Fetch the latest phase 5-8 summary documents in one aggregation.
+
+    Each source contributes a sort/limit sub-pipeline tagged with its key;
+    $unionWith chains them so the four lookups cost a single round trip.
+
+    Returns:
+        dict: Result key -> latest document (without _id), or None.
+    """
+    def latest(key, match, sort_field, fields):
+        stages = [{"$match": match}] if match else []
+        return stages + [
+            {"$sort": {sort_field: -1}},
+            {"$limit": 1},
+            {"$project": {"_id": 0, "_src": {"$literal": key}, **dict.fromkeys(fields, 1)}},
+        ]
+
+    (first_key, first_coll, first_match, first_sort, first_fields), *others = _SUMMARY_SOURCES
+    pipeline = latest(first_key, first_match, first_sort, first_fields)
+    for key, coll, match, sort_field, fields in others:
+        pipeline.append({"$unionWith": {"coll": coll, "pipeline": latest(key, match, sort_field, fields)}})
+
+    docs = dict.fromkeys(key for key, *_ in _SUMMARY_SOURCES)
+    for doc in db[first_coll].aggregate(pipeline):
+        docs[doc.pop("_src")] = doc
+    return docs
+
+
+def _load_last_run(db, kind: str) -> dict | None:
+    """
+    Fetch the latest recorded run of a workflow.
+
+    Seeks the (kind, ts) workflow_runs index, so this reads a single
+    document however many runs have been recorded.
+
+    Returns:
+        dict: {"summary": result dict, "ts": run time}, or None.
+    """
+    return db.workflow_runs.find_one(
+        {"kind": kind}, projection={"summary": 1, "ts": 1, "_id": 0}, sort=[("ts", -1)]
+    )
+
+
+# trade_setups (status, composite_score) index created by the db layer
+_SETUP_STATUS_INDEX = [("status", 1), ("composite_score", -1)]
+
+
+async def _gather_dashboard_queries(db) -> dict:
+    """
+    Run the independent dashboard queries concurrently.
+
+    Each blocking PyMongo call runs in a worker thread (the client is
+    thread-safe and shares one connection pool), so the total wait is the
+    slowest query rather than the sum of all round trips.
+
+    Returns:
+        dict: Raw query results keyed by metric name.
+    """
+    # Unfiltered totals use collection metadata (O(1)) instead of a scan;
+    # they only feed metric cards and pass rates, so an estimate is enough.
+    queries = {
+        "universe": asyncio.to_thread(_stock_universe_stats, db),
+        # COUNT_SCAN over the is_active index built by the universe activities
+        "total_nse_eq": asyncio.to_thread(db.stocks.count_documents, {"is_active": True}),
+        # Momentum stats
+        "momentum_qualified": asyncio.to_thread(db.momentum_scores.count_documents, {"qualifies": True}),
+        "momentum_total": asyncio.to_thread(db.momentum_scores.estimated_document_count),
+        "momentum_latest": asyncio.to_thread(
+            db.momentum_scores.find_one, {}, {"calculated_at": 1}, sort=[("calculated_at", -1)]
+        ),
+        # Consistency stats (Phase 3)
+        "consistency_qualified": asyncio.to_thread(db.consistency_scores.count_documents, {"qualifies": True}),
+        "consistency_total": asyncio.to_thread(db.consistency_scores.estimated_document_count),
+        "consistency_latest": asyncio.to_thread(
+            db.consistency_scores.find_one,
+            {},
+            {"calculated_at": 1, "market_regime": 1},
+            sort=[("calculated_at", -1)],
+        ),
+        # Phase 4A: Liquidity stats
+        "liquidity_qualified": asyncio.to_thread(db.liquidity_scores.count_documents, {"liq_qualifies": True}),
+        "liquidity_total": asyncio.to_thread(db.liquidity_scores.estimated_document_count),
+        "liquidity_latest": asyncio.to_thread(
+            db.liquidity_scores.find_one, {}, {"calculated_at": 1}, sort=[("calculated_at", -1)]
+        ),
+        # Phase 4B: Trade setups stats
+        # COUNT_SCAN over the (qualifies, status) index
+        "setups_qualified": asyncio.to_thread(
+            db.trade_setups.count_documents, {"qualifies": True, "status": "active"}
+        ),
+        "setups_total": asyncio.to_thread(
+            db.trade_setups.count_documents, {"status": "active"}, hint=_SETUP_STATUS_INDEX
+        ),
+        "setups_latest": asyncio.to_thread(
+            db.trade_setups.find_one,
+            {},
+            {"detected_at": 1, "market_regime": 1},
+            sort=[("detected_at", -1)],
+        ),
+        # Fundamental cache stats
+        "fund_qualified": asyncio.to_thread(db.fundamental_scores.count_documents, {"qualifies": True}),
+        "fund_total": asyncio.to_thread(db.fundamental_scores.estimated_document_count),
+        "inst_qualified": asyncio.to_thread(db.institutional_holdings.count_documents, {"qualifies": True}),
+        "fund_latest": asyncio.to_thread(
+            db.fundamental_scores.find_one, {}, {"calculated_at": 1}, sort=[("calculated_at", -1)]
+        ),
+        # Phase 5-6 stats
+        "risk_qualified": asyncio.to_thread(db.position_sizes.count_documents, {"risk_qualifies": True}),
+        # Phase 5-8 latest summary documents
+        "summaries": asyncio.to_thread(_latest_summaries, db),
+        # Last recorded complete weekly pipeline run
+        "weekly_run": asyncio.to_thread(_load_last_run, db, "complete_weekly_pipeline"),
+    }
+    results = await asyncio.gather(*queries.values())
+    return dict(zip(queries, results))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_dashboard_stats(_db) -> dict:
+    """
+    Collect every metric shown on the dashboard.
+
+    Cached for 60 seconds so widget interactions do not re-query MongoDB on
+    each rerun; the workflow runners clear the cache when they finish. The
+    leading underscore keeps Streamlit from hashing the database handle.
+
+    Returns:
+        dict: Counts, last-updated timestamps, the latest phase 5-8
+        summary documents (projected, without _id) and the last recorded
+        complete weekly pipeline run.
+    """
+    raw = asyncio.run(_gather_dashboard_queries(_db))
+    universe = raw["universe"]
+    momentum_latest = raw["momentum_latest"]
+    consistency_latest = raw["consistency_latest"]
+    liquidity_latest = raw["liquidity_latest"]
+    setups_latest = raw["setups_latest"]
+    fund_latest = raw["fund_latest"]
+
+    market_regime = consistency_latest.get("market_regime", "N/A") if consistency_latest else "N/A"
+
+    return {
+        "total_nse_eq": raw["total_nse_eq"],
+        "mtf_count": universe["mtf"],
+        "tier_a": universe["tier_a"],
+        "tier_b": universe["tier_b"],
+        "tier_c": universe["tier_c"],
+        "high_quality": universe["high_quality"],
+        "fundamentally_qualified": universe["fund_qualified"],
+        "last_updated": universe["last_updated"],
+        "momentum_qualified": raw["momentum_qualified"],
+        "momentum_total": raw["momentum_total"],
+        "momentum_updated": momentum_latest.get("calculated_at") if momentum_latest else None,
+        "consistency_qualified": raw["consistency_qualified"],
+        "consistency_total": raw["consistency_total"],
+        "consistency_updated": consistency_latest.get("calculated_at") if consistency_latest else None,
+        "market_regime": market_regime,
+        "liquidity_qualified": raw["liquidity_qualified"],
+        "liquidity_total": raw["liquidity_total"],
+        "liquidity_updated": liquidity_latest.get("calculated_at") if liquidity_latest else None,
+        "setups_qualified": raw["setups_qualified"],
+        "setups_total": raw["setups_total"],
+        "setups_updated": setups_latest.get("detected_at") if setups_latest else None,
+        "setup_regime": setups_latest.get("market_regime", market_regime) if setups_latest else market_regime,
+        "fund_qualified": raw["fund_qualified"],
+        "fund_total": raw["fund_total"],
+        "inst_qualified": raw["inst_qualified"],
+        "fund_updated": fund_latest.get("calculated_at") if fund_latest else None,
+        "risk_qualified": raw["risk_qualified"],
+        "portfolio_doc": raw["summaries"]["portfolio_doc"],
+        "premarket_doc": raw["summaries"]["premarket_doc"],
+        "friday_doc": raw["summaries"]["friday_doc"],
+        "rec_doc": raw["summaries"]["rec_doc"],
+        "weekly_run": raw["weekly_run"],
+    }
+
+
+def _metric_row(items: list[tuple[str, object]]) -> None:
+    """
+    Render a row of labelled metrics as one Markdown table.
+
+    A single element instead of one st.columns cell plus st.metric widget
+    per value, so wide metric rows cost one component per rerun.
+
+    Args:
+        items: (label, value) pairs, rendered left to right
+    """
+    header = "| " + " | ".join(label for label, _ in items) + " |"
+    divider = "|" + " :---: |" * len(items)
+    values = "| " + " | ".join(f"**{value}**" for _, value in items) + " |"
+    st.markdown(f"{header}\n{divider}\n{values}")
+
+
 def render_dashboard():
     """
     Render the main dashboard page with all functionality.
@@ -201,105 +499,51 @@ def render_dashboard():
 
     db = st.session_state.db
 
-    # Get stats from database
-    total_nse_eq = db.stocks.count_documents({"is_active": True})
-    mtf_count = db.stocks.count_documents({"is_active": True, "is_mtf": True})
-    tier_a = db.stocks.count_documents({"is_active": True, "liquidity_tier": "A"})
-    tier_b = db.stocks.count_documents({"is_active": True, "liquidity_tier": "B"})
-    tier_c = db.stocks.count_documents({"is_active": True, "liquidity_tier": "C"})
-    high_quality = db.stocks.count_documents({"is_active": True, "quality_score": {"$gte": 60}})
-
-    # Momentum stats
-    momentum_qualified = db.momentum_scores.count_documents({"qualifies": True})
-    momentum_total = db.momentum_scores.count_documents({})
-
-    # Consistency stats (Phase 3)
-    consistency_qualified = db.consistency_scores.count_documents({"qualifies": True})
-    consistency_total = db.consistency_scores.count_documents({})
-
-    # Phase 4A: Liquidity stats
-    liquidity_qualified = db.liquidity_scores.count_documents({"liq_qualifies": True})
-    liquidity_total = db.liquidity_scores.count_documents({})
-
-    # Phase 4B: Trade setups stats
-    setups_qualified = db.trade_setups.count_documents({"qualifies": True, "status": "active"})
-    setups_total = db.trade_setups.count_documents({"status": "active"})
-
-    # Get last updated
-    latest = db.stocks.find_one(
-        {"is_active": True},
-        {"last_updated": 1},
-        sort=[("last_updated", -1)],
-    )
-    last_updated = latest.get("last_updated") if latest else None
-
-    # Momentum last updated
-    momentum_latest = db.momentum_scores.find_one(
-        {},
-        {"calculated_at": 1},
-        sort=[("calculated_at", -1)],
-    )
-    momentum_updated = momentum_latest.get("calculated_at") if momentum_latest else None
-
-    # Consistency last updated and regime
-    consistency_latest = db.consistency_scores.find_one(
-        {},
-        {"calculated_at": 1, "market_regime": 1},
-        sort=[("calculated_at", -1)],
-    )
-    consistency_updated = consistency_latest.get("calculated_at") if consistency_latest else None
-    market_regime = consistency_latest.get("market_regime", "N/A") if consistency_latest else "N/A"
-
-    # Phase 4 last updated
-    liquidity_latest = db.liquidity_scores.find_one(
-        {},
-        {"calculated_at": 1},
-        sort=[("calculated_at", -1)],
-    )
-    liquidity_updated = liquidity_latest.get("calculated_at") if liquidity_latest else None
-
-    setups_latest = db.trade_setups.find_one(
-        {},
-        {"detected_at": 1, "market_regime": 1},
-        sort=[("detected_at", -1)],
-    )
-    setups_updated = setups_latest.get("detected_at") if setups_latest else None
-    setup_regime = setups_latest.get("market_regime", market_regime) if setups_latest else market_regime
-
-    # Get fundamental qualification stats (Phase 1 now includes fundamental filter)
-    fundamentally_qualified = db.stocks.count_documents({
-        "is_active": True,
-        "fundamentally_qualified": True,
-    })
+    # Get stats from database (cached between reruns)
+    stats = _fetch_dashboard_stats(db)
+    total_nse_eq = stats["total_nse_eq"]
+    mtf_count = stats["mtf_count"]
+    tier_a = stats["tier_a"]
+    tier_b = stats["tier_b"]
+    tier_c = stats["tier_c"]
+    high_quality = stats["high_quality"]
+    fundamentally_qualified = stats["fundamentally_qualified"]
+    last_updated = stats["last_updated"]
+    momentum_qualified = stats["momentum_qualified"]
+    momentum_total = stats["momentum_total"]
+    momentum_updated = stats["momentum_updated"]
+    consistency_qualified = stats["consistency_qualified"]
+    consistency_total = stats["consistency_total"]
+    consistency_updated = stats["consistency_updated"]
+    market_regime = stats["market_regime"]
+    liquidity_qualified = stats["liquidity_qualified"]
+    liquidity_total = stats["liquidity_total"]
+    liquidity_updated = stats["liquidity_updated"]
+    setups_qualified = stats["setups_qualified"]
+    setups_total = stats["setups_total"]
+    setups_updated = stats["setups_updated"]
+    setup_regime = stats["setup_regime"]
 
     # Top row: Stats and buttons
-    col_stats, col_action = st.columns([4, 1])
+    col_stats, col_btn1, col_btn2 = st.columns([8, 1, 1])
 
     with col_stats:
-        stat_cols = st.columns(7)
-        with stat_cols[0]:
-            st.metric("Total NSE EQ", total_nse_eq)
-        with stat_cols[1]:
-            st.metric("MTF Eligible", mtf_count)
-        with stat_cols[2]:
-            st.metric("High Quality", high_quality)
-        with stat_cols[3]:
-            st.metric("Fund. Qualified", fundamentally_qualified)
-        with stat_cols[4]:
-            st.metric("Tier A", tier_a)
-        with stat_cols[5]:
-            st.metric("Tier B", tier_b)
-        with stat_cols[6]:
-            st.metric("Tier C", tier_c)
-
-    with col_action:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Setup Universe", type="primary"):
-                _run_universe_setup()
-        with col_btn2:
-            if st.button("Refresh Fund. (Monthly)", type="secondary"):
-                _run_fundamental_data_refresh()
+        _metric_row([
+            ("Total NSE EQ", total_nse_eq),
+            ("MTF Eligible", mtf_count),
+            ("High Quality", high_quality),
+            ("Fund. Qualified", fundamentally_qualified),
+            ("Tier A", tier_a),
+            ("Tier B", tier_b),
+            ("Tier C", tier_c),
+        ])
+
+    with col_btn1:
+        if st.button("Setup Universe", type="primary"):
+            _run_universe_setup()
+    with col_btn2:
+        if st.button("Refresh Fund. (Monthly)", type="secondary"):
+            _run_fundamental_data_refresh()
 
     # Last updated info
     if last_updated:
@@ -312,7 +556,7 @@ def render_dashboard():
     # Phase 2: Momentum Filter Section
     st.subheader("Momentum Analysis (Phase 2)")
 
-    mom_col1, mom_col2, mom_col3, mom_col4 = st.columns([1, 1, 1, 2])
+    mom_col1, mom_col2, mom_col3, col_btn1, col_btn2 = st.columns(5)
 
     with mom_col1:
         st.metric("Momentum Qualified", momentum_qualified)
@@ -324,14 +568,12 @@ def render_dashboard():
             st.metric("Pass Rate", f"{pass_rate:.1f}%")
         else:
             st.metric("Pass Rate", "N/A")
-    with mom_col4:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Run Momentum Filter", type="secondary"):
-                _run_momentum_filter()
-        with col_btn2:
-            if st.button("Full Weekend Run", type="primary"):
-                _run_universe_and_momentum()
+    with col_btn1:
+        if st.button("Run Momentum Filter", type="secondary"):
+            _run_momentum_filter()
+    with col_btn2:
+        if st.button("Full Weekend Run", type="primary"):
+            _run_universe_and_momentum()
 
     if momentum_updated:
         st.caption(f"Momentum updated: {momentum_updated}")
@@ -343,7 +585,7 @@ def render_dashboard():
     # Phase 3: Consistency Filter Section
     st.subheader("Consistency Analysis (Phase 3)")
 
-    cons_col1, cons_col2, cons_col3, cons_col4, cons_col5 = st.columns([1, 1, 1, 1, 2])
+    cons_col1, cons_col2, cons_col3, cons_col4, col_btn1, col_btn2 = st.columns(6)
 
     with cons_col1:
         st.metric("Consistency Qualified", consistency_qualified)
@@ -363,14 +605,12 @@ def render_dashboard():
             st.metric("Market Regime", market_regime)
         else:
             st.metric("Market Regime", market_regime)
-    with cons_col5:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Run Consistency Filter", type="secondary"):
-                _run_consistency_filter()
-        with col_btn2:
-            if st.button("Full Pipeline (1-3)", type="primary"):
-                _run_full_pipeline()
+    with col_btn1:
+        if st.button("Run Consistency Filter", type="secondary"):
+            _run_consistency_filter()
+    with col_btn2:
+        if st.button("Full Pipeline (1-3)", type="primary"):
+            _run_full_pipeline()
 
     if consistency_updated:
         st.caption(f"Consistency updated: {consistency_updated}")
@@ -382,7 +622,7 @@ def render_dashboard():
     # Phase 4A: Volume & Liquidity Filter Section
     st.subheader("Volume & Liquidity (Phase 4A)")
 
-    liq_col1, liq_col2, liq_col3, liq_col4 = st.columns([1, 1, 1, 2])
+    liq_col1, liq_col2, liq_col3, col_btn1, col_btn2 = st.columns(5)
 
     with liq_col1:
         st.metric("Liquidity Qualified", liquidity_qualified)
@@ -394,14 +634,12 @@ def render_dashboard():
             st.metric("Pass Rate", f"{liq_pass_rate:.1f}%")
         else:
             st.metric("Pass Rate", "N/A")
-    with liq_col4:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Run Volume Filter", type="secondary"):
-                _run_volume_filter()
-        with col_btn2:
-            if st.button("Phase 4 Pipeline", type="primary"):
-                _run_phase4_pipeline()
+    with col_btn1:
+        if st.button("Run Volume Filter", type="secondary"):
+            _run_volume_filter()
+    with col_btn2:
+        if st.button("Phase 4 Pipeline", type="primary"):
+            _run_phase4_pipeline()
 
     if liquidity_updated:
         st.caption(f"Liquidity updated: {liquidity_updated}")
@@ -413,7 +651,7 @@ def render_dashboard():
     # Phase 4B: Setup Detection Section
     st.subheader("Trade Setups (Phase 4B)")
 
-    setup_col1, setup_col2, setup_col3, setup_col4, setup_col5 = st.columns([1, 1, 1, 1, 2])
+    setup_col1, setup_col2, setup_col3, setup_col4, col_btn1, col_btn2 = st.columns(6)
 
     with setup_col1:
         st.metric("Trade Setups", setups_qualified)
@@ -427,14 +665,12 @@ def render_dashboard():
             st.metric("Qualified Rate", "N/A")
     with setup_col4:
         st.metric("Regime", setup_regime)
-    with setup_col5:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Run Setup Detection", type="secondary"):
-                _run_setup_detection()
-        with col_btn2:
-            if st.button("Full Analysis (1-4)", type="primary"):
-                _run_full_analysis()
+    with col_btn1:
+        if st.button("Run Setup Detection", type="secondary"):
+            _run_setup_detection()
+    with col_btn2:
+        if st.button("Full Analysis (1-4)", type="primary"):
+            _run_full_analysis()
 
     if setups_updated:
         st.caption(f"Setups updated: {setups_updated}")
@@ -447,13 +683,10 @@ def render_dashboard():
     st.subheader("Fundamental Data Cache (Monthly Refresh)")
     st.caption("Fundamentals are now applied in Phase 1. Run monthly to refresh cached data.")
 
-    # Get fundamental cache stats
-    fund_qualified = db.fundamental_scores.count_documents({"qualifies": True})
-    fund_total = db.fundamental_scores.count_documents({})
-    inst_qualified = db.institutional_holdings.count_documents({"qualifies": True})
-
-    fund_latest = db.fundamental_scores.find_one({}, {"calculated_at": 1}, sort=[("calculated_at", -1)])
-    fund_updated = fund_latest.get("calculated_at") if fund_latest else None
+    fund_qualified = stats["fund_qualified"]
+    fund_total = stats["fund_total"]
+    inst_qualified = stats["inst_qualified"]
+    fund_updated = stats["fund_updated"]
 
     fund_col1, fund_col2, fund_col3, fund_col4, fund_col5 = st.columns([1, 1, 1, 1, 2])
 
@@ -483,16 +716,15 @@ def render_dashboard():
     # Phase 5-6: Risk & Portfolio Section (was Phase 6-7)
     st.subheader("Risk & Portfolio (Phase 5-6)")
 
-    # Get Phase 6-7 stats
-    risk_qualified = db.position_sizes.count_documents({"risk_qualifies": True})
-    portfolio_doc = db.portfolio_allocations.find_one(sort=[("allocation_date", -1)])
+    risk_qualified = stats["risk_qualified"]
+    portfolio_doc = stats["portfolio_doc"]
     portfolio_positions = portfolio_doc.get("position_count", 0) if portfolio_doc else 0
     portfolio_risk = portfolio_doc.get("total_risk_pct", 0) if portfolio_doc else 0
     portfolio_cash = portfolio_doc.get("cash_reserve_pct", 0) if portfolio_doc else 0
 
     portfolio_updated = portfolio_doc.get("allocation_date") if portfolio_doc else None
 
-    risk_col1, risk_col2, risk_col3, risk_col4, risk_col5 = st.columns([1, 1, 1, 1, 2])
+    risk_col1, risk_col2, risk_col3, risk_col4, col_btn1, col_btn2 = st.columns(6)
 
     with risk_col1:
         st.metric("Risk Qualified", risk_qualified)
@@ -502,14 +734,12 @@ def render_dashboard():
         st.metric("Total Risk %", f"{portfolio_risk:.1f}%")
     with risk_col4:
         st.metric("Cash Reserve %", f"{portfolio_cash:.1f}%")
-    with risk_col5:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Run Risk Geometry", type="secondary", key="risk_btn"):
-                _run_risk_geometry()
-        with col_btn2:
-            if st.button("Run Portfolio", type="primary", key="portfolio_btn"):
-                _run_portfolio_construction()
+    with col_btn1:
+        if st.button("Run Risk Geometry", type="secondary", key="risk_btn"):
+            _run_risk_geometry()
+    with col_btn2:
+        if st.button("Run Portfolio", type="primary", key="portfolio_btn"):
+            _run_portfolio_construction()
 
     if portfolio_updated:
         st.caption(f"Portfolio updated: {portfolio_updated}")
@@ -521,11 +751,12 @@ def render_dashboard():
     # Phase 7: Execution Display Section (was Phase 8)
     st.subheader("Execution Display (Phase 7)")
 
-    # Get Phase 8 stats
-    premarket_doc = db.monday_premarket.find_one(sort=[("analysis_date", -1)])
-    friday_doc = db.friday_summaries.find_one(sort=[("week_start", -1)])
+    premarket_doc = stats["premarket_doc"]
+    friday_doc = stats["friday_doc"]
 
-    exec_col1, exec_col2, exec_col3, exec_col4 = st.columns([1, 1, 1, 2])
+    exec_col1, exec_col2, exec_col3, col_btn1, col_btn2, col_btn3, col_btn4 = st.columns(
+        [3, 3, 3, 2, 2, 2, 2]
+    )
 
     with exec_col1:
         if premarket_doc:
@@ -542,30 +773,27 @@ def render_dashboard():
             st.metric("System Health", f"{friday_doc.get('system_health', {}).get('health_score', 50)}/100")
         else:
             st.metric("System Health", "N/A")
-    with exec_col4:
-        col_btn1, col_btn2, col_btn3 = st.columns(3)
-        with col_btn1:
-            if st.button("Pre-Market", type="secondary", key="premarket_btn"):
-                _run_premarket_analysis()
-        with col_btn2:
-            if st.button("Position Status", type="secondary", key="position_btn"):
-                _run_position_status()
-        with col_btn3:
-            if st.button("Friday Close", type="secondary", key="friday_btn"):
-                _run_friday_close()
+    with col_btn1:
+        if st.button("Pre-Market", type="secondary", key="premarket_btn"):
+            _run_premarket_analysis()
+    with col_btn2:
+        if st.button("Position Status", type="secondary", key="position_btn"):
+            _run_position_status()
+    with col_btn3:
+        if st.button("Friday Close", type="secondary", key="friday_btn"):
+            _run_friday_close()
+    with col_btn4:
+        if st.button("Morning Check", type="primary", key="morning_btn"):
+            _run_morning_check()
 
     st.markdown("---")
 
     # Phase 8: Weekly Recommendations Section (was Phase 9)
     st.subheader("Weekly Recommendations (Phase 8)")
 
-    # Get Phase 9 stats
-    rec_doc = db.weekly_recommendations.find_one(
-        {"status": {"$ne": "expired"}},
-        sort=[("week_start", -1)]
-    )
+    rec_doc = stats["rec_doc"]
 
-    rec_col1, rec_col2, rec_col3, rec_col4, rec_col5 = st.columns([1, 1, 1, 1, 2])
+    rec_col1, rec_col2, rec_col3, rec_col4, col_btn1, col_btn2 = st.columns(6)
 
     with rec_col1:
         if rec_doc:
@@ -587,49 +815,44 @@ def render_dashboard():
             st.metric("Regime", rec_doc.get("market_regime", "N/A").upper())
         else:
             st.metric("Regime", "N/A")
-    with rec_col5:
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("Generate Recommendations", type="secondary", key="rec_btn"):
-                _run_weekly_recommendation()
-        with col_btn2:
-            if st.button("FULL WEEKLY PIPELINE", type="primary", key="weekly_btn"):
-                _run_complete_weekly_pipeline()
+    with col_btn1:
+        if st.button("Generate Recommendations", type="secondary", key="rec_btn"):
+            _run_weekly_recommendation()
+    with col_btn2:
+        if st.button("FULL WEEKLY PIPELINE", type="primary", key="weekly_btn"):
+            _run_complete_weekly_pipeline()
+
+    if _WEEKLY_RUN_PARAM in st.query_params:
+        _weekly_pipeline_progress()
+
+    if st.session_state.get(_BACKGROUND_RUNS):
+        _background_runs_pane()
+    elif st.session_state.get(_FINISHED_RUNS):
+        _workflow_result_pane()
 
     if rec_doc:
         st.caption(f"Week of {rec_doc.get('week_start', 'N/A')}")
     else:
         st.caption("No recommendations yet - Run weekly pipeline")
 
+    weekly_run = stats["weekly_run"]
+    if weekly_run:
+        with st.expander(f"Last full weekly pipeline: {weekly_run['ts']:%Y-%m-%d %H:%M} UTC"):
+            st.markdown(_result_summary("complete_weekly_pipeline", weekly_run["summary"]))
+
     st.markdown("---")
 
     # Stock Universe section
     st.subheader("Stock Universe")
 
-    # Tabs for different views
-    tab_setups, tab_liquidity, tab_consistency, tab_momentum, tab_quality, tab_all = st.tabs([
-        f"Trade Setups ({setups_qualified})",
-        f"Liquidity Qualified ({liquidity_qualified})",
-        f"Consistency Qualified ({consistency_qualified})",
-        f"Momentum Qualified ({momentum_qualified})",
-        "High Quality (Score >= 60)",
-        "All Stocks",
-    ])
-
-    with tab_setups:
-        render_trade_setups(db)
-
-    with tab_liquidity:
-        render_liquidity_stocks(db)
-
-    with tab_consistency:
-        render_consistency_stocks(db)
-
-    with tab_momentum:
-        render_momentum_stocks(db)
-
-    with tab_quality:
-        render_paginated_stock_list(
+    # View selector: st.tabs would run every tab body on each rerun, so only
+    # the selected view is rendered (and queried)
+    views = {
+        f"Trade Setups ({setups_qualified})": lambda: render_trade_setups(db),
+        f"Liquidity Qualified ({liquidity_qualified})": lambda: render_liquidity_stocks(db),
+        f"Consistency Qualified ({consistency_qualified})": lambda: render_consistency_stocks(db),
+        f"Momentum Qualified ({momentum_qualified})": lambda: render_momentum_stocks(db),
+        "High Quality (Score >= 60)": lambda: render_paginated_stock_list(
             db=db,
             base_query={"is_active": True, "quality_score": {"$gte": 60}},
             total_count=high_quality,
@@ -637,10 +860,8 @@ def render_dashboard():
             search_key="quality_search",
             title="High Quality",
             show_quality=True,
-        )
-
-    with tab_all:
-        render_paginated_stock_list(
+        ),
+        "All Stocks": lambda: render_paginated_stock_list(
             db=db,
             base_query={"is_active": True},
             total_count=total_nse_eq,
@@ -648,7 +869,20 @@ def render_dashboard():
             search_key="nse_search",
             title="NSE EQ",
             show_quality=True,
-        )
+        ),
+    }
+    # Labels carry live counts, so select by position to keep the choice
+    # stable when a count changes
+    labels = list(views)
+    selected = st.radio(
+        "View",
+        range(len(labels)),
+        format_func=labels.__getitem__,
+        horizontal=True,
+        key="universe_tab",
+        label_visibility="collapsed",
+    )
+    views[labels[selected]]()
 
 
 def render_regime():
@@ -673,6 +907,17 @@ def render_regime():
         st.metric("Risk-Off", "0%")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_setups_json(_db, limit: int = 50) -> str:
+    """
+    Recent trade setups as a JSON export.
+
+    Reads raw BSON (TradeSetupRepository.get_recent_raw), so the documents
+    go straight to JSON without being decoded into dicts first.
+    """
+    return json_util.dumps(TradeSetupRepository(_db).get_recent_raw(limit=limit))
+
+
 def render_setups():
     """Render the trade setups page."""
     st.header("Trade Setups")
@@ -694,6 +939,13 @@ def render_setups():
 
     st.info(f"Use Dashboard 'Trade Setups' tab to view detected setups. Filters: {_setup_type}, {_status}, {_week}")
 
+    st.download_button(
+        "Export Recent Setups (JSON)",
+        data=_recent_setups_json(st.session_state.db),
+        file_name="recent_setups.json",
+        mime="application/json",
+    )
+
 
 def render_trades():
     """Render the trades page."""
@@ -727,6 +979,175 @@ def render_trades():
             st.metric("Total P&L", "Rs.0")
 
 
+# Columns rendered by render_paginated_stock_list (also the query projection)
+_QUALITY_COLUMNS = (
+    "symbol",
+    "name",
+    "quality_score",
+    "liquidity_tier",
+    "is_mtf",
+    "in_nifty_50",
+    "in_nifty_100",
+    "in_nifty_500",
+)
+_INSTRUMENT_COLUMNS = (
+    "symbol",
+    "name",
+    "instrument_key",
+    "lot_size",
+    "tick_size",
+    "security_type",
+)
+
+# Compact dtypes for the enum/flag columns of each column set: smaller
+# Arrow payload
+_QUALITY_DTYPES = {
+    "liquidity_tier": "category",
+    **dict.fromkeys(("is_mtf", "in_nifty_50", "in_nifty_100", "in_nifty_500"), "boolean"),
+}
+_INSTRUMENT_DTYPES = {}
+
+
+# Server-side time limit for list counts (milliseconds)
+_COUNT_MAX_TIME_MS = 1500
+
+
+def _count_matching(coll, query: dict) -> int:
+    """
+    Count documents matching a list query.
+
+    An empty query reads the collection metadata instead of counting. A
+    filtered count that exceeds _COUNT_MAX_TIME_MS falls back to that
+    estimate (an upper bound), so a slow count cannot stall the page.
+    """
+    if not query:
+        return coll.estimated_document_count()
+    try:
+        return coll.count_documents(query, maxTimeMS=_COUNT_MAX_TIME_MS)
+    except ExecutionTimeout:
+        return coll.estimated_document_count()
+
+
+def _symbol_prefix(search: str) -> dict:
+    """
+    Build a symbol prefix filter from a normalized search box value.
+
+    Symbols are stored uppercase, so the (stripped, uppercased) search is
+    matched as an anchored, case-sensitive regex, which MongoDB serves as an
+    index range scan instead of testing every symbol. Punctuation is escaped
+    rather than treated as a pattern, since NSE symbols such as M&M and
+    BAJAJ-AUTO contain it.
+    """
+    return {"$regex": f"^{re.escape(search)}"}
+
+
+def _keyset_after(sort: list, last_key: tuple) -> dict:
+    """
+    Build a filter for documents that sort strictly after last_key.
+
+    Lets pagination seek along the sort index instead of skipping over all
+    previous pages. Missing/null values sort lowest, so they come after any
+    value on a descending key and before any value on an ascending one.
+
+    Args:
+        sort: Sort specification, e.g. [("quality_score", -1), ("symbol", 1)]
+        last_key: Sort-key values of the last document on the previous page
+
+    Returns:
+        dict: MongoDB filter
+    """
+    branches = []
+    for i, (name, direction) in enumerate(sort):
+        equal = {prev_name: last_key[j] for j, (prev_name, _) in enumerate(sort[:i])}
+        value = last_key[i]
+        if direction == 1:
+            branch = {**equal, name: {"$ne": None} if value is None else {"$gt": value}}
+        elif value is None:
+            continue
+        else:
+            branch = {**equal, "$or": [{name: {"$lt": value}}, {name: None}]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+def _checkbox_columns(df) -> dict:
+    """
+    Column config rendering a table's boolean columns as checkboxes.
+
+    Pass/fail flags are drawn by the frontend instead of being styled cell
+    by cell through a pandas Styler on every rerun.
+    """
+    from pandas.api.types import is_bool_dtype
+
+    return {
+        col: st.column_config.CheckboxColumn(col)
+        for col in df.columns
+        if is_bool_dtype(df[col])
+    }
+
+
+def _fetch_page(collection, query: dict, projection, sort: list, after: tuple | None, limit: int) -> list[dict]:
+    """
+    Fetch one keyset page: the first `limit` documents sorting after `after`.
+
+    Args:
+        collection: Collection to query
+        query: Base filter
+        projection: Projection passed to find() (must keep the sort fields)
+        sort: Sort specification, ending in a unique tiebreaker
+        after: Sort key of the previous page's last document (None for page 1)
+        limit: Page size
+
+    Returns:
+        list[dict]: Documents of the page
+    """
+    if after is not None:
+        query = {"$and": [query, _keyset_after(sort, after)]}
+    return list(
+        collection.find(query, projection)
+        .sort(sort)
+        .limit(limit)
+        .batch_size(limit)
+    )
+
+
+def _page_count(count: int, limit: int) -> int:
+    """Number of `limit`-sized pages needed for `count` rows (at least 1)."""
+    return max(1, -(-count // limit))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_and_fetch_page(
+    _db, collection: str, query: dict, columns: tuple, sort: tuple, after: tuple | None, limit: int
+) -> tuple[int, int, list[dict]]:
+    """
+    Count a list query's matches and fetch the page following sort key
+    `after`, cached between reruns.
+
+    The count and the index-backed find run concurrently on worker threads,
+    so a page view waits for one MongoDB round trip instead of two. Projects
+    the displayed columns; _id is only returned when it is part of the sort
+    key (as the keyset tiebreaker).
+
+    Returns:
+        tuple: (match count, page count, page documents)
+    """
+    coll = _db[collection]
+    projection = dict.fromkeys(columns, 1)
+    if all(field != "_id" for field, _ in sort):
+        projection["_id"] = 0
+
+    async def gather():
+        return await asyncio.gather(
+            asyncio.to_thread(_count_matching, coll, query),
+            asyncio.to_thread(_fetch_page, coll, query, projection, list(sort), after, limit),
+        )
+
+    count, page = asyncio.run(gather())
+    return count, _page_count(count, limit), page
+
+
+@st.fragment
 def render_paginated_stock_list(
     db,
     base_query: dict,
@@ -746,15 +1167,16 @@ def render_paginated_stock_list(
         db: MongoDB database connection
         base_query: Base MongoDB query dict (e.g., {"is_active": True})
         total_count: Total number of documents matching base query
-        page_key: Session state key for pagination (must be unique per list)
+        page_key: Session state key for the pagination cursor stack
+            (must be unique per list)
         search_key: Session state key for search box (must be unique per list)
         title: Display title for the list
         show_quality: If True, display quality-related columns (score, tier, indices)
 
     Features:
         - 50 items per page
-        - Symbol search with case-insensitive regex
-        - Prev/Next pagination buttons
+        - Symbol prefix search (anchored regex, uses the symbol index)
+        - Prev/Next keyset pagination (index seek, no skip)
         - Shows "X-Y of Z" counter
         - Resets to page 1 on new search
         - Sorts by quality_score (desc) if show_quality=True
@@ -769,71 +1191,55 @@ def render_paginated_stock_list(
     # Make a copy of the query to avoid modifying the original
     query = base_query.copy()
 
-    # Initialize session state for pagination
+    # Initialize session state for pagination: a stack holding the sort key
+    # of the last row of every page before the current one
     if page_key not in st.session_state:
-        st.session_state[page_key] = 0
+        st.session_state[page_key] = []
+    cursors = st.session_state[page_key]
 
     # Search box
     search = st.text_input(
         "Search Symbol",
         placeholder="e.g., RELIANCE",
         key=search_key,
-    )
+    ).strip().upper()
 
     # Apply search filter
     if search:
-        query["symbol"] = {"$regex": search.upper(), "$options": "i"}
+        query["symbol"] = _symbol_prefix(search)
         # Reset to first page on search
         if st.session_state.get(f"{search_key}_prev") != search:
-            st.session_state[page_key] = 0
+            cursors.clear()
         st.session_state[f"{search_key}_prev"] = search
 
-    # Get filtered count
-    filtered_count = db.stocks.count_documents(query)
-    total_pages = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    current_page = st.session_state[page_key]
-
-    # Ensure current page is valid
-    if current_page >= total_pages:
-        current_page = total_pages - 1
-        st.session_state[page_key] = current_page
+    # Get filtered count and stocks for current page (sort by quality_score
+    # if available)
+    sort_field = (("quality_score", -1), ("symbol", 1)) if show_quality else (("symbol", 1),)
+    display_cols = _QUALITY_COLUMNS if show_quality else _INSTRUMENT_COLUMNS
+    dtypes = _QUALITY_DTYPES if show_quality else _INSTRUMENT_DTYPES
+    after = cursors[-1] if cursors else None
+    filtered_count, total_pages, stocks = _count_and_fetch_page(
+        db, "stocks", query, display_cols, sort_field, after, PAGE_SIZE
+    )
 
-    # Fetch stocks for current page (sort by quality_score if available)
+    # Ensure current page is valid (the list shrank since the cursor was taken)
+    if len(cursors) > total_pages - 1:
+        del cursors[total_pages - 1:]
+        after = cursors[-1] if cursors else None
+        filtered_count, total_pages, stocks = _count_and_fetch_page(
+            db, "stocks", query, display_cols, sort_field, after, PAGE_SIZE
+        )
+    current_page = len(cursors)
     skip = current_page * PAGE_SIZE
-    sort_field = [("quality_score", -1), ("symbol", 1)] if show_quality else [("symbol", 1)]
-    stocks = list(
-        db.stocks.find(query, {"_id": 0})
-        .sort(sort_field)
-        .skip(skip)
-        .limit(PAGE_SIZE)
-    )
 
     # Display dataframe
     if stocks:
-        df = pd.DataFrame(stocks)
-        if show_quality:
-            display_cols = [
-                "symbol",
-                "name",
-                "quality_score",
-                "liquidity_tier",
-                "is_mtf",
-                "in_nifty_50",
-                "in_nifty_100",
-                "in_nifty_500",
-            ]
-        else:
-            display_cols = [
-                "symbol",
-                "name",
-                "instrument_key",
-                "lot_size",
-                "tick_size",
-                "security_type",
-            ]
-        display_cols = [c for c in display_cols if c in df.columns]
+        # Imported here so pages without tables skip the pandas import
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(stocks, columns=list(display_cols)).astype(dtypes)
         st.dataframe(
-            df[display_cols],
+            df,
             width="stretch",
             hide_index=True,
             height=400,
@@ -848,329 +1254,334 @@ def render_paginated_stock_list(
             st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
 
         with col_prev:
-            if st.button("Prev", key=f"{page_key}_prev", disabled=current_page == 0):
-                st.session_state[page_key] = current_page - 1
-                st.rerun()
+            st.button(
+                "Prev", key=f"{page_key}_prev", disabled=current_page == 0, on_click=cursors.pop
+            )
 
         with col_page:
             st.caption(f"Page {current_page + 1} of {total_pages}")
 
         with col_next:
-            if st.button(
-                "Next", key=f"{page_key}_next", disabled=current_page >= total_pages - 1
-            ):
-                st.session_state[page_key] = current_page + 1
-                st.rerun()
+            st.button(
+                "Next",
+                key=f"{page_key}_next",
+                disabled=current_page >= total_pages - 1,
+                on_click=cursors.append,
+                args=(tuple(stocks[-1].get(field) for field, _ in sort_field),),
+            )
     else:
         st.info("No stocks found matching your criteria.")
 
 
-def render_consistency_stocks(db):
-    """Render the consistency-qualified stocks list."""
-    PAGE_SIZE = 50
-
-    # Initialize session state for pagination
-    if "consistency_page" not in st.session_state:
-        st.session_state.consistency_page = 0
-
-    # Search box
-    search = st.text_input(
-        "Search Symbol",
-        placeholder="e.g., RELIANCE",
-        key="consistency_search",
-    )
-
-    # Build query
-    query = {"qualifies": True}
-    if search:
-        query["symbol"] = {"$regex": search.upper(), "$options": "i"}
-        if st.session_state.get("consistency_search_prev") != search:
-            st.session_state.consistency_page = 0
-        st.session_state.consistency_search_prev = search
-
-    # Get filtered count
-    filtered_count = db.consistency_scores.count_documents(query)
-    total_pages = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    current_page = st.session_state.consistency_page
-
-    # Ensure current page is valid
-    if current_page >= total_pages:
-        current_page = total_pages - 1
-        st.session_state.consistency_page = current_page
-
-    # Fetch stocks for current page
-    skip = current_page * PAGE_SIZE
-    stocks = list(
-        db.consistency_scores.find(query, {"_id": 0})
-        .sort("final_score", -1)
-        .skip(skip)
-        .limit(PAGE_SIZE)
-    )
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Declarative description of a paginated dashboard table.
+
+    render_paginated_table() owns the shared search, count, keyset fetch,
+    rendering and pagination logic; each table only supplies its spec.
+
+    Attributes:
+        collection: MongoDB collection name
+        base_query: Filter selecting the rows to list
+        sort: Sort specification, ending in the unique _id tiebreaker
+        display_cols: Columns shown (also the query projection)
+        key_prefix: Prefix for the table's session state and widget keys
+        empty_msg: Message shown when no rows match
+        page_size: Rows per page
+        height: Table height in pixels
+        searchable: Show the symbol search box
+        filter_field: Field filtered by an optional selectbox
+        filter_label: Selectbox label
+        filter_options: Selectbox options ("All" disables the filter)
+        price_cols: Columns formatted as prices
+        dtypes: Column dtypes applied when the page frame is built (pass/fail
+            flags as nullable booleans, enums as categories)
+    """
 
-    # Display dataframe
-    if stocks:
-        df = pd.DataFrame(stocks)
-        display_cols = [
-            "symbol",
-            "final_score",
-            "consistency_score",
-            "regime_score",
-            "pos_pct_52w",
-            "plus3_pct_52w",
-            "std_dev_52w",
-            "sharpe_52w",
-            "filters_passed",
+    collection: str
+    base_query: dict
+    sort: tuple
+    display_cols: tuple
+    key_prefix: str
+    empty_msg: str
+    page_size: int = 50
+    height: int = 400
+    searchable: bool = True
+    filter_field: str | None = None
+    filter_label: str = ""
+    filter_options: tuple = ()
+    price_cols: tuple = ()
+    dtypes: dict = field(default_factory=dict)
+
+
+CONSISTENCY_TABLE = TableSpec(
+    collection="consistency_scores",
+    base_query={"qualifies": True},
+    sort=(("final_score", -1), ("_id", 1)),
+    display_cols=(
+        "symbol",
+        "final_score",
+        "consistency_score",
+        "regime_score",
+        "pos_pct_52w",
+        "plus3_pct_52w",
+        "std_dev_52w",
+        "sharpe_52w",
+        "filters_passed",
+        "passes_pos_pct",
+        "passes_plus3_pct",
+        "passes_volatility",
+        "passes_sharpe",
+        "passes_consistency",
+        "passes_regime",
+    ),
+    key_prefix="consistency",
+    empty_msg="No consistency-qualified stocks found. Run 'Consistency Filter' to analyze stocks.",
+    dtypes=dict.fromkeys(
+        (
             "passes_pos_pct",
             "passes_plus3_pct",
             "passes_volatility",
             "passes_sharpe",
             "passes_consistency",
             "passes_regime",
-        ]
-        display_cols = [c for c in display_cols if c in df.columns]
+        ),
+        "boolean",
+    ),
+)
 
-        # Style boolean columns
-        def style_bool(val):
-            if isinstance(val, bool):
-                return "background-color: #90EE90" if val else "background-color: #FFB6C1"
-            return ""
+MOMENTUM_TABLE = TableSpec(
+    collection="momentum_scores",
+    base_query={"qualifies": True},
+    sort=(("momentum_score", -1), ("_id", 1)),
+    display_cols=(
+        "symbol",
+        "momentum_score",
+        "filters_passed",
+        "proximity_52w",
+        "ma_alignment_score",
+        "rs_3m",
+        "volatility_ratio",
+        "filter_2a_pass",
+        "filter_2b_pass",
+        "filter_2c_pass",
+        "filter_2d_pass",
+        "filter_2e_pass",
+    ),
+    key_prefix="momentum",
+    empty_msg="No momentum-qualified stocks found. Run 'Momentum Filter' to analyze stocks.",
+    dtypes=dict.fromkeys(
+        (
+            "filter_2a_pass",
+            "filter_2b_pass",
+            "filter_2c_pass",
+            "filter_2d_pass",
+            "filter_2e_pass",
+        ),
+        "boolean",
+    ),
+)
 
-        styled_df = df[display_cols].style.map(style_bool)
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            hide_index=True,
-            height=400,
-        )
+LIQUIDITY_TABLE = TableSpec(
+    collection="liquidity_scores",
+    base_query={"liq_qualifies": True},
+    sort=(("liquidity_score", -1), ("_id", 1)),
+    display_cols=(
+        "symbol",
+        "liquidity_score",
+        "turnover_20d_cr",
+        "turnover_60d_cr",
+        "vol_ratio_5d",
+        "vol_stability",
+        "circuit_hits_30d",
+        "avg_gap_pct",
+        "passes_liq_score",
+        "passes_turnover",
+        "passes_circuit",
+        "passes_gap",
+    ),
+    key_prefix="liquidity",
+    empty_msg="No liquidity-qualified stocks found. Run 'Volume Filter' to analyze stocks.",
+    dtypes=dict.fromkeys(
+        (
+            "passes_liq_score",
+            "passes_turnover",
+            "passes_circuit",
+            "passes_gap",
+        ),
+        "boolean",
+    ),
+)
 
-        # Pagination controls
-        col_info, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
+SETUPS_TABLE = TableSpec(
+    collection="trade_setups",
+    base_query={"qualifies": True, "status": "active"},
+    sort=(("rank", 1), ("_id", 1)),
+    display_cols=(
+        "rank",
+        "symbol",
+        "type",
+        "entry_low",
+        "entry_high",
+        "stop",
+        "target_1",
+        "target_2",
+        "rr_ratio",
+        "confidence",
+        "overall_quality",
+        "momentum_score",
+        "consistency_score",
+        "liquidity_score",
+    ),
+    key_prefix="setups",
+    empty_msg="No trade setups found. Run 'Setup Detection' to find trading opportunities.",
+    page_size=20,
+    height=500,
+    searchable=False,
+    filter_field="type",
+    filter_label="Setup Type",
+    filter_options=("All", "PULLBACK", "VCP_BREAKOUT", "RETEST", "GAP_FILL"),
+    price_cols=("entry_low", "entry_high", "stop", "target_1", "target_2"),
+    dtypes={"type": "category"},
+)
 
-        with col_info:
-            start_idx = skip + 1
-            end_idx = min(skip + PAGE_SIZE, filtered_count)
-            st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
 
-        with col_prev:
-            if st.button("Prev", key="consistency_prev", disabled=current_page == 0):
-                st.session_state.consistency_page = current_page - 1
-                st.rerun()
+def render_paginated_table(db, spec: TableSpec):
+    """
+    Render a paginated table described by a TableSpec.
 
-        with col_page:
-            st.caption(f"Page {current_page + 1} of {total_pages}")
+    Features:
+        - Optional symbol prefix search and selectbox filter; changing
+          either returns to page 1
+        - Count and index-backed keyset page fetched concurrently (cached)
+        - Boolean columns as checkboxes, price columns formatted in the
+          frontend
+        - Prev/Next pagination with a "X-Y of Z" counter
 
-        with col_next:
-            if st.button(
-                "Next", key="consistency_next", disabled=current_page >= total_pages - 1
-            ):
-                st.session_state.consistency_page = current_page + 1
-                st.rerun()
-    else:
-        st.info("No consistency-qualified stocks found. Run 'Consistency Filter' to analyze stocks.")
+    Args:
+        db: MongoDB database connection
+        spec: Table description
+    """
+    prefix = spec.key_prefix
+    page_size = spec.page_size
 
+    # Initialize session state for pagination: sort keys of the last row of
+    # every page before the current one
+    cursors_key = f"{prefix}_cursors"
+    if cursors_key not in st.session_state:
+        st.session_state[cursors_key] = []
+    cursors = st.session_state[cursors_key]
 
-def render_momentum_stocks(db):
-    """Render the momentum-qualified stocks list."""
-    PAGE_SIZE = 50
+    query = dict(spec.base_query)
+    selection = {}
 
-    # Initialize session state for pagination
-    if "momentum_page" not in st.session_state:
-        st.session_state.momentum_page = 0
+    # Filter controls
+    if spec.filter_field:
+        col1, _ = st.columns([1, 3])
+        with col1:
+            choice = st.selectbox(spec.filter_label, spec.filter_options, key=f"{prefix}_filter")
+        selection["filter"] = choice
+        if choice != "All":
+            query[spec.filter_field] = choice
 
     # Search box
-    search = st.text_input(
-        "Search Symbol",
-        placeholder="e.g., RELIANCE",
-        key="momentum_search",
+    if spec.searchable:
+        search = st.text_input(
+            "Search Symbol",
+            placeholder="e.g., RELIANCE",
+            key=f"{prefix}_search",
+        ).strip().upper()
+        selection["search"] = search
+        if search:
+            query["symbol"] = _symbol_prefix(search)
+
+    # Reset to first page when the search or filter changes
+    if st.session_state.get(f"{prefix}_selection") != selection:
+        cursors.clear()
+    st.session_state[f"{prefix}_selection"] = selection
+
+    # Get filtered count and rows for current page (concurrent round trips)
+    after = cursors[-1] if cursors else None
+    filtered_count, total_pages, rows = _count_and_fetch_page(
+        db, spec.collection, query, spec.display_cols, spec.sort, after, page_size
     )
 
-    # Build query
-    query = {"qualifies": True}
-    if search:
-        query["symbol"] = {"$regex": search.upper(), "$options": "i"}
-        if st.session_state.get("momentum_search_prev") != search:
-            st.session_state.momentum_page = 0
-        st.session_state.momentum_search_prev = search
-
-    # Get filtered count
-    filtered_count = db.momentum_scores.count_documents(query)
-    total_pages = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    current_page = st.session_state.momentum_page
-
-    # Ensure current page is valid
-    if current_page >= total_pages:
-        current_page = total_pages - 1
-        st.session_state.momentum_page = current_page
-
-    # Fetch stocks for current page
-    skip = current_page * PAGE_SIZE
-    stocks = list(
-        db.momentum_scores.find(query, {"_id": 0})
-        .sort("momentum_score", -1)
-        .skip(skip)
-        .limit(PAGE_SIZE)
-    )
+    # Ensure current page is valid (the list shrank since the cursor was taken)
+    if len(cursors) > total_pages - 1:
+        del cursors[total_pages - 1:]
+        after = cursors[-1] if cursors else None
+        filtered_count, total_pages, rows = _count_and_fetch_page(
+            db, spec.collection, query, spec.display_cols, spec.sort, after, page_size
+        )
+    current_page = len(cursors)
+    skip = current_page * page_size
+
+    if not rows:
+        st.info(spec.empty_msg)
+        return
 
     # Display dataframe
-    if stocks:
-        df = pd.DataFrame(stocks)
-        display_cols = [
-            "symbol",
-            "momentum_score",
-            "filters_passed",
-            "proximity_52w",
-            "ma_alignment_score",
-            "rs_3m",
-            "volatility_ratio",
-            "filter_2a_pass",
-            "filter_2b_pass",
-            "filter_2c_pass",
-            "filter_2d_pass",
-            "filter_2e_pass",
-        ]
-        display_cols = [c for c in display_cols if c in df.columns]
+    import pandas as pd
+
+    # Declared dtypes instead of inference: pass/fail flags with gaps would
+    # otherwise load as object columns (no checkbox, no Arrow bit-packing)
+    df = pd.DataFrame.from_records(rows, columns=list(spec.display_cols)).astype(spec.dtypes)
+    price_format = st.column_config.NumberColumn(format="%.2f")
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        height=spec.height,
+        column_config={
+            **_checkbox_columns(df),
+            **{col: price_format for col in spec.price_cols},
+        },
+    )
 
-        # Style boolean columns
-        def style_bool(val):
-            if isinstance(val, bool):
-                return "background-color: #90EE90" if val else "background-color: #FFB6C1"
-            return ""
+    # Pagination controls
+    col_info, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
 
-        styled_df = df[display_cols].style.map(style_bool)
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            hide_index=True,
-            height=400,
-        )
+    with col_info:
+        start_idx = skip + 1
+        end_idx = min(skip + page_size, filtered_count)
+        st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
 
-        # Pagination controls
-        col_info, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
+    with col_prev:
+        st.button("Prev", key=f"{prefix}_prev", disabled=current_page == 0, on_click=cursors.pop)
 
-        with col_info:
-            start_idx = skip + 1
-            end_idx = min(skip + PAGE_SIZE, filtered_count)
-            st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
+    with col_page:
+        st.caption(f"Page {current_page + 1} of {total_pages}")
 
-        with col_prev:
-            if st.button("Prev", key="momentum_prev", disabled=current_page == 0):
-                st.session_state.momentum_page = current_page - 1
-                st.rerun()
+    with col_next:
+        st.button(
+            "Next",
+            key=f"{prefix}_next",
+            disabled=current_page >= total_pages - 1,
+            on_click=cursors.append,
+            args=(tuple(rows[-1].get(field) for field, _ in spec.sort),),
+        )
 
-        with col_page:
-            st.caption(f"Page {current_page + 1} of {total_pages}")
 
-        with col_next:
-            if st.button(
-                "Next", key="momentum_next", disabled=current_page >= total_pages - 1
-            ):
-                st.session_state.momentum_page = current_page + 1
-                st.rerun()
-    else:
-        st.info("No momentum-qualified stocks found. Run 'Momentum Filter' to analyze stocks.")
+@st.fragment
+def render_consistency_stocks(db):
+    """Render the consistency-qualified stocks list."""
+    render_paginated_table(db, CONSISTENCY_TABLE)
+
+
+@st.fragment
+def render_momentum_stocks(db):
+    """Render the momentum-qualified stocks list."""
+    render_paginated_table(db, MOMENTUM_TABLE)
 
 
+@st.fragment
 def render_liquidity_stocks(db):
     """Render the liquidity-qualified stocks list."""
-    PAGE_SIZE = 50
-
-    # Initialize session state for pagination
-    if "liquidity_page" not in st.session_state:
-        st.session_state.liquidity_page = 0
-
-    # Search box
-    search = st.text_input(
-        "Search Symbol",
-        placeholder="e.g., RELIANCE",
-        key="liquidity_search",
-    )
-
-    # Build query
-    query = {"liq_qualifies": True}
-    if search:
-        query["symbol"] = {"$regex": search.upper(), "$options": "i"}
-        if st.session_state.get("liquidity_search_prev") != search:
-            st.session_state.liquidity_page = 0
-        st.session_state.liquidity_search_prev = search
-
-    # Get filtered count
-    filtered_count = db.liquidity_scores.count_documents(query)
-    total_pages = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    current_page = st.session_state.liquidity_page
-
-    # Ensure current page is valid
-    if current_page >= total_pages:
-        current_page = total_pages - 1
-        st.session_state.liquidity_page = current_page
-
-    # Fetch stocks for current page
-    skip = current_page * PAGE_SIZE
-    stocks = list(
-        db.liquidity_scores.find(query, {"_id": 0})
-        .sort("liquidity_score", -1)
-        .skip(skip)
-        .limit(PAGE_SIZE)
-    )
-
-    # Display dataframe
-    if stocks:
-        df = pd.DataFrame(stocks)
-        display_cols = [
-            "symbol",
-            "liquidity_score",
-            "turnover_20d_cr",
-            "turnover_60d_cr",
-            "vol_ratio_5d",
-            "vol_stability",
-            "circuit_hits_30d",
-            "avg_gap_pct",
-            "passes_liq_score",
-            "passes_turnover",
-            "passes_circuit",
-            "passes_gap",
-        ]
-        display_cols = [c for c in display_cols if c in df.columns]
-
-        # Style boolean columns
-        def style_bool(val):
-            if isinstance(val, bool):
-                return "background-color: #90EE90" if val else "background-color: #FFB6C1"
-            return ""
-
-        styled_df = df[display_cols].style.map(style_bool)
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            hide_index=True,
-            height=400,
-        )
-
-        # Pagination controls
-        col_info, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
-
-        with col_info:
-            start_idx = skip + 1
-            end_idx = min(skip + PAGE_SIZE, filtered_count)
-            st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
-
-        with col_prev:
-            if st.button("Prev", key="liquidity_prev", disabled=current_page == 0):
-                st.session_state.liquidity_page = current_page - 1
-                st.rerun()
-
-        with col_page:
-            st.caption(f"Page {current_page + 1} of {total_pages}")
-
-        with col_next:
-            if st.button(
-                "Next", key="liquidity_next", disabled=current_page >= total_pages - 1
-            ):
-                st.session_state.liquidity_page = current_page + 1
-                st.rerun()
-    else:
-        st.info("No liquidity-qualified stocks found. Run 'Volume Filter' to analyze stocks.")
+    render_paginated_table(db, LIQUIDITY_TABLE)
 
 
+@st.fragment
 def render_trade_setups(db):
     """
     Render the trade setups list.
@@ -1202,102 +1613,623 @@ def render_trade_setups(db):
         - Shows "No setups found" if none available
         - Updates after running Setup Detection workflow
     """
-    PAGE_SIZE = 20
+    render_paginated_table(db, SETUPS_TABLE)
 
-    # Initialize session state for pagination
-    if "setups_page" not in st.session_state:
-        st.session_state.setups_page = 0
 
-    # Filter controls
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        setup_type = st.selectbox(
-            "Setup Type",
-            ["All", "PULLBACK", "VCP_BREAKOUT", "RETEST", "GAP_FILL"],
-            key="setup_type_filter",
-        )
+def _ranked_lines(
+    rows: list[dict], template: str, optional: tuple = (), limit: int = 10
+) -> str:
+    """
+    Format the top rows of a workflow result as an indented list.
 
-    # Build query
-    query = {"qualifies": True, "status": "active"}
-    if setup_type != "All":
-        query["type"] = setup_type
+    Args:
+        rows: Result rows, best first
+        template: str.format template over the row's fields plus {rank}
+            (1-based position)
+        optional: Numeric fields that may be missing from a row and then
+            format as 0; any other missing field raises KeyError
+        limit: Number of rows to list
 
-    # Get filtered count
-    filtered_count = db.trade_setups.count_documents(query)
-    total_pages = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    current_page = st.session_state.setups_page
+    Returns:
+        str: One indented line per row
+    """
+    defaults = dict.fromkeys(optional, 0)
+    return "\n".join([
+        "  " + template.format_map({**defaults, **row, "rank": rank})
+        for rank, row in enumerate(rows[:limit], 1)
+    ])
 
-    # Ensure current page is valid
-    if current_page >= total_pages:
-        current_page = total_pages - 1
-        st.session_state.setups_page = current_page
 
-    # Fetch setups for current page
-    skip = current_page * PAGE_SIZE
-    setups = list(
-        db.trade_setups.find(query, {"_id": 0, "df": 0})
-        .sort("rank", 1)
-        .skip(skip)
-        .limit(PAGE_SIZE)
+# Success message templates for the _run_* workflow runners, formatted with
+# the workflow result plus any derived fields
+_RESULT_SUMMARIES = {
+    "universe_setup": (
+        "Universe setup complete!\n\n"
+        "- NSE EQ: {total_nse_eq}\n"
+        "- MTF: {total_mtf}\n"
+        "- High Quality: {high_quality_count}\n"
+        "- Tier A: {tier_a_count}, B: {tier_b_count}, C: {tier_c_count}"
+    ),
+    "momentum_filter": (
+        "Momentum analysis complete!\n\n"
+        "- Analyzed: {total_analyzed}\n"
+        "- Qualified (4+ filters): {total_qualified}\n"
+        "- Avg Momentum Score: {avg_momentum_score:.1f}\n"
+        "- Nifty 3M Return: {nifty_return_3m:.1f}%\n\n"
+        "Top 10 by Momentum Score:\n"
+        "{top}"
+    ),
+    "universe_and_momentum": (
+        "Full weekend analysis complete!\n\n"
+        "**Universe Setup:**\n"
+        "- NSE EQ: {total_nse_eq}\n"
+        "- MTF: {total_mtf}\n"
+        "- High Quality: {high_quality_count}\n\n"
+        "**Momentum Analysis:**\n"
+        "- Analyzed: {momentum_analyzed}\n"
+        "- Qualified: {momentum_qualified}\n"
+        "- Avg Score: {avg_momentum_score:.1f}\n\n"
+        "Top 10 by Momentum Score:\n"
+        "{top}"
+    ),
+    "consistency_filter": (
+        "Consistency analysis complete!\n\n"
+        "- Analyzed: {total_analyzed}\n"
+        "- Qualified (5+ filters): {total_qualified}\n"
+        "- Avg Final Score: {avg_final_score:.1f}\n"
+        "- Avg Consistency Score: {avg_consistency_score:.1f}\n"
+        "- Market Regime: {market_regime}\n\n"
+        "Top 10 by Final Score:\n"
+        "{top}"
+    ),
+    "full_pipeline": (
+        "Full Pipeline (Phase 1-3) complete!\n\n"
+        "**Phase 1 - Universe Setup:**\n"
+        "- NSE EQ: {total_nse_eq}\n"
+        "- High Quality: {high_quality_count}\n\n"
+        "**Phase 2 - Momentum Filter:**\n"
+        "- Qualified: {momentum_qualified}\n\n"
+        "**Phase 3 - Consistency Filter:**\n"
+        "- Qualified: {consistency_qualified}\n"
+        "- Avg Final Score: {avg_final_score:.1f}\n"
+        "- Market Regime: {market_regime}\n\n"
+        "Top 10 by Final Score:\n"
+        "{top}"
+    ),
+    "volume_filter": (
+        "Volume & Liquidity analysis complete!\n\n"
+        "- Analyzed: {total_analyzed}\n"
+        "- Qualified: {total_qualified}\n"
+        "- Avg Liquidity Score: {avg_liquidity_score:.1f}\n"
+        "- Avg Turnover (20D): Rs.{avg_turnover_20d:.1f} Cr\n\n"
+        "Top 10 by Liquidity Score:\n"
+        "{top}"
+    ),
+    "setup_detection": (
+        "Setup Detection complete!\n\n"
+        "- Stocks Analyzed: {total_analyzed}\n"
+        "- Setups Found: {total_setups_found}\n"
+        "- Setups Qualified: {total_qualified}\n"
+        "- Avg Confidence: {avg_confidence:.1f}%\n"
+        "- Avg R:R Ratio: {avg_rr_ratio:.2f}\n"
+        "- Market Regime: {market_regime}\n"
+        "- By Type: {setup_types}\n\n"
+        "Top Setups:\n"
+        "{top}"
+    ),
+    "phase4_pipeline": (
+        "Phase 4 Pipeline complete!\n\n"
+        "**Phase 4A - Volume Filter:**\n"
+        "- Analyzed: {volume_analyzed}\n"
+        "- Qualified: {volume_qualified}\n"
+        "- Avg Liquidity: {avg_liquidity_score:.1f}\n\n"
+        "**Phase 4B - Setup Detection:**\n"
+        "- Setups Found: {setups_found}\n"
+        "- Setups Qualified: {setups_qualified}\n"
+        "- By Type: {setup_types}\n"
+        "- Avg Confidence: {avg_confidence:.1f}%\n"
+        "- Market Regime: {market_regime}\n\n"
+        "Top Setups:\n"
+        "{top}"
+    ),
+    "full_analysis": (
+        "Full Analysis Pipeline (Phase 1-4) complete!\n\n"
+        "**Phase 1 - Universe:**\n"
+        "- NSE EQ: {total_nse_eq}\n"
+        "- High Quality: {high_quality_count}\n\n"
+        "**Phase 2 - Momentum:**\n"
+        "- Qualified: {momentum_qualified}\n\n"
+        "**Phase 3 - Consistency:**\n"
+        "- Qualified: {consistency_qualified}\n\n"
+        "**Phase 4 - Setups:**\n"
+        "- Liquidity Qualified: {liquidity_qualified}\n"
+        "- Trade Setups: {setups_qualified}\n"
+        "- By Type: {setup_types}\n"
+        "- Market Regime: {market_regime}\n\n"
+        "Top Trade Setups:\n"
+        "{top}"
+    ),
+    "fundamental_data_refresh": (
+        "Fundamental Data Refresh complete!\n\n"
+        "This data will be used by Phase 1 (Universe Setup) for weekly filtering.\n\n"
+        "- Symbols Analyzed: {symbols_analyzed}\n"
+        "- Fundamental Saved: {fundamental_saved}\n"
+        "- Fundamental Qualified: {fundamental_qualified}\n"
+        "- Holdings Saved: {holdings_saved}\n"
+        "- Holdings Qualified: {holdings_qualified}\n"
+        "- Combined Qualified: {combined_qualified}\n"
+        "- Avg Score: {avg_fundamental_score:.1f}\n\n"
+        "Top 10 by Fundamental Score:\n"
+        "{top}"
+    ),
+    "risk_geometry": (
+        "Risk Geometry complete!\n\n"
+        "- Setups Analyzed: {setups_analyzed}\n"
+        "- Risk Qualified: {risk_qualified}\n"
+        "- Total Risk: Rs.{total_risk:,.0f}\n"
+        "- Total Value: Rs.{total_value:,.0f}\n"
+        "- Avg R:R Ratio: {avg_rr_ratio:.2f}\n\n"
+        "Top Positions:\n"
+        "{top}"
+    ),
+    "portfolio_construction": (
+        "Portfolio Construction complete!\n\n"
+        "- Input Setups: {setups_input}\n"
+        "- After Correlation: {after_correlation_filter}\n"
+        "- After Sector Limits: {after_sector_limits}\n"
+        "- Final Positions: {final_positions}\n"
+        "- Invested %: {total_invested_pct:.1f}%\n"
+        "- Risk %: {total_risk_pct:.1f}%\n"
+        "- Cash Reserve %: {cash_reserve_pct:.1f}%\n"
+        "- Sector Allocation: {sector_alloc}\n\n"
+        "Final Positions:\n"
+        "{top}"
+    ),
+    "premarket_analysis": (
+        "Pre-Market Analysis complete!\n\n"
+        "- Total Setups: {total_setups}\n"
+        "- ENTER: {enter_count}\n"
+        "- SKIP: {skip_count}\n"
+        "- WAIT: {wait_count}\n\n"
+        "Gap Analysis:\n"
+        "{top}"
+    ),
+    "position_status": (
+        "Position Status Updated!\n\n"
+        "- Total Positions: {total_positions}\n"
+        "- In Profit: {in_profit}\n"
+        "- In Loss: {in_loss}\n"
+        "- Stopped Out: {stopped_out}\n"
+        "- Target Hit: {target_hit}\n"
+        "- Total P&L: Rs.{total_pnl:,.0f}\n"
+        "- Total R: {total_r_multiple:.2f}R\n\n"
+        "Alerts:\n"
+        "{alerts}"
+    ),
+    "friday_close": (
+        "Friday Summary Generated!\n\n"
+        "**Week: {week_start} to {week_end}**\n\n"
+        "- Total Trades: {total_trades}\n"
+        "- Wins: {wins}, Losses: {losses}\n"
+        "- Win Rate: {win_rate:.1f}%\n"
+        "- Realized P&L: Rs.{realized_pnl:,.0f}\n"
+        "- Unrealized P&L: Rs.{unrealized_pnl:,.0f}\n"
+        "- Total P&L: Rs.{total_pnl:,.0f}\n"
+        "- Total R: {total_r:.2f}R\n\n"
+        "**System Health: {system_health_score}/100**\n"
+        "Recommended Action: {recommended_action}"
+    ),
+    "weekly_recommendation": (
+        "Weekly Recommendations Generated!\n\n"
+        "**Week of {week_display}**\n"
+        "- Market Regime: {market_regime}\n"
+        "- Confidence: {regime_confidence:.0f}%\n\n"
+        "- Total Setups: {total_setups}\n"
+        "- Allocated Capital: Rs.{allocated_capital:,.0f}\n"
+        "- Allocated %: {allocated_pct:.1f}%\n"
+        "- Total Risk %: {total_risk_pct:.1f}%\n\n"
+        "View recommendations in the Phase 9 section."
+    ),
+    "complete_weekly_pipeline": (
+        "Complete Weekly Pipeline Finished!\n\n"
+        "**Week of {week_display}**\n"
+        "- Market Regime: {market_regime}\n\n"
+        "**Pipeline Summary:**\n"
+        "- Phase 4B (Setups): {phase_4_setups}\n"
+        "- Phase 5 (Fundamental): {phase_5_fundamental}\n"
+        "- Phase 6 (Risk): {phase_6_risk_qualified}\n"
+        "- Phase 7 (Portfolio): {phase_7_final_positions}\n\n"
+        "**Final Output:**\n"
+        "- Total Recommendations: {total_setups}\n"
+        "- Allocated Capital: Rs.{allocated_capital:,.0f}\n"
+        "- Allocated %: {allocated_pct:.1f}%\n"
+        "- Total Risk %: {total_risk_pct:.1f}%\n\n"
+        "View detailed recommendations in Phase 9 section."
+    ),
+}
+
+# Ranked list appended to a summary as {top}: (result field, row template,
+# numeric row fields that default to 0 when missing)
+_RESULT_TOP_N = {
+    "momentum_filter": (
+        "top_10",
+        "{rank}. {symbol}: {momentum_score:.1f} ({filters_passed}/5 filters)",
+    ),
+    "universe_and_momentum": (
+        "top_10",
+        "{rank}. {symbol}: {momentum_score:.1f}",
+    ),
+    "consistency_filter": (
+        "top_10",
+        "{rank}. {symbol}: {final_score:.1f} (C:{consistency_score:.1f}, R:{regime_score:.2f})",
+    ),
+    "full_pipeline": (
+        "top_10",
+        "{rank}. {symbol}: {final_score:.1f}",
+    ),
+    "volume_filter": (
+        "top_10",
+        "{rank}. {symbol}: {liquidity_score:.1f} (T/O: Rs.{turnover_20d_cr:.1f}Cr)",
+    ),
+    "setup_detection": (
+        "top_setups",
+        "{rank}. {symbol} ({type}): Entry {entry_low:.0f}-{entry_high:.0f}, Stop {stop:.0f}, R:R {rr_ratio:.1f}",
+        ("entry_low", "entry_high", "stop", "rr_ratio"),
+    ),
+    "phase4_pipeline": (
+        "top_setups",
+        "{rank}. {symbol} ({type}): R:R {rr_ratio:.1f}",
+        ("rr_ratio",),
+    ),
+    "full_analysis": (
+        "top_setups",
+        "{rank}. {symbol} ({type}): Entry {entry_low:.0f}-{entry_high:.0f}",
+        ("entry_low", "entry_high"),
+    ),
+    "fundamental_data_refresh": (
+        "top_10",
+        "{rank}. {symbol}: {fundamental_score:.1f}",
+    ),
+    "risk_geometry": (
+        "top_positions",
+        "{rank}. {symbol}: Entry {entry:.0f}, Stop {stop:.0f}, R:R {rr_ratio:.1f}",
+    ),
+    "portfolio_construction": (
+        "positions",
+        "{rank}. {symbol}: {shares} shares, Rs.{position_value:,.0f}",
+        ("shares", "position_value"),
+    ),
+    "premarket_analysis": (
+        "gap_analyses",
+        "{symbol}: {action} ({reason:.50}...)",
+    ),
+}
+
+
+# Template fields derived from the result rather than read from it
+_RESULT_FIELDS = {
+    "setup_detection": lambda r: {"setup_types": _joined_counts(r["setups_by_type"])},
+    "phase4_pipeline": lambda r: {"setup_types": _joined_counts(r["setups_by_type"])},
+    "full_analysis": lambda r: {"setup_types": _joined_counts(r["setups_by_type"])},
+    "portfolio_construction": lambda r: {
+        "sector_alloc": ", ".join(f"{k}: {v:.1f}%" for k, v in r["sector_allocation"].items())
+    },
+    "position_status": lambda r: {"alerts": "\n".join(r["alerts"][:10]) or "No alerts"},
+    "weekly_recommendation": lambda r: {"market_regime": r["market_regime"].upper()},
+    "complete_weekly_pipeline": lambda r: {"market_regime": r["market_regime"].upper()},
+}
+
+
+def _joined_counts(counts: dict) -> str:
+    """Join a {name: count} mapping as "name: count, ..."."""
+    return ", ".join(f"{k}: {v}" for k, v in counts.items())
+
+
+def _result_summary(kind: str, result: dict) -> str:
+    """
+    Format the success message of a workflow run.
+
+    Args:
+        kind: Key into _RESULT_SUMMARIES
+        result: Result dict returned by the start_workflow entry point
+            (derived fields come from _RESULT_FIELDS, {top} from _RESULT_TOP_N)
+
+    Returns:
+        str: Markdown success message
+    """
+    fields = _RESULT_FIELDS[kind](result) if kind in _RESULT_FIELDS else {}
+    if kind in _RESULT_TOP_N:
+        field, template, *optional = _RESULT_TOP_N[kind]
+        fields["top"] = _ranked_lines(result[field], template, *optional)
+    return _RESULT_SUMMARIES[kind].format_map({**result, **fields})
+
+
+def _persist_run(kind: str, result: dict) -> None:
+    """
+    Record a successful workflow run in the workflow_runs collection.
+
+    Uses an acknowledged write: the dashboard's "last run" expander reads
+    this record on the next page run.
+
+    Args:
+        kind: Workflow key (as in _RESULT_SUMMARIES)
+        result: Result dict returned by the start_workflow entry point
+    """
+    db = st.session_state.get("db")
+    if db is None:
+        return
+    db.workflow_runs.insert_one(
+        {"kind": kind, "ts": datetime.now(timezone.utc), "summary": result}
     )
 
-    # Display dataframe
-    if setups:
-        df = pd.DataFrame(setups)
-        display_cols = [
-            "rank",
-            "symbol",
-            "type",
-            "entry_low",
-            "entry_high",
-            "stop",
-            "target_1",
-            "target_2",
-            "rr_ratio",
-            "confidence",
-            "overall_quality",
-            "momentum_score",
-            "consistency_score",
-            "liquidity_score",
-        ]
-        display_cols = [c for c in display_cols if c in df.columns]
 
-        # Format numeric columns
-        for col in ["entry_low", "entry_high", "stop", "target_1", "target_2"]:
-            if col in df.columns:
-                df[col] = df[col].apply(lambda x: f"{x:,.2f}" if pd.notnull(x) else "")
+@st.cache_resource
+def _workflow_runtime():
+    """
+    Start the event loop and Temporal client shared by workflow buttons.
 
-        st.dataframe(
-            df[display_cols],
-            use_container_width=True,
-            hide_index=True,
-            height=500,
-        )
+    The loop runs forever on a daemon thread so sessions can submit
+    workflows from their own script threads; connecting the client once
+    means later clicks reuse its channel instead of reconnecting.
 
-        # Pagination controls
-        col_info, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
+    Returns:
+        tuple: (event loop, Temporal client)
 
-        with col_info:
-            start_idx = skip + 1
-            end_idx = min(skip + PAGE_SIZE, filtered_count)
-            st.caption(f"Showing {start_idx}-{end_idx} of {filtered_count}")
+    Raises:
+        ConnectionError: If the Temporal client cannot connect.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="temporal-loop").start()
+    try:
+        client = asyncio.run_coroutine_threadsafe(get_temporal_client(), loop).result()
+    except Exception as e:
+        # Not cached on failure, so the next click retries with a fresh loop
+        loop.call_soon_threadsafe(loop.stop)
+        raise ConnectionError(f"Failed to connect to Temporal: {e}") from e
+    # Stop the loop on interpreter shutdown instead of killing it mid-call
+    atexit.register(loop.call_soon_threadsafe, loop.stop)
+    return loop, client
+
+
+# Workflow failures reported in the UI: the run failed or was cancelled,
+# Temporal rejected a call, or the server was unreachable. Anything else is
+# a bug and propagates.
+_WORKFLOW_ERRORS = (WorkflowFailureError, RPCError, ConnectionError, TimeoutError)
+
+
+def _run_workflow(start, **kwargs):
+    """
+    Run a start_workflow entry point on the shared loop and wait for it.
 
-        with col_prev:
-            if st.button("Prev", key="setups_prev", disabled=current_page == 0):
-                st.session_state.setups_page = current_page - 1
-                st.rerun()
+    Args:
+        start: Coroutine function from trade_analyzer.workers.start_workflow
+        **kwargs: Extra arguments for the entry point
 
-        with col_page:
-            st.caption(f"Page {current_page + 1} of {total_pages}")
+    Returns:
+        The entry point's result
+    """
+    loop, client = _workflow_runtime()
+    return asyncio.run_coroutine_threadsafe(start(client=client, **kwargs), loop).result()
 
-        with col_next:
-            if st.button(
-                "Next", key="setups_next", disabled=current_page >= total_pages - 1
-            ):
-                st.session_state.setups_page = current_page + 1
-                st.rerun()
-    else:
-        st.info("No trade setups found. Run 'Setup Detection' to find trading opportunities.")
+
+# Session state key for workflows running in the background: kind -> (label, future)
+_BACKGROUND_RUNS = "background_runs"
+# Session state key for finished workflow runs: kind -> (success, message)
+_FINISHED_RUNS = "finished_runs"
+
+
+def _start_background_run(kind: str) -> None:
+    """
+    Submit a background workflow without waiting for it.
+
+    For workflows that finish in seconds to a minute: the script thread
+    returns at once so the page stays usable, and _background_runs_pane()
+    picks up the result when the future completes.
+
+    Args:
+        kind: Key into WORKFLOWS
+    """
+    spec = WORKFLOWS[kind]
+    try:
+        loop, client = _workflow_runtime()
+    except _WORKFLOW_ERRORS as e:
+        logger.exception("Failed to start workflow %s", kind)
+        _record_finished(kind, False, f"Failed to run workflow: {e}")
+        return
+
+    future = asyncio.run_coroutine_threadsafe(spec.start(client=client), loop)
+    st.session_state.setdefault(_BACKGROUND_RUNS, {})[kind] = (spec.label, future)
+    st.toast(f"{spec.label} started")
+
+
+def _record_finished(kind: str, success: bool, message: str) -> None:
+    """Keep a finished run's message for the workflow result pane."""
+    st.session_state.setdefault(_FINISHED_RUNS, {})[kind] = (success, message)
+
+
+def _render_finished_runs() -> None:
+    """Show the finished run messages with a button to dismiss them."""
+    finished = st.session_state.get(_FINISHED_RUNS, {})
+    for success, message in finished.values():
+        (st.success if success else st.error)(message)
+    if finished:
+        st.button("Dismiss", key="dismiss_finished_runs", on_click=finished.clear)
+
+
+@st.fragment(run_every=2)
+def _background_runs_pane():
+    """
+    Show running background workflows and the finished run messages.
+
+    Reruns on its own every 2 seconds; checking a future is free, so the
+    poll costs nothing while the workflow runs on the shared loop.
+    """
+    running = st.session_state.get(_BACKGROUND_RUNS, {})
+
+    for kind, (label, future) in list(running.items()):
+        if not future.done():
+            st.caption(f"{label} running...")
+            continue
+
+        # Stays in `running` until its outcome is recorded, so an error
+        # while reading the result cannot drop the run unreported
+        try:
+            result = future.result()
+        except _WORKFLOW_ERRORS as e:
+            logger.exception("Workflow %s failed", kind)
+            _record_finished(kind, False, f"Failed to run workflow: {e}")
+        else:
+            if result["success"]:
+                _record_finished(kind, True, _result_summary(kind, result))
+                try:
+                    _persist_run(kind, result)
+                except PyMongoError:
+                    # The run itself succeeded; only the "last run" record is lost
+                    logger.exception("Failed to record workflow run %s", kind)
+                st.cache_data.clear()
+            else:
+                _record_finished(kind, False, f"Workflow failed: {result['error']}")
+        del running[kind]
+        st.toast(f"{label} finished")
+
+    _render_finished_runs()
+
+
+@st.fragment
+def _workflow_result_pane():
+    """
+    Show the finished run messages when nothing runs in the background.
+
+    A fragment, so dismissing the messages only reruns this pane.
+    """
+    _render_finished_runs()
+
+
+@dataclass(frozen=True)
+class WorkflowSpec:
+    """
+    Declarative description of a workflow button.
+
+    _run_workflow_spec() owns the shared run, summary, persist and refresh
+    logic; each button only supplies its spec. Success messages come from
+    _RESULT_SUMMARIES under the same key.
+
+    Attributes:
+        label: Workflow name shown in toasts and progress captions
+        start: Coroutine function from trade_analyzer.workers.start_workflow
+        spinner: Spinner text while a blocking run is in progress
+        background: Submit without blocking (for sub-minute workflows)
+    """
+
+    label: str
+    start: Callable
+    spinner: str = ""
+    background: bool = False
+
+
+WORKFLOWS: dict[str, WorkflowSpec] = {
+    "universe_setup": WorkflowSpec(
+        "Universe Setup",
+        start_universe_setup,
+        spinner="Running Universe Setup workflow... This may take a few minutes.",
+    ),
+    "momentum_filter": WorkflowSpec(
+        "Momentum Filter",
+        start_momentum_filter,
+        spinner="Running Momentum Filter workflow... This may take 10-15 minutes.",
+    ),
+    "universe_and_momentum": WorkflowSpec(
+        "Full Weekend Workflow",
+        start_universe_and_momentum,
+        spinner="Running Full Weekend Workflow... This may take 15-20 minutes.",
+    ),
+    "consistency_filter": WorkflowSpec(
+        "Consistency Filter",
+        start_consistency_filter,
+        spinner="Running Consistency Filter workflow... This may take 5-10 minutes.",
+    ),
+    "full_pipeline": WorkflowSpec(
+        "Full Pipeline",
+        start_full_pipeline,
+        spinner="Running Full Pipeline (Phase 1-3)... This may take 20-30 minutes.",
+    ),
+    "volume_filter": WorkflowSpec(
+        "Volume & Liquidity Filter",
+        start_volume_filter,
+        spinner="Running Volume & Liquidity Filter... This may take 5-10 minutes.",
+    ),
+    "setup_detection": WorkflowSpec(
+        "Setup Detection",
+        start_setup_detection,
+        spinner="Running Setup Detection... This may take 5-10 minutes.",
+    ),
+    "phase4_pipeline": WorkflowSpec(
+        "Phase 4 Pipeline",
+        start_phase4_pipeline,
+        spinner="Running Phase 4 Pipeline... This may take 10-15 minutes.",
+    ),
+    "full_analysis": WorkflowSpec(
+        "Full Analysis Pipeline",
+        start_full_analysis_pipeline,
+        spinner="Running Full Analysis Pipeline (Phase 1-4)... This may take 30-45 minutes.",
+    ),
+    "fundamental_data_refresh": WorkflowSpec(
+        "Fundamental Data Refresh",
+        start_fundamental_data_refresh,
+        spinner="Running Fundamental Data Refresh (Monthly)... This may take 30-60 minutes.",
+    ),
+    "risk_geometry": WorkflowSpec(
+        "Risk Geometry",
+        start_risk_geometry,
+        spinner="Running Risk Geometry... This may take 10-15 minutes.",
+    ),
+    "portfolio_construction": WorkflowSpec(
+        "Portfolio Construction",
+        start_portfolio_construction,
+        spinner="Running Portfolio Construction... This may take 10-15 minutes.",
+    ),
+    "premarket_analysis": WorkflowSpec(
+        "Pre-Market Analysis", start_premarket_analysis, background=True
+    ),
+    "position_status": WorkflowSpec("Position Status", start_position_status, background=True),
+    "friday_close": WorkflowSpec("Friday Summary", start_friday_close, background=True),
+    "weekly_recommendation": WorkflowSpec(
+        "Weekly Recommendations", start_weekly_recommendation, background=True
+    ),
+}
+
+
+def _run_workflow_spec(kind: str) -> None:
+    """
+    Run a workflow button's workflow via Temporal.
+
+    Blocking runs show a spinner, then record the run and hand its summary
+    to the workflow result pane; background runs are handed to
+    _start_background_run(). Neither reruns the whole page: the cleared
+    dashboard cache is reloaded on the next interaction.
+
+    Args:
+        kind: Key into WORKFLOWS
+    """
+    spec = WORKFLOWS[kind]
+    if spec.background:
+        _start_background_run(kind)
+        return
+
+    with st.spinner(spec.spinner):
+        try:
+            result = _run_workflow(spec.start)
+
+            if result["success"]:
+                _record_finished(kind, True, _result_summary(kind, result))
+                _persist_run(kind, result)
+                st.cache_data.clear()
+            else:
+                _record_finished(kind, False, f"Workflow failed: {result['error']}")
+        except _WORKFLOW_ERRORS as e:
+            logger.exception("Workflow %s failed", kind)
+            _record_finished(kind, False, f"Failed to run workflow: {e}")
+    st.toast(f"{spec.label} finished")
 
 
 def _run_universe_setup():
@@ -1317,31 +2249,11 @@ def _run_universe_setup():
 
     UI Behavior:
         - Shows spinner with progress message
-        - Displays success message with stats on completion
-        - Auto-refreshes dashboard on success
+        - Displays success message with stats in the result pane
+        - Dashboard metrics reload on the next interaction
         - Shows error message on failure
     """
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_universe_setup
-
-    with st.spinner("Running Universe Setup workflow... This may take a few minutes."):
-        try:
-            result = asyncio.run(start_universe_setup())
-
-            if result["success"]:
-                st.success(
-                    f"Universe setup complete!\n\n"
-                    f"- NSE EQ: {result['total_nse_eq']}\n"
-                    f"- MTF: {result['total_mtf']}\n"
-                    f"- High Quality: {result['high_quality_count']}\n"
-                    f"- Tier A: {result['tier_a_count']}, B: {result['tier_b_count']}, C: {result['tier_c_count']}"
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("universe_setup")
 
 
 def _run_momentum_filter():
@@ -1361,275 +2273,45 @@ def _run_momentum_filter():
 
     UI Behavior:
         - Shows spinner with estimated time
-        - Displays qualified count and top 10 stocks
-        - Auto-refreshes dashboard
+        - Displays qualified count and top 10 stocks in the result pane
+        - Dashboard metrics reload on the next interaction
     """
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_momentum_filter
-
-    with st.spinner("Running Momentum Filter workflow... This may take 10-15 minutes."):
-        try:
-            result = asyncio.run(start_momentum_filter())
-
-            if result["success"]:
-                st.success(
-                    f"Momentum analysis complete!\n\n"
-                    f"- Analyzed: {result['total_analyzed']}\n"
-                    f"- Qualified (4+ filters): {result['total_qualified']}\n"
-                    f"- Avg Momentum Score: {result['avg_momentum_score']:.1f}\n"
-                    f"- Nifty 3M Return: {result['nifty_return_3m']:.1f}%\n\n"
-                    f"Top 10 by Momentum Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['momentum_score']:.1f} ({s['filters_passed']}/5 filters)"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("momentum_filter")
 
 
 def _run_universe_and_momentum():
     """Run the combined universe + momentum workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_universe_and_momentum
-
-    with st.spinner("Running Full Weekend Workflow... This may take 15-20 minutes."):
-        try:
-            result = asyncio.run(start_universe_and_momentum())
-
-            if result["success"]:
-                st.success(
-                    f"Full weekend analysis complete!\n\n"
-                    f"**Universe Setup:**\n"
-                    f"- NSE EQ: {result['total_nse_eq']}\n"
-                    f"- MTF: {result['total_mtf']}\n"
-                    f"- High Quality: {result['high_quality_count']}\n\n"
-                    f"**Momentum Analysis:**\n"
-                    f"- Analyzed: {result['momentum_analyzed']}\n"
-                    f"- Qualified: {result['momentum_qualified']}\n"
-                    f"- Avg Score: {result['avg_momentum_score']:.1f}\n\n"
-                    f"Top 10 by Momentum Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['momentum_score']:.1f}"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("universe_and_momentum")
 
 
 def _run_consistency_filter():
     """Run the consistency filter workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_consistency_filter
-
-    with st.spinner("Running Consistency Filter workflow... This may take 5-10 minutes."):
-        try:
-            result = asyncio.run(start_consistency_filter())
-
-            if result["success"]:
-                st.success(
-                    f"Consistency analysis complete!\n\n"
-                    f"- Analyzed: {result['total_analyzed']}\n"
-                    f"- Qualified (5+ filters): {result['total_qualified']}\n"
-                    f"- Avg Final Score: {result['avg_final_score']:.1f}\n"
-                    f"- Avg Consistency Score: {result['avg_consistency_score']:.1f}\n"
-                    f"- Market Regime: {result['market_regime']}\n\n"
-                    f"Top 10 by Final Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['final_score']:.1f} (C:{s['consistency_score']:.1f}, R:{s['regime_score']:.2f})"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("consistency_filter")
 
 
 def _run_full_pipeline():
     """Run the full pipeline workflow (Universe + Momentum + Consistency) via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_full_pipeline
-
-    with st.spinner("Running Full Pipeline (Phase 1-3)... This may take 20-30 minutes."):
-        try:
-            result = asyncio.run(start_full_pipeline())
-
-            if result["success"]:
-                st.success(
-                    f"Full Pipeline (Phase 1-3) complete!\n\n"
-                    f"**Phase 1 - Universe Setup:**\n"
-                    f"- NSE EQ: {result['total_nse_eq']}\n"
-                    f"- High Quality: {result['high_quality_count']}\n\n"
-                    f"**Phase 2 - Momentum Filter:**\n"
-                    f"- Qualified: {result['momentum_qualified']}\n\n"
-                    f"**Phase 3 - Consistency Filter:**\n"
-                    f"- Qualified: {result['consistency_qualified']}\n"
-                    f"- Avg Final Score: {result['avg_final_score']:.1f}\n"
-                    f"- Market Regime: {result['market_regime']}\n\n"
-                    f"Top 10 by Final Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['final_score']:.1f}"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("full_pipeline")
 
 
 def _run_volume_filter():
     """Run the volume & liquidity filter workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_volume_filter
-
-    with st.spinner("Running Volume & Liquidity Filter... This may take 5-10 minutes."):
-        try:
-            result = asyncio.run(start_volume_filter())
-
-            if result["success"]:
-                st.success(
-                    f"Volume & Liquidity analysis complete!\n\n"
-                    f"- Analyzed: {result['total_analyzed']}\n"
-                    f"- Qualified: {result['total_qualified']}\n"
-                    f"- Avg Liquidity Score: {result['avg_liquidity_score']:.1f}\n"
-                    f"- Avg Turnover (20D): Rs.{result['avg_turnover_20d']:.1f} Cr\n\n"
-                    f"Top 10 by Liquidity Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['liquidity_score']:.1f} (T/O: Rs.{s['turnover_20d_cr']:.1f}Cr)"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("volume_filter")
 
 
 def _run_setup_detection():
     """Run the setup detection workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_setup_detection
-
-    with st.spinner("Running Setup Detection... This may take 5-10 minutes."):
-        try:
-            result = asyncio.run(start_setup_detection())
-
-            if result["success"]:
-                setup_types = ", ".join(f"{k}: {v}" for k, v in result["setups_by_type"].items())
-                st.success(
-                    f"Setup Detection complete!\n\n"
-                    f"- Stocks Analyzed: {result['total_analyzed']}\n"
-                    f"- Setups Found: {result['total_setups_found']}\n"
-                    f"- Setups Qualified: {result['total_qualified']}\n"
-                    f"- Avg Confidence: {result['avg_confidence']:.1f}%\n"
-                    f"- Avg R:R Ratio: {result['avg_rr_ratio']:.2f}\n"
-                    f"- Market Regime: {result['market_regime']}\n"
-                    f"- By Type: {setup_types}\n\n"
-                    f"Top Setups:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']} ({s['type']}): Entry {s.get('entry_low', 0):.0f}-{s.get('entry_high', 0):.0f}, Stop {s.get('stop', 0):.0f}, R:R {s.get('rr_ratio', 0):.1f}"
-                        for i, s in enumerate(result["top_setups"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("setup_detection")
 
 
 def _run_phase4_pipeline():
     """Run the Phase 4 pipeline (Volume + Setup Detection) via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_phase4_pipeline
-
-    with st.spinner("Running Phase 4 Pipeline... This may take 10-15 minutes."):
-        try:
-            result = asyncio.run(start_phase4_pipeline())
-
-            if result["success"]:
-                setup_types = ", ".join(f"{k}: {v}" for k, v in result["setups_by_type"].items())
-                st.success(
-                    f"Phase 4 Pipeline complete!\n\n"
-                    f"**Phase 4A - Volume Filter:**\n"
-                    f"- Analyzed: {result['volume_analyzed']}\n"
-                    f"- Qualified: {result['volume_qualified']}\n"
-                    f"- Avg Liquidity: {result['avg_liquidity_score']:.1f}\n\n"
-                    f"**Phase 4B - Setup Detection:**\n"
-                    f"- Setups Found: {result['setups_found']}\n"
-                    f"- Setups Qualified: {result['setups_qualified']}\n"
-                    f"- By Type: {setup_types}\n"
-                    f"- Avg Confidence: {result['avg_confidence']:.1f}%\n"
-                    f"- Market Regime: {result['market_regime']}\n\n"
-                    f"Top Setups:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']} ({s['type']}): R:R {s.get('rr_ratio', 0):.1f}"
-                        for i, s in enumerate(result["top_setups"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("phase4_pipeline")
 
 
 def _run_full_analysis():
     """Run the full analysis pipeline (Phase 1-4) via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_full_analysis_pipeline
-
-    with st.spinner("Running Full Analysis Pipeline (Phase 1-4)... This may take 30-45 minutes."):
-        try:
-            result = asyncio.run(start_full_analysis_pipeline())
-
-            if result["success"]:
-                setup_types = ", ".join(f"{k}: {v}" for k, v in result["setups_by_type"].items())
-                st.success(
-                    f"Full Analysis Pipeline (Phase 1-4) complete!\n\n"
-                    f"**Phase 1 - Universe:**\n"
-                    f"- NSE EQ: {result['total_nse_eq']}\n"
-                    f"- High Quality: {result['high_quality_count']}\n\n"
-                    f"**Phase 2 - Momentum:**\n"
-                    f"- Qualified: {result['momentum_qualified']}\n\n"
-                    f"**Phase 3 - Consistency:**\n"
-                    f"- Qualified: {result['consistency_qualified']}\n\n"
-                    f"**Phase 4 - Setups:**\n"
-                    f"- Liquidity Qualified: {result['liquidity_qualified']}\n"
-                    f"- Trade Setups: {result['setups_qualified']}\n"
-                    f"- By Type: {setup_types}\n"
-                    f"- Market Regime: {result['market_regime']}\n\n"
-                    f"Top Trade Setups:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']} ({s['type']}): Entry {s.get('entry_low', 0):.0f}-{s.get('entry_high', 0):.0f}"
-                        for i, s in enumerate(result["top_setups"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("full_analysis")
 
 
 # ============================================================================
@@ -1657,227 +2339,90 @@ def _run_fundamental_data_refresh():
         - Displays cached data stats on completion
         - Explains this feeds into Phase 1
     """
-    import asyncio
+    _run_workflow_spec("fundamental_data_refresh")
 
-    from trade_analyzer.workers.start_workflow import start_fundamental_data_refresh
 
-    with st.spinner("Running Fundamental Data Refresh (Monthly)... This may take 30-60 minutes."):
-        try:
-            result = asyncio.run(start_fundamental_data_refresh())
-
-            if result["success"]:
-                st.success(
-                    f"Fundamental Data Refresh complete!\n\n"
-                    f"This data will be used by Phase 1 (Universe Setup) for weekly filtering.\n\n"
-                    f"- Symbols Analyzed: {result['symbols_analyzed']}\n"
-                    f"- Fundamental Saved: {result['fundamental_saved']}\n"
-                    f"- Fundamental Qualified: {result['fundamental_qualified']}\n"
-                    f"- Holdings Saved: {result['holdings_saved']}\n"
-                    f"- Holdings Qualified: {result['holdings_qualified']}\n"
-                    f"- Combined Qualified: {result['combined_qualified']}\n"
-                    f"- Avg Score: {result['avg_fundamental_score']:.1f}\n\n"
-                    f"Top 10 by Fundamental Score:\n"
-                    + "\n".join(
-                        f"  {i+1}. {s['symbol']}: {s['fundamental_score']:.1f}"
-                        for i, s in enumerate(result["top_10"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
-
-
-def _run_fundamental_filter():
-    """Run the fundamental filter workflow via Temporal (legacy - uses data refresh)."""
-    _run_fundamental_data_refresh()
+# Legacy name for the fundamental filter button (now the monthly data refresh)
+_run_fundamental_filter = _run_fundamental_data_refresh
 
 
 def _run_risk_geometry():
     """Run the risk geometry workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_risk_geometry
-
-    with st.spinner("Running Risk Geometry... This may take 10-15 minutes."):
-        try:
-            result = asyncio.run(start_risk_geometry())
-
-            if result["success"]:
-                st.success(
-                    f"Risk Geometry complete!\n\n"
-                    f"- Setups Analyzed: {result['setups_analyzed']}\n"
-                    f"- Risk Qualified: {result['risk_qualified']}\n"
-                    f"- Total Risk: Rs.{result['total_risk']:,.0f}\n"
-                    f"- Total Value: Rs.{result['total_value']:,.0f}\n"
-                    f"- Avg R:R Ratio: {result['avg_rr_ratio']:.2f}\n\n"
-                    f"Top Positions:\n"
-                    + "\n".join(
-                        f"  {i+1}. {p['symbol']}: Entry {p['entry']:.0f}, Stop {p['stop']:.0f}, R:R {p['rr_ratio']:.1f}"
-                        for i, p in enumerate(result["top_positions"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("risk_geometry")
 
 
 def _run_portfolio_construction():
     """Run the portfolio construction workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_portfolio_construction
-
-    with st.spinner("Running Portfolio Construction... This may take 10-15 minutes."):
-        try:
-            result = asyncio.run(start_portfolio_construction())
-
-            if result["success"]:
-                sector_alloc = ", ".join(f"{k}: {v:.1f}%" for k, v in result["sector_allocation"].items())
-                st.success(
-                    f"Portfolio Construction complete!\n\n"
-                    f"- Input Setups: {result['setups_input']}\n"
-                    f"- After Correlation: {result['after_correlation_filter']}\n"
-                    f"- After Sector Limits: {result['after_sector_limits']}\n"
-                    f"- Final Positions: {result['final_positions']}\n"
-                    f"- Invested %: {result['total_invested_pct']:.1f}%\n"
-                    f"- Risk %: {result['total_risk_pct']:.1f}%\n"
-                    f"- Cash Reserve %: {result['cash_reserve_pct']:.1f}%\n"
-                    f"- Sector Allocation: {sector_alloc}\n\n"
-                    f"Final Positions:\n"
-                    + "\n".join(
-                        f"  {i+1}. {p['symbol']}: {p.get('shares', 0)} shares, Rs.{p.get('position_value', 0):,.0f}"
-                        for i, p in enumerate(result["positions"][:10])
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("portfolio_construction")
 
 
 def _run_premarket_analysis():
     """Run the pre-market analysis workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_premarket_analysis
-
-    with st.spinner("Running Pre-Market Analysis..."):
-        try:
-            result = asyncio.run(start_premarket_analysis())
-
-            if result["success"]:
-                st.success(
-                    f"Pre-Market Analysis complete!\n\n"
-                    f"- Total Setups: {result['total_setups']}\n"
-                    f"- ENTER: {result['enter_count']}\n"
-                    f"- SKIP: {result['skip_count']}\n"
-                    f"- WAIT: {result['wait_count']}\n\n"
-                    f"Gap Analysis:\n"
-                    + "\n".join(
-                        f"  {g['symbol']}: {g['action']} ({g['reason'][:50]}...)"
-                        for g in result["gap_analyses"][:10]
-                    )
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("premarket_analysis")
 
 
 def _run_position_status():
     """Run the position status workflow via Temporal."""
-    import asyncio
+    _run_workflow_spec("position_status")
+
 
-    from trade_analyzer.workers.start_workflow import start_position_status
+def _run_morning_check():
+    """
+    Run pre-market analysis and position status concurrently via Temporal.
 
-    with st.spinner("Updating Position Status..."):
+    The two workflows only read the portfolio and prices, so running them
+    at once overlaps their Temporal scheduling and quote fetches instead of
+    waiting for one before starting the other.
+    """
+    with st.spinner("Running Pre-Market Analysis and Position Status..."):
         try:
-            result = asyncio.run(start_position_status())
+            premarket, status = _run_workflow(
+                start_concurrently, starts=(start_premarket_analysis, start_position_status)
+            )
+        except _WORKFLOW_ERRORS as e:
+            logger.exception("Morning check failed")
+            _record_finished("morning_check", False, f"Failed to run workflow: {e}")
+            return
+
+    lines = []
+    for label, result in (("Pre-Market", premarket), ("Position Status", status)):
+        if isinstance(result, Exception):
+            lines.append(f"- {label}: failed to run workflow: {result}")
+        elif not result["success"]:
+            lines.append(f"- {label}: workflow failed: {result['error']}")
+        elif label == "Pre-Market":
+            lines.append(
+                f"- {label}: ENTER {result['enter_count']}, SKIP {result['skip_count']}, "
+                f"WAIT {result['wait_count']} of {result['total_setups']} setups"
+            )
+        else:
+            lines.append(
+                f"- {label}: {result['total_positions']} positions, "
+                f"P&L Rs.{result['total_pnl']:,.0f} ({result['total_r_multiple']:.2f}R)"
+            )
 
-            if result["success"]:
-                st.success(
-                    f"Position Status Updated!\n\n"
-                    f"- Total Positions: {result['total_positions']}\n"
-                    f"- In Profit: {result['in_profit']}\n"
-                    f"- In Loss: {result['in_loss']}\n"
-                    f"- Stopped Out: {result['stopped_out']}\n"
-                    f"- Target Hit: {result['target_hit']}\n"
-                    f"- Total P&L: Rs.{result['total_pnl']:,.0f}\n"
-                    f"- Total R: {result['total_r_multiple']:.2f}R\n\n"
-                    f"Alerts:\n"
-                    + "\n".join(result["alerts"][:10]) if result["alerts"] else "No alerts"
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    summary = "Morning check complete!\n\n" + "\n".join(lines)
+    success = all(isinstance(r, dict) and r["success"] for r in (premarket, status))
+    _record_finished("morning_check", success, summary)
+    for kind, result in (("premarket_analysis", premarket), ("position_status", status)):
+        if isinstance(result, dict) and result["success"]:
+            _persist_run(kind, result)
+    st.cache_data.clear()
+    st.toast("Morning check finished")
 
 
 def _run_friday_close():
     """Run the Friday close workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_friday_close
-
-    with st.spinner("Generating Friday Summary..."):
-        try:
-            result = asyncio.run(start_friday_close())
-
-            if result["success"]:
-                st.success(
-                    f"Friday Summary Generated!\n\n"
-                    f"**Week: {result['week_start']} to {result['week_end']}**\n\n"
-                    f"- Total Trades: {result['total_trades']}\n"
-                    f"- Wins: {result['wins']}, Losses: {result['losses']}\n"
-                    f"- Win Rate: {result['win_rate']:.1f}%\n"
-                    f"- Realized P&L: Rs.{result['realized_pnl']:,.0f}\n"
-                    f"- Unrealized P&L: Rs.{result['unrealized_pnl']:,.0f}\n"
-                    f"- Total P&L: Rs.{result['total_pnl']:,.0f}\n"
-                    f"- Total R: {result['total_r']:.2f}R\n\n"
-                    f"**System Health: {result['system_health_score']}/100**\n"
-                    f"Recommended Action: {result['recommended_action']}"
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+    _run_workflow_spec("friday_close")
 
 
 def _run_weekly_recommendation():
     """Run the weekly recommendation workflow via Temporal."""
-    import asyncio
-
-    from trade_analyzer.workers.start_workflow import start_weekly_recommendation
+    _run_workflow_spec("weekly_recommendation")
 
-    with st.spinner("Generating Weekly Recommendations..."):
-        try:
-            result = asyncio.run(start_weekly_recommendation())
 
-            if result["success"]:
-                st.success(
-                    f"Weekly Recommendations Generated!\n\n"
-                    f"**Week of {result['week_display']}**\n"
-                    f"- Market Regime: {result['market_regime'].upper()}\n"
-                    f"- Confidence: {result['regime_confidence']:.0f}%\n\n"
-                    f"- Total Setups: {result['total_setups']}\n"
-                    f"- Allocated Capital: Rs.{result['allocated_capital']:,.0f}\n"
-                    f"- Allocated %: {result['allocated_pct']:.1f}%\n"
-                    f"- Total Risk %: {result['total_risk_pct']:.1f}%\n\n"
-                    f"View recommendations in the Phase 9 section."
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+# Query parameter holding the workflow ID of a running complete weekly pipeline
+_WEEKLY_RUN_PARAM = "weekly_run"
 
 
 def _run_complete_weekly_pipeline():
@@ -1897,41 +2442,80 @@ def _run_complete_weekly_pipeline():
     Output: 3-7 trade recommendations for Monday
 
     UI Behavior:
-        - Shows long-running spinner
-        - Displays full pipeline summary
-        - Shows final recommendation count and allocation
+        - Starts the workflow and returns instead of blocking the page
+        - Progress is polled by _weekly_pipeline_progress()
         - This is the "one-click" weekend run button
     """
-    import asyncio
+    try:
+        workflow_id = _run_workflow(submit_complete_weekly_pipeline)
+    except _WORKFLOW_ERRORS as e:
+        logger.exception("Failed to start the complete weekly pipeline")
+        _record_finished("complete_weekly_pipeline", False, f"Failed to run workflow: {e}")
+        return
 
-    from trade_analyzer.workers.start_workflow import start_complete_weekly_pipeline
+    # Query params survive a browser refresh, unlike session state
+    st.query_params[_WEEKLY_RUN_PARAM] = workflow_id
 
-    with st.spinner("Running Complete Weekly Pipeline (Phase 4B-9)... This may take 45-60 minutes."):
-        try:
-            result = asyncio.run(start_complete_weekly_pipeline())
 
-            if result["success"]:
-                st.success(
-                    f"Complete Weekly Pipeline Finished!\n\n"
-                    f"**Week of {result['week_display']}**\n"
-                    f"- Market Regime: {result['market_regime'].upper()}\n\n"
-                    f"**Pipeline Summary:**\n"
-                    f"- Phase 4B (Setups): {result['phase_4_setups']}\n"
-                    f"- Phase 5 (Fundamental): {result['phase_5_fundamental']}\n"
-                    f"- Phase 6 (Risk): {result['phase_6_risk_qualified']}\n"
-                    f"- Phase 7 (Portfolio): {result['phase_7_final_positions']}\n\n"
-                    f"**Final Output:**\n"
-                    f"- Total Recommendations: {result['total_setups']}\n"
-                    f"- Allocated Capital: Rs.{result['allocated_capital']:,.0f}\n"
-                    f"- Allocated %: {result['allocated_pct']:.1f}%\n"
-                    f"- Total Risk %: {result['total_risk_pct']:.1f}%\n\n"
-                    f"View detailed recommendations in Phase 9 section."
-                )
-                st.rerun()
-            else:
-                st.error(f"Workflow failed: {result['error']}")
-        except Exception as e:
-            st.error(f"Failed to run workflow: {e}")
+@st.fragment(run_every=5)
+def _weekly_pipeline_progress():
+    """
+    Poll the running complete weekly pipeline and show its progress.
+
+    Reruns on its own every 5 seconds while a run is tracked. Each poll is
+    a short Temporal describe + query, so the page stays usable during the
+    45-60 minute run. On completion it records the outcome for the
+    workflow result pane and reruns the page, which stops the polling and
+    refreshes the dashboard.
+    """
+    workflow_id = st.query_params.get(_WEEKLY_RUN_PARAM)
+    if not workflow_id:
+        return
+
+    try:
+        status = _run_workflow(poll_complete_weekly_pipeline, workflow_id=workflow_id)
+    except _WORKFLOW_ERRORS as e:
+        logger.exception("Complete weekly pipeline %s failed", workflow_id)
+        del st.query_params[_WEEKLY_RUN_PARAM]
+        _record_finished("complete_weekly_pipeline", False, f"Workflow failed: {e}")
+        st.rerun()
+
+    if not status["done"]:
+        progress = status["progress"]
+        counts = ", ".join(f"{name.replace('_', ' ')}: {n}" for name, n in progress["counts"].items())
+        st.progress(
+            progress["completed"] / progress["total"],
+            text=f"Weekly pipeline: {progress['phase']}" + (f" ({counts})" if counts else ""),
+        )
+        return
+
+    del st.query_params[_WEEKLY_RUN_PARAM]
+    result = status["result"]
+    if result["success"]:
+        summary = _result_summary("complete_weekly_pipeline", result)
+        _record_finished("complete_weekly_pipeline", True, summary)
+        _persist_run("complete_weekly_pipeline", result)
+        st.cache_data.clear()
+    else:
+        _record_finished("complete_weekly_pipeline", False, f"Workflow failed: {result['error']}")
+    # The outcome lives in session state, so the full rerun only hands it to
+    # the workflow result pane (and reloads the dashboard after a success)
+    st.rerun()
+
+
+# Risk parameter inputs: (field, label, default, min, max)
+_RISK_PARAMS = (
+    ("max_risk_per_trade_pct", "Max Risk per Trade (%)", 1.5, 0.5, 3.0),
+    ("max_sector_exposure_pct", "Max Sector Exposure (%)", 25.0, 10.0, 50.0),
+    ("min_rr_ratio", "Min Reward:Risk Ratio", 2.0, 1.5, 5.0),
+    ("max_stop_distance_pct", "Max Stop Distance (%)", 7.0, 3.0, 10.0),
+)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_risk_params(_db) -> dict:
+    """Saved risk parameters (empty until the settings form is saved)."""
+    return _db.settings.find_one({"_id": "risk"}, {"_id": 0}) or {}
 
 
 def render_settings():
@@ -1947,13 +2531,14 @@ def render_settings():
           * Max stop distance (%)
 
     Note:
-        Currently for display only. Parameter changes not yet persisted
-        to database. Will be implemented in future version.
+        Risk parameters are saved to the settings collection (document
+        "risk") but not yet read by the workflows.
 
     UI Components:
         - Connection status indicator
         - Disconnect button (if connected)
-        - Risk parameter input controls (2 columns)
+        - Risk parameter form (2 columns); edits only rerun the page when
+          the form is saved
     """
     st.header("Settings")
 
@@ -1961,9 +2546,7 @@ def render_settings():
     if st.session_state.get("db_connected"):
         st.success("Connected to MongoDB")
         if st.button("Disconnect"):
-            from trade_analyzer.db import MongoDBConnection
-
-            MongoDBConnection().disconnect()
+            st.session_state.db_conn.disconnect()
             st.session_state.db_connected = False
             st.session_state.db = None
             st.rerun()
@@ -1973,13 +2556,27 @@ def render_settings():
     st.markdown("---")
 
     st.subheader("Risk Parameters")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.number_input("Max Risk per Trade (%)", value=1.5, min_value=0.5, max_value=3.0)
-        st.number_input("Max Sector Exposure (%)", value=25.0, min_value=10.0, max_value=50.0)
-    with col2:
-        st.number_input("Min Reward:Risk Ratio", value=2.0, min_value=1.5, max_value=5.0)
-        st.number_input("Max Stop Distance (%)", value=7.0, min_value=3.0, max_value=10.0)
+    db = st.session_state.get("db")
+    saved = _load_risk_params(db) if db is not None else {}
+    values = {}
+    with st.form("risk_params"):
+        col1, col2 = st.columns(2)
+        for column, params in ((col1, _RISK_PARAMS[:2]), (col2, _RISK_PARAMS[2:])):
+            with column:
+                for key, label, default, min_value, max_value in params:
+                    values[key] = st.number_input(
+                        label,
+                        value=saved.get(key, default),
+                        min_value=min_value,
+                        max_value=max_value,
+                        key=f"risk_{key}",
+                    )
+        submitted = st.form_submit_button("Save", disabled=db is None)
+
+    if submitted:
+        db.settings.update_one({"_id": "risk"}, {"$set": values}, upsert=True)
+        _load_risk_params.clear()
+        st.success("Risk parameters saved")
 
 
 def run_app():
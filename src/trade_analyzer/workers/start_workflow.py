@@ -49,6 +49,11 @@ Workflow Categories:
     9. Weekly Recommendations (Phase 8):
        - start_weekly_recommendation() - Generate trade recommendations
        - start_complete_weekly_pipeline() - Full Phase 4B-8 (master weekend workflow)
+       - submit_complete_weekly_pipeline() / poll_complete_weekly_pipeline() -
+         Non-blocking version with progress
+
+    10. Concurrent Runs:
+       - start_concurrently() - Run independent workflows at the same time
 
 Usage:
     From Python:
@@ -61,10 +66,11 @@ Usage:
         $ python -m trade_analyzer.workers.start_workflow
 
     From Streamlit UI:
-        Uses asyncio.run() to execute workflows synchronously
+        Runs workflows on a persistent event loop, passing a shared client
 
 Architecture:
     - Each function creates a unique workflow ID
+    - Accepts an optional client so callers can reuse one connection
     - Executes workflow synchronously (waits for completion)
     - Returns structured dict with results
     - Logs progress and errors
@@ -74,6 +80,9 @@ Architecture:
 import asyncio
 import logging
 import uuid
+from collections.abc import Awaitable, Callable
+
+from temporalio.client import Client, WorkflowExecutionStatus
 
 from trade_analyzer.config import TASK_QUEUE_UNIVERSE_REFRESH
 from trade_analyzer.workers.client import get_temporal_client
@@ -114,21 +123,25 @@ from trade_analyzer.workflows.execution import (
 )
 from trade_analyzer.workflows.weekly_recommendation import (
     WeeklyRecommendationWorkflow,
-    FullPipelineWorkflow as WeeklyFullPipelineWorkflow,
+    WeeklyFullPipelineWorkflow,
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def start_universe_setup() -> dict:
+async def start_universe_setup(client: Client | None = None) -> dict:
     """
     Start the universe setup workflow (full pipeline with enrichment).
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"universe-setup-{uuid.uuid4().hex[:8]}"
 
@@ -152,14 +165,18 @@ async def start_universe_setup() -> dict:
     }
 
 
-async def start_universe_setup_async() -> str:
+async def start_universe_setup_async(client: Client | None = None) -> str:
     """
     Start the universe setup workflow without waiting for completion.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Workflow ID of the started workflow.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"universe-setup-{uuid.uuid4().hex[:8]}"
 
@@ -173,14 +190,18 @@ async def start_universe_setup_async() -> str:
     return handle.id
 
 
-async def start_universe_refresh() -> str:
+async def start_universe_refresh(client: Client | None = None) -> str:
     """
     Start the basic universe refresh workflow (deprecated - use setup).
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Workflow ID of the started workflow.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"universe-refresh-{uuid.uuid4().hex[:8]}"
 
@@ -194,14 +215,18 @@ async def start_universe_refresh() -> str:
     return workflow_id
 
 
-async def start_momentum_filter() -> dict:
+async def start_momentum_filter(client: Client | None = None) -> dict:
     """
     Start the momentum filter workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"momentum-filter-{uuid.uuid4().hex[:8]}"
 
@@ -225,16 +250,20 @@ async def start_momentum_filter() -> dict:
     }
 
 
-async def start_universe_and_momentum() -> dict:
+async def start_universe_and_momentum(client: Client | None = None) -> dict:
     """
     Start the combined universe + momentum workflow.
 
     This is the main weekend workflow for Phase 2.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"universe-momentum-{uuid.uuid4().hex[:8]}"
 
@@ -260,14 +289,18 @@ async def start_universe_and_momentum() -> dict:
     }
 
 
-async def start_consistency_filter() -> dict:
+async def start_consistency_filter(client: Client | None = None) -> dict:
     """
     Start the consistency filter workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"consistency-filter-{uuid.uuid4().hex[:8]}"
 
@@ -292,16 +325,20 @@ async def start_consistency_filter() -> dict:
     }
 
 
-async def start_full_pipeline() -> dict:
+async def start_full_pipeline(client: Client | None = None) -> dict:
     """
     Start the full pipeline workflow (Universe + Momentum + Consistency).
 
     This is the complete Phase 1-3 weekend workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"full-pipeline-{uuid.uuid4().hex[:8]}"
 
@@ -326,14 +363,18 @@ async def start_full_pipeline() -> dict:
     }
 
 
-async def start_volume_filter() -> dict:
+async def start_volume_filter(client: Client | None = None) -> dict:
     """
     Start the volume & liquidity filter workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"volume-filter-{uuid.uuid4().hex[:8]}"
 
@@ -357,14 +398,18 @@ async def start_volume_filter() -> dict:
     }
 
 
-async def start_setup_detection() -> dict:
+async def start_setup_detection(client: Client | None = None) -> dict:
     """
     Start the setup detection workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"setup-detection-{uuid.uuid4().hex[:8]}"
 
@@ -391,14 +436,18 @@ async def start_setup_detection() -> dict:
     }
 
 
-async def start_phase4_pipeline() -> dict:
+async def start_phase4_pipeline(client: Client | None = None) -> dict:
     """
     Start the Phase 4 pipeline (Volume Filter + Setup Detection).
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"phase4-pipeline-{uuid.uuid4().hex[:8]}"
 
@@ -426,16 +475,20 @@ async def start_phase4_pipeline() -> dict:
     }
 
 
-async def start_full_analysis_pipeline() -> dict:
+async def start_full_analysis_pipeline(client: Client | None = None) -> dict:
     """
     Start the full analysis pipeline (Phase 1-4).
 
     This is the complete weekend workflow producing trade setups.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"full-analysis-{uuid.uuid4().hex[:8]}"
 
@@ -470,6 +523,7 @@ async def start_full_analysis_pipeline() -> dict:
 async def start_fundamental_data_refresh(
     min_quality_score: float = 60.0,
     fetch_delay: float = 1.0,
+    client: Client | None = None,
 ) -> dict:
     """
     Start the MONTHLY fundamental data refresh workflow.
@@ -483,11 +537,13 @@ async def start_fundamental_data_refresh(
     Args:
         min_quality_score: Minimum quality score for stocks to analyze
         fetch_delay: Delay between API calls (respecting rate limits)
+        client: Temporal client to reuse (connects a new one if None)
 
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"fundamental-refresh-{uuid.uuid4().hex[:8]}"
 
@@ -514,17 +570,21 @@ async def start_fundamental_data_refresh(
     }
 
 
-async def start_fundamental_filter() -> dict:
+async def start_fundamental_filter(client: Client | None = None) -> dict:
     """
     Start the fundamental filter workflow (legacy - use start_fundamental_data_refresh).
 
     This is kept for backward compatibility. New code should use
     start_fundamental_data_refresh() for the monthly refresh.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"fundamental-filter-{uuid.uuid4().hex[:8]}"
 
@@ -557,6 +617,7 @@ async def start_fundamental_filter() -> dict:
 async def start_risk_geometry(
     portfolio_value: float = 1000000.0,
     market_regime: str = "risk_on",
+    client: Client | None = None,
 ) -> dict:
     """
     Start the risk geometry workflow.
@@ -564,11 +625,13 @@ async def start_risk_geometry(
     Args:
         portfolio_value: Total portfolio value
         market_regime: Current market regime
+        client: Temporal client to reuse (connects a new one if None)
 
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"risk-geometry-{uuid.uuid4().hex[:8]}"
 
@@ -601,6 +664,7 @@ async def start_risk_geometry(
 async def start_portfolio_construction(
     portfolio_value: float = 1000000.0,
     market_regime: str = "risk_on",
+    client: Client | None = None,
 ) -> dict:
     """
     Start the portfolio construction workflow.
@@ -608,11 +672,13 @@ async def start_portfolio_construction(
     Args:
         portfolio_value: Total portfolio value
         market_regime: Current market regime
+        client: Temporal client to reuse (connects a new one if None)
 
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"portfolio-construction-{uuid.uuid4().hex[:8]}"
 
@@ -644,14 +710,19 @@ async def start_portfolio_construction(
 async def start_phase7_pipeline(
     portfolio_value: float = 1000000.0,
     market_regime: str = "risk_on",
+    client: Client | None = None,
 ) -> dict:
     """
     Start the Phase 5-7 pipeline (Fundamental + Risk + Portfolio).
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"phase7-pipeline-{uuid.uuid4().hex[:8]}"
 
@@ -684,14 +755,18 @@ async def start_phase7_pipeline(
 # ============================================================================
 
 
-async def start_premarket_analysis() -> dict:
+async def start_premarket_analysis(client: Client | None = None) -> dict:
     """
     Start the Monday pre-market analysis workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"premarket-analysis-{uuid.uuid4().hex[:8]}"
 
@@ -717,14 +792,18 @@ async def start_premarket_analysis() -> dict:
     }
 
 
-async def start_position_status() -> dict:
+async def start_position_status(client: Client | None = None) -> dict:
     """
     Start the position status update workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"position-status-{uuid.uuid4().hex[:8]}"
 
@@ -751,14 +830,18 @@ async def start_position_status() -> dict:
     }
 
 
-async def start_friday_close() -> dict:
+async def start_friday_close(client: Client | None = None) -> dict:
     """
     Start the Friday close summary workflow.
 
+    Args:
+        client: Temporal client to reuse (connects a new one if None)
+
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"friday-close-{uuid.uuid4().hex[:8]}"
 
@@ -797,6 +880,7 @@ async def start_weekly_recommendation(
     portfolio_value: float = 1000000.0,
     run_full_pipeline: bool = False,
     market_regime: str | None = None,
+    client: Client | None = None,
 ) -> dict:
     """
     Start the weekly recommendation workflow.
@@ -805,11 +889,13 @@ async def start_weekly_recommendation(
         portfolio_value: Total portfolio value
         run_full_pipeline: Whether to run Phase 5-7 first
         market_regime: Override regime (optional)
+        client: Temporal client to reuse (connects a new one if None)
 
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"weekly-recommendation-{uuid.uuid4().hex[:8]}"
 
@@ -839,6 +925,7 @@ async def start_weekly_recommendation(
 async def start_complete_weekly_pipeline(
     portfolio_value: float = 1000000.0,
     market_regime: str = "risk_on",
+    client: Client | None = None,
 ) -> dict:
     """
     Start the complete end-to-end weekly pipeline (Phase 4B-9).
@@ -848,11 +935,13 @@ async def start_complete_weekly_pipeline(
     Args:
         portfolio_value: Total portfolio value
         market_regime: Current market regime
+        client: Temporal client to reuse (connects a new one if None)
 
     Returns:
         Result dict with workflow outcome.
     """
-    client = await get_temporal_client()
+    if client is None:
+        client = await get_temporal_client()
 
     workflow_id = f"complete-weekly-{uuid.uuid4().hex[:8]}"
 
@@ -864,6 +953,80 @@ async def start_complete_weekly_pipeline(
     )
 
     logger.info(f"Workflow {workflow_id} completed")
+    return _complete_weekly_pipeline_result(workflow_id, result)
+
+
+async def submit_complete_weekly_pipeline(
+    portfolio_value: float = 1000000.0,
+    market_regime: str = "risk_on",
+    client: Client | None = None,
+) -> str:
+    """
+    Start the complete weekly pipeline without waiting for completion.
+
+    Poll it with poll_complete_weekly_pipeline().
+
+    Args:
+        portfolio_value: Total portfolio value
+        market_regime: Current market regime
+        client: Temporal client to reuse (connects a new one if None)
+
+    Returns:
+        Workflow ID of the started workflow.
+    """
+    if client is None:
+        client = await get_temporal_client()
+
+    workflow_id = f"complete-weekly-{uuid.uuid4().hex[:8]}"
+
+    handle = await client.start_workflow(
+        WeeklyFullPipelineWorkflow.run,
+        args=[portfolio_value, market_regime],
+        id=workflow_id,
+        task_queue=TASK_QUEUE_UNIVERSE_REFRESH,
+    )
+
+    logger.info(f"Started workflow {workflow_id}")
+    return handle.id
+
+
+async def poll_complete_weekly_pipeline(
+    workflow_id: str,
+    client: Client | None = None,
+) -> dict:
+    """
+    Check on a complete weekly pipeline started by submit_complete_weekly_pipeline().
+
+    Args:
+        workflow_id: ID returned by submit_complete_weekly_pipeline()
+        client: Temporal client to reuse (connects a new one if None)
+
+    Returns:
+        {"done": False, "progress": {...}} while running (see
+        WeeklyFullPipelineWorkflow.progress), else {"done": True,
+        "result": {...}} with the same result dict as
+        start_complete_weekly_pipeline().
+
+    Raises:
+        WorkflowFailureError: If the workflow failed, was cancelled or was
+            terminated.
+    """
+    if client is None:
+        client = await get_temporal_client()
+
+    # Typed handle, so result() decodes a FullPipelineResult, not a dict
+    handle = client.get_workflow_handle_for(WeeklyFullPipelineWorkflow.run, workflow_id)
+    description = await handle.describe()
+    if description.status == WorkflowExecutionStatus.RUNNING:
+        progress = await handle.query(WeeklyFullPipelineWorkflow.progress)
+        return {"done": False, "progress": progress}
+
+    result = await handle.result()
+    return {"done": True, "result": _complete_weekly_pipeline_result(workflow_id, result)}
+
+
+def _complete_weekly_pipeline_result(workflow_id: str, result) -> dict:
+    """Convert a FullPipelineResult to the start_* result dict."""
     return {
         "workflow_id": workflow_id,
         "success": result.success,
@@ -883,6 +1046,39 @@ async def start_complete_weekly_pipeline(
     }
 
 
+# ============================================================================
+# Concurrent Runs
+# ============================================================================
+
+
+async def start_concurrently(
+    starts: tuple[Callable[..., Awaitable], ...],
+    client: Client | None = None,
+) -> list:
+    """
+    Run independent workflows at the same time over one client.
+
+    Only pass workflows without data dependencies on each other (e.g.
+    pre-market analysis and position status); pipeline phases that read
+    the previous phase's results must still run in order.
+
+    Args:
+        starts: Entry points from this module, called with the shared client
+        client: Temporal client to reuse (connects a new one if None)
+
+    Returns:
+        Results in the order of `starts`; an entry point that raised has its
+        exception in its place, so one failure does not discard the others.
+    """
+    if client is None:
+        client = await get_temporal_client()
+
+    return await asyncio.gather(
+        *(start(client=client) for start in starts),
+        return_exceptions=True,
+    )
+
+
 def main() -> None:
     """
     Entry point to start universe setup workflow.
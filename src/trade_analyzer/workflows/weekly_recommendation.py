@@ -392,10 +392,43 @@ class WeeklyFullPipelineWorkflow:
     - Returns results from successful phases
     - Detailed error reporting per phase
 
+    Progress:
+    - The `progress` query reports the running phase and the counts of the
+      phases completed so far, so callers can poll instead of blocking
+
     Returns:
         FullPipelineResult with complete pipeline statistics
     """
 
+    PHASES = 4  # 4B setups, risk geometry, portfolio, recommendations
+
+    def __init__(self) -> None:
+        self._phase = "Starting"
+        self._completed = 0
+        self._counts: dict[str, int] = {}
+
+    @workflow.query
+    def progress(self) -> dict:
+        """
+        Report pipeline progress.
+
+        Returns:
+            dict: phase (running phase name), completed and total phase
+            counts, and counts (output count of each completed phase)
+        """
+        return {
+            "phase": self._phase,
+            "completed": self._completed,
+            "total": self.PHASES,
+            "counts": dict(self._counts),
+        }
+
+    def _advance(self, finished: str, count: int, next_phase: str) -> None:
+        """Record a completed phase and the phase starting next."""
+        self._counts[finished] = count
+        self._completed += 1
+        self._phase = next_phase
+
     @workflow.run
     async def run(
         self,
@@ -424,6 +457,7 @@ class WeeklyFullPipelineWorkflow:
 
             # Phase 4B: Setup Detection
             workflow.logger.info("=== Phase 4B: Setup Detection ===")
+            self._phase = "Phase 4B: Setup Detection"
             setup_result = await workflow.execute_child_workflow(
                 SetupDetectionWorkflow.run,
                 args=[30, 2.0, 70],  # batch_size, min_rr, min_confidence
@@ -450,6 +484,7 @@ class WeeklyFullPipelineWorkflow:
 
             phase_4_count = setup_result.total_qualified
             workflow.logger.info(f"Phase 4B: {phase_4_count} setups qualified")
+            self._advance("setups", phase_4_count, "Phase 5: Risk Geometry")
 
             # NOTE: Old Phase 5 (Fundamentals) removed - now in Phase 1
             # Setups already have fundamentally_qualified stocks from Phase 1
@@ -485,6 +520,7 @@ class WeeklyFullPipelineWorkflow:
 
             phase_5_risk_count = risk_result.risk_qualified
             workflow.logger.info(f"Phase 5 (Risk): {phase_5_risk_count} risk qualified")
+            self._advance("risk_qualified", phase_5_risk_count, "Phase 6: Portfolio Construction")
 
             # Phase 6: Portfolio Construction (was Phase 7)
             workflow.logger.info("=== Phase 6: Portfolio Construction ===")
@@ -514,6 +550,7 @@ class WeeklyFullPipelineWorkflow:
 
             phase_6_count = portfolio_result.final_positions
             workflow.logger.info(f"Phase 6 (Portfolio): {phase_6_count} final positions")
+            self._advance("final_positions", phase_6_count, "Phase 8: Weekly Recommendations")
 
             # Phase 8: Weekly Recommendations (was Phase 9)
             workflow.logger.info("=== Phase 8: Weekly Recommendations ===")
@@ -541,6 +578,7 @@ class WeeklyFullPipelineWorkflow:
                     error=f"Phase 8 (Recommendations) failed: {rec_result.error}",
                 )
 
+            self._advance("recommendations", rec_result.total_setups, "Complete")
             workflow.logger.info(
                 f"Full Pipeline complete: {phase_4_count} setups → "
                 f"{phase_5_risk_count} risk → {phase_6_count} portfolio → "
@@ -0,0 +1,186 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from trade_analyzer.db.repositories import (
+    AsyncRepository,
+    RegimeRepository,
+    StockRepository,
+    TradeRepository,
+    _close_trade_pipeline,
+    _IdCache,
+)
+
+NOW = datetime(2025, 12, 19, 15, 30)
+
+
+class _RegimeCollection:
+    """find_one stub returning the latest of a list of assessments."""
+
+    def __init__(self):
+        self.docs = []
+        self.on_find = None
+
+    def find_one(self, *args, **kwargs):
+        doc = self.docs[-1] if self.docs else None
+        if self.on_find:
+            self.on_find()
+        return dict(doc) if doc else None
+
+
+class _Database(dict):
+    def __missing__(self, name):
+        self[name] = _RegimeCollection()
+        self[name].database = self
+        return self[name]
+
+
+class _TradeCollection:
+    """Records the close-trade updates sent to the server."""
+
+    def __init__(self):
+        self.updates = []
+        self.bulk_calls = 0
+
+    def find_one_and_update(self, query, update, **kwargs):
+        self.updates.append((query, update))
+        return {"_id": query["_id"]}
+
+    def bulk_write(self, requests, ordered=True):
+        self.bulk_calls += 1
+        assert not ordered
+        self.updates.extend((request._filter, request._doc) for request in requests)
+        return type("BulkWriteResult", (), {"modified_count": len(requests)})()
+
+
+CLOSES = [
+    (ObjectId(), 2785, datetime(2025, 12, 17, 14, 0), "target_1"),
+    (ObjectId(), 2575, datetime(2025, 12, 16, 10, 5), "stop_loss"),
+    (ObjectId(), 400.25, datetime(2025, 12, 18), "$regime_exit"),
+]
+
+
+def test_close_trade_pipeline_sets_exit_fields_first():
+    pipeline = _close_trade_pipeline(2785, datetime(2025, 12, 17), "$regime_exit")
+
+    assert pipeline[0] == {
+        "$set": {
+            "exit_price": 2785,
+            "exit_date": datetime(2025, 12, 17),
+            # A reason starting with "$" must not be read as a field path
+            "exit_reason": {"$literal": "$regime_exit"},
+            "updated_at": "$$NOW",
+        }
+    }
+    # The derived-field and status stages are shared, not rebuilt per call
+    other = _close_trade_pipeline(2575, datetime(2025, 12, 16), "stop_loss")
+    assert len(pipeline) == len(other) == 3
+    assert all(a is b for a, b in zip(pipeline[1:], other[1:]))
+
+
+def test_close_trades_bulk_sends_close_trade_updates_in_one_call():
+    single = TradeRepository(_Database())
+    single.collection = _TradeCollection()
+    bulk = TradeRepository(_Database())
+    bulk.collection = _TradeCollection()
+    bulk._id_cache.put(str(CLOSES[0][0]), {"_id": CLOSES[0][0], "status": "active"})
+
+    for close in CLOSES:
+        assert single.close_trade(str(close[0]), *close[1:])
+    assert bulk.close_trades_bulk([(str(trade_id), *rest) for trade_id, *rest in CLOSES]) == 3
+
+    assert bulk.collection.bulk_calls == 1
+    assert bulk.collection.updates == single.collection.updates
+    assert bulk._id_cache.get(str(CLOSES[0][0])) is None
+    assert bulk.close_trades_bulk([]) == 0
+    assert bulk.collection.bulk_calls == 1
+
+
+def test_id_cache_entries_are_isolated_from_callers():
+    cache = _IdCache(maxsize=2)
+    doc = {"symbol": "TCS", "targets": [4000, 4200], "meta": {"source": "phase4b"}}
+    cache.put("a", doc)
+    doc["targets"].append(4400)
+
+    cached = cache.get("a")
+    cached["targets"].append(4600)
+    cached["meta"]["source"] = "edited"
+
+    assert cache.get("a") == {"symbol": "TCS", "targets": [4000, 4200], "meta": {"source": "phase4b"}}
+
+
+def test_id_cache_evicts_least_recently_used():
+    cache = _IdCache(maxsize=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+
+
+def test_regime_latest_not_cached_across_concurrent_invalidation():
+    repo = RegimeRepository(_Database())
+    repo.collection.docs.append({"_id": ObjectId(), "state": "choppy"})
+
+    # An assessment is written while get_latest() is reading the old one
+    def write_during_read():
+        repo.collection.on_find = None
+        repo.collection.docs.append({"_id": ObjectId(), "state": "risk_on"})
+        repo.invalidate_latest()
+
+    repo.collection.on_find = write_during_read
+    assert repo.get_latest()["state"] == "choppy"
+    assert repo.get_latest()["state"] == "risk_on"
+    # Cached now
+    repo.collection.docs.append({"_id": ObjectId(), "state": "risk_off"})
+    assert repo.get_latest()["state"] == "risk_on"
+
+
+def test_regime_latest_cache_is_isolated_from_callers():
+    repo = RegimeRepository(_Database())
+    repo.collection.docs.append({"_id": ObjectId(), "state": "choppy", "indicators": {"vix": 14}})
+
+    first = repo.get_latest()
+    first["state"] = "risk_on"
+    cached = repo.get_latest()
+    cached["indicators"]["vix"] = 30
+
+    latest = repo.get_latest()
+    assert (latest["state"], latest["indicators"]) == ("choppy", {"vix": 14})
+
+
+class _ArchiveCollection:
+    """Records the archive calls; a trade closes between the copy and delete."""
+
+    def __init__(self, closed_ids):
+        self.closed_ids = list(closed_ids)
+        self.merged = self.deleted = None
+
+    def find(self, query, projection):
+        return [{"_id": trade_id} for trade_id in self.closed_ids]
+
+    def aggregate(self, pipeline):
+        self.merged = pipeline[0]["$match"]
+        self.closed_ids.append(ObjectId())
+
+    def delete_many(self, query):
+        self.deleted = query
+        return type("DeleteResult", (), {"deleted_count": len(query["_id"]["$in"])})()
+
+
+def test_archive_deletes_only_the_trades_it_copied():
+    ids = [ObjectId(), ObjectId()]
+    repo = TradeRepository(_Database())
+    repo.collection = _ArchiveCollection(ids)
+
+    assert repo.archive_closed_before(NOW) == 2
+    assert repo.collection.merged == repo.collection.deleted == {"_id": {"$in": ids}}
+
+
+def test_async_repository_rejects_generator_methods():
+    repo = AsyncRepository(StockRepository(_Database()))
+    with pytest.raises(AttributeError, match="iter_universe is a generator"):
+        repo.iter_universe
+    assert callable(repo.get_universe)
@@ -0,0 +1,58 @@
+import asyncio
+
+from temporalio.client import Client, WorkflowExecutionStatus
+
+from trade_analyzer.workers.client import _DATA_CONVERTER
+from trade_analyzer.workers.start_workflow import poll_complete_weekly_pipeline
+from trade_analyzer.workflows.weekly_recommendation import FullPipelineResult
+
+RESULT = FullPipelineResult(
+    success=True,
+    phase_4_setups=12,
+    phase_5_fundamental=0,
+    phase_6_risk_qualified=9,
+    phase_7_final_positions=5,
+    week_display="December 15, 2025",
+    market_regime="risk_on",
+    regime_confidence=0.72,
+    total_setups=5,
+    allocated_capital=640000.0,
+    allocated_pct=64.0,
+    total_risk_pct=5.5,
+    recommendations=[{"symbol": "RELIANCE", "final_conviction": 7.4}],
+    error=None,
+)
+
+
+class _CompletedHandle:
+    """Handle of a finished run; result() decodes like the real handle."""
+
+    def __init__(self, result_type):
+        self.result_type = result_type
+
+    async def describe(self):
+        return type("Description", (), {"status": WorkflowExecutionStatus.COMPLETED})()
+
+    async def result(self):
+        payloads = _DATA_CONVERTER.payload_converter.to_payloads([RESULT])
+        type_hints = [self.result_type] if self.result_type else None
+        return _DATA_CONVERTER.payload_converter.from_payloads(payloads, type_hints)[0]
+
+
+class _Client:
+    # The real typed lookup, which resolves the result type from the run method
+    get_workflow_handle_for = Client.get_workflow_handle_for
+
+    def get_workflow_handle(self, workflow_id, *, result_type=None, **kwargs):
+        return _CompletedHandle(result_type)
+
+
+def test_poll_completed_weekly_pipeline_returns_result_dict():
+    status = asyncio.run(poll_complete_weekly_pipeline("weekly-1", client=_Client()))
+
+    assert status["done"] is True
+    result = status["result"]
+    assert result["workflow_id"] == "weekly-1"
+    assert result["success"] is True
+    assert result["total_setups"] == 5
+    assert result["recommendations"] == [{"symbol": "RELIANCE", "final_conviction": 7.4}]
@@ -0,0 +1,50 @@
+import math
+
+import numpy as np
+import pytest
+from temporalio.converter import DataConverter
+
+from trade_analyzer.workers.client import _DATA_CONVERTER
+
+orjson = pytest.importorskip("orjson")
+
+DEFAULT = DataConverter.default.payload_converter
+ORJSON = _DATA_CONVERTER.payload_converter
+
+
+def _same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+
+VALUES = [
+    {"symbol": "RELIANCE", "close": np.float64(2450.35), "score": 71.4},
+    {"close": round(np.float64(12.3456), 2), "volume": np.int64(120000)},
+    {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")},
+    {"nan": np.float64("nan"), "items": [1, None, 2.5]},
+    {"big": 2**70, "neg": -(2**65)},
+    {"prices": np.array([1.5, 2.5]), "b": True, "none": None},
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_orjson_payload_decodes_with_default_converter(value):
+    payloads = ORJSON.to_payloads([value])
+    assert _same(DEFAULT.from_payloads(payloads)[0], ORJSON.from_payloads(payloads)[0])
+
+
+@pytest.mark.parametrize("value", [v for v in VALUES if "volume" not in v])
+def test_default_and_orjson_converters_roundtrip_identically(value):
+    expected = DEFAULT.from_payloads(DEFAULT.to_payloads([value]))[0]
+    assert _same(ORJSON.from_payloads(DEFAULT.to_payloads([value]))[0], expected)
+    assert _same(DEFAULT.from_payloads(ORJSON.to_payloads([value]))[0], expected)
+
+
+def test_numpy_integer_encodes_as_int():
+    payloads = ORJSON.to_payloads([{"volume": np.int64(120000)}])
+    assert DEFAULT.from_payloads(payloads)[0] == {"volume": 120000}
@@ -0,0 +1,116 @@
+import dataclasses
+import io
+import itertools
+
+import numpy as np
+import pytest
+
+from trade_analyzer.templates.trade_setup import (
+    _TEXT_TEMPLATE,
+    calculate_conviction,
+    calculate_conviction_batch,
+    generate_recommendation_card,
+    generate_recommendation_cards,
+    generate_text_template,
+    write_text_template,
+)
+
+
+def test_conviction_batch_matches_scalar_over_score_grid():
+    grid = np.array(list(itertools.product(range(0, 101, 10), repeat=5)), dtype=np.float64)
+    scores, labels = calculate_conviction_batch(grid)
+    for row, score, label in zip(grid.tolist(), scores.tolist(), labels.tolist()):
+        assert (score, label) == calculate_conviction(*row), row
+
+
+def test_conviction_batch_rounds_like_python_round():
+    scores, _ = calculate_conviction_batch(np.array([[0, 0, 10, 0, 0]]))
+    assert scores.tolist() == [calculate_conviction(0, 0, 10, 0, 0)[0]] == [0.1]
+
+
+def _random_position(rng):
+    price = round(float(rng.uniform(50, 5000)), 2)
+    position = {
+        "symbol": f"SYM{rng.integers(1000)}",
+        "sector": "Energy",
+        "momentum_score": round(float(rng.uniform(0, 100)), 1),
+        "consistency_score": int(rng.integers(0, 101)),
+        "liquidity_score": round(float(rng.uniform(0, 100)), 2),
+        "fundamental_score": float(rng.uniform(0, 100)),
+        "current_price": price,
+        "high_52w": round(price * float(rng.uniform(0.9, 1.6)), 2),
+        "entry_low": round(price * 0.98, 2),
+        "entry_high": price,
+        "final_stop": round(price * 0.93, 2),
+        "target_1": round(price * 1.1, 2),
+        "final_shares": int(rng.integers(1, 500)),
+        "rr_ratio": 2.5,
+    }
+    # Alternate keys, missing keys and explicit None for fields the card
+    # only displays
+    if rng.random() < 0.5:
+        position["overall_quality"] = int(rng.integers(0, 101))
+    else:
+        position["confidence"] = float(rng.uniform(0, 100))
+    if rng.random() < 0.3:
+        position["high_52w"] = 0
+    if rng.random() < 0.3:
+        del position["sector"]
+    if rng.random() < 0.3:
+        position["company_name"] = None
+    if rng.random() < 0.3:
+        position["sma_20"] = round(price * 0.97, 2)
+    return position
+
+
+def test_recommendation_cards_batch_matches_scalar():
+    rng = np.random.default_rng(7)
+    positions = [_random_position(rng) for _ in range(3000)]
+
+    cards = generate_recommendation_cards(positions, market_regime="choppy")
+    assert len(cards) == len(positions)
+    for position, card in zip(positions, cards):
+        expected = generate_recommendation_card(
+            position,
+            market_regime="choppy",
+            week_display=card.week_display,
+            generated_at=card.generated_at,
+        )
+        assert card == expected, position["symbol"]
+        assert generate_text_template(card) == generate_text_template(expected)
+
+
+def test_recommendation_cards_batch_rejects_what_scalar_rejects():
+    position = _random_position(np.random.default_rng(1))
+    position["momentum_score"] = None
+    with pytest.raises(TypeError):
+        generate_recommendation_card(position)
+    with pytest.raises(TypeError):
+        generate_recommendation_cards([position])
+
+
+def _reference_text(card):
+    """Render a card with plain str.format_map over the text template."""
+    return _TEXT_TEMPLATE.format_map(
+        {
+            **{f.name: getattr(card, f.name) for f in dataclasses.fields(card)},
+            "setup_type_upper": card.setup_type.upper(),
+            "market_regime_upper": card.market_regime.upper(),
+            "stop_method_upper": card.stop_method.upper(),
+            "action_block": "".join(f"  {step}\n" for step in card.action_steps),
+        }
+    )
+
+
+def test_text_writer_matches_template_format():
+    rng = np.random.default_rng(3)
+    labels = ("pullback", "breakout", "it's {odd} \\n 'quoted'")
+    for setup_type, regime, stop_method in itertools.product(labels, ("risk_on", "choppy"), labels):
+        position = {**_random_position(rng), "type": setup_type, "stop_method": stop_method}
+        card = generate_recommendation_card(position, market_regime=regime)
+        expected = _reference_text(card)
+        assert generate_text_template(card) == expected
+
+        out = io.StringIO()
+        write_text_template(card, out)
+        assert out.getvalue() == expected